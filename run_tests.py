@@ -3,7 +3,7 @@
 # requires-python = ">=3.10"
 # dependencies = [
 #     "requests",
-#     "beautifulsoup4",
+#     "lxml",
 #     "mutagen",
 #     "rich",
 #     "click",
@@ -19,13 +19,14 @@ import sys
 import unittest
 from pathlib import Path
 
-def run_tests(pattern='test*.py', verbosity=2):
+def run_tests(pattern='test*.py', verbosity=2, failfast=False):
     """
     Run tests matching the pattern.
     
     Args:
         pattern: File pattern to match test files (default: 'test*.py')
         verbosity: Test output verbosity (0=quiet, 1=normal, 2=verbose)
+        failfast: Stop at the first failure or error
     
     Returns:
         0 if all tests pass, 1 otherwise
@@ -33,12 +34,19 @@ def run_tests(pattern='test*.py', verbosity=2):
     # Get the tests directory
     tests_dir = Path(__file__).parent / 'tests'
     
-    # Discover and load tests
+    # Keep compiled test modules between runs so discovery only re-imports
+    # from bytecode, even when PYTHONDONTWRITEBYTECODE is set in the shell
+    sys.dont_write_bytecode = False
+    
+    # Discover and load tests, in definition order rather than sorted by name
     loader = unittest.TestLoader()
+    loader.sortTestMethodsUsing = None
     suite = loader.discover(str(tests_dir), pattern=pattern)
     
     # Run tests
-    runner = unittest.TextTestRunner(verbosity=verbosity)
+    # Ctrl-C finishes the running test and reports what ran so far
+    unittest.installHandler()
+    runner = unittest.TextTestRunner(verbosity=verbosity, failfast=failfast)
     result = runner.run(suite)
     
     # Print summary
@@ -85,6 +93,11 @@ def main():
         action='store_true',
         help='Quiet output (only summary)'
     )
+    parser.add_argument(
+        '--failfast', '-x',
+        action='store_true',
+        help='Stop on the first failure or error'
+    )
     
     args = parser.parse_args()
     
@@ -92,7 +105,7 @@ def main():
     verbosity = 2 if args.verbose else 0 if args.quiet else 1
     
     # Run tests
-    sys.exit(run_tests(pattern=args.pattern, verbosity=verbosity))
+    sys.exit(run_tests(pattern=args.pattern, verbosity=verbosity, failfast=args.failfast))
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
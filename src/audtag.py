@@ -3,7 +3,7 @@
 # requires-python = ">=3.10"
 # dependencies = [
 #     "requests",
-#     "beautifulsoup4",
+#     "lxml",
 #     "mutagen",
 #     "rich",
 #     "click",
@@ -12,30 +12,45 @@
 # ]
 # ///
 
+import base64
+import hashlib
+import io
+import mmap
+import operator
 import os
 import re
+import shutil
 import sys
+import threading
+import time
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
+from queue import Queue
 from typing import Dict, List, Optional, Tuple, Union
 from urllib.parse import quote_plus
 
 import click
 import inquirer
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from lxml import etree, html as lxml_html
 from mutagen import File
 from mutagen.easyid3 import EasyID3
 from mutagen.easymp4 import EasyMP4
 from mutagen.flac import FLAC, Picture
-from mutagen.id3 import ID3, APIC, COMM, TALB, TCOM, TCON, TDRC, TDRL, TIT1, TIT2, TPE1, TPE2, TPOS, TPUB, TRCK, TSOP, TXXX
+from mutagen.id3 import ID3, ID3NoHeaderError, APIC, COMM, TALB, TCOM, TCON, TDRC, TDRL, TIT1, TIT2, TPE1, TPE2, TPOS, TPUB, TRCK, TSOP, TXXX
 from mutagen.mp3 import MP3
-from mutagen.mp4 import MP4, MP4Cover
+from mutagen.mp4 import MP4, AtomDataType, MP4Cover, MP4FreeForm
 from mutagen.oggopus import OggOpus
 from mutagen.oggvorbis import OggVorbis
-from rich.console import Console
+from rich.console import Console, Group
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.table import Table
+from urllib3.util.retry import Retry
 
 # Import task system if available
 try:
@@ -44,17 +59,384 @@ try:
 except ImportError:
     TASK_SYSTEM_AVAILABLE = False
 
+# Pillow is optional; without it covers are embedded at their original size
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# mutagen-rs is an optional, faster drop-in for mutagen's File; it is only
+# used where tags are read for display and never written back
+try:
+    from mutagen_rs import File as ReadOnlyFile
+except ImportError:
+    ReadOnlyFile = None
+
 console = Console()
 
 # Global debug flag
 DEBUG = False
 
+# Patterns used while parsing Audible pages and building search queries,
+# compiled once at import instead of on every call.
+# "11 hrs and 41 mins", "2 hrs", "45 mins"; either part may be missing
+_RE_DURATION = re.compile(r'(?:(?P<hours>\d+)\s*hr\D*?)?(?:(?P<mins>\d+)\s*min|$)')
+_RE_YEAR = re.compile(r'(19\d{2}|20\d{2})')
+_RE_COPY_YEAR = re.compile(r'©(\d{4})')
+_RE_PUB = re.compile(r'\(P\)(\d{4})\s+(.+)')
+_RE_BOOK_NUM = re.compile(r'Book (\d+)')
+_RE_RATING = re.compile(r'([\d.]+)')
+# Size markers on the detail page's cover URL that can be raised to _SL5000_
+_RE_COVER_SIZE_MARKER = re.compile('|'.join(map(re.escape, (
+    '_SL175_', '_SL300_', '_SL500_', '_SS500_', '_SX500_', '_SL600_', '_SL800_',
+    '_SL1000_', '_SL1200_', '_SL1500_', '_SL2000_', '_SL2400_', '_SL3000_',
+))))
+_RE_INTRO_BY = re.compile(r'[;,]\s*(introduction|foreword|afterword|preface)\s+by.*', re.IGNORECASE)
+_RE_EDITION_SUFFIX = re.compile(r'(?:\s*\((?:un)?abridged\))+\s*$', re.IGNORECASE)
+_RE_QUERY_SUFFIX = re.compile(r'(?:\s*(?:\((?:un)?abridged\)|audiobook))+\s*$', re.IGNORECASE)
+_RE_NARRATED_BY = re.compile(r'Narrated By:\s*', re.IGNORECASE)
+# Where the narrator name ends in a meta description ("narrated by X. ...")
+_RE_NARRATOR_END = re.compile(r'\. |, | and | with ')
+_RE_WS = re.compile(r'\s+')
+_RE_CD_SUFFIX = re.compile(r'[- ]+cd ?\d+$', re.IGNORECASE)
+_RE_LEAD_NUM = re.compile(r'^\d+[-_\s\.]*')
+_RE_TRAIL_PART = re.compile(r'[-_](\d+|CD\d+|Part\d+|Chapter\d+)$', re.IGNORECASE)
+_RE_BY_SEP = re.compile(' by ', re.IGNORECASE)
+_RE_DIGITS = re.compile(r'(\d+)')
+_RE_AUDIO_EXT = re.compile(r'\.(mp3|m4b|m4a|aac|ogg|oga|opus|flac)$', re.IGNORECASE)
+_RE_GROUP_PART = re.compile(r'[-_\s]+(part|pt|ch|chapter|track|cd|disc)[-_\s]*\d*$', re.IGNORECASE)
+_RE_BASE_PART = re.compile(r'[-_\s]+(part|pt|ch|chapter|track|cd|disc)[-_\s]*[a-z0-9]*$', re.IGNORECASE)
+_RE_TRAIL_LETTER = re.compile(r'[-_\s]+[a-z]$', re.IGNORECASE)
+_RE_SEP_RUN = re.compile(r'[-_\s]+')
+_RE_TRACK_SUFFIX = re.compile(r'[-_\s]*(?:pt|part|chapter|ch|track|cd|disc)[-_\s]*\d+.*$', re.IGNORECASE)
+_RE_LEAD_TRACK_NUM = re.compile(r'^\d+[-_\s]*')
+_RE_LEAD_NUM_PUNCT = re.compile(r'^\d+[-_\s\.\)]*')
+_RE_TRAIL_NUM = re.compile(r'[-_\s]*\d+$')
+_RE_PART_WORD = re.compile(r'\b(?:pt|part|chapter|ch|track|cd|disc|disk|vol|volume)\b[-_\s]*\d*', re.IGNORECASE)
+_RE_WORD_NUM = re.compile(r'\b(\d+)\b')
+_RE_SPACE_RUN = re.compile(r'[\s_]+')
+
+# Track titles that are placeholders rather than real chapter names. The
+# common exact ones are caught by a set lookup before any regex runs.
+_GENERIC_TITLES = frozenset({'audiobook', 'chapter', 'untitled', 'unknown', 'track', 'book', 'audio'})
+_RE_GENERIC_TITLE = re.compile(
+    r'^(?:'
+    r'track\s*\d+$'            # Track 01, Track 1
+    r'|pt\d+$'                   # pt001, pt01
+    r'|part\s*\d+$'             # Part 1, part 01
+    r'|audio\s*track\s*\d+$'    # Audio Track 1
+    r'|untitled'                # Untitled, Untitled Track
+    r'|unknown'                 # Unknown, Unknown Track
+    r'|audiobook$'              # Generic "Audiobook"
+    r'|chapter$'                # Just "Chapter" without number
+    r')'
+)
+_RE_STEM_PART_NUM = re.compile(r'[\s_-]*(pt|part)?\d+$')
+
+# Words that suggest real chapter/section titles, matched anywhere in a title
+_TITLE_KEYWORDS = (
+    'chapter', 'prologue', 'epilogue', 'introduction', 'intro',
+    'preface', 'foreword', 'acknowledgment', 'appendix',
+    'credit', 'opening', 'closing', 'interlude', 'excerpt',
+    'author', 'narrator', 'publisher', 'copyright',
+    'dedication', 'contents', 'glossary', 'note', 'afterword',
+    'act', 'scene', 'section', 'verse'
+)
+_RE_TITLE_KEYWORD = re.compile('|'.join(map(re.escape, _TITLE_KEYWORDS)))
+# A title that is exactly one keyword only counts if another keyword is
+# inside it ("introduction" holds "intro")
+_BARE_TITLE_KEYWORDS = frozenset(
+    keyword for keyword in _TITLE_KEYWORDS
+    if not any(other != keyword and other in keyword for other in _TITLE_KEYWORDS)
+)
+
+# Underscores and dots stand in for spaces in file and folder names
+_SEP_TO_SPACE = str.maketrans('_.\t', '   ')
+# Characters not allowed in folder names on common filesystems
+_UNSAFE_PATH_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+
+def _natural_sort_key(path: Path) -> list:
+    """Sort key that orders digit runs numerically ("2" before "10")."""
+    # split() with a capturing group alternates text and digits, so the
+    # pieces at each index are always the same type across paths
+    return [int(part) if i % 2 else part for i, part in enumerate(_RE_DIGITS.split(str(path)))]
+
+
+def _strip_matches(pattern: re.Pattern, text: str, *anchors: str) -> str:
+    """Remove pattern's matches, skipping the regex when no anchor is in text.
+    
+    Every match must contain one of the lowercase anchors literally. Anchors
+    avoid i, s and k: IGNORECASE also matches those to ı, ſ and the Kelvin
+    sign, which lower() leaves alone.
+    """
+    lowered = text.lower()
+    if any(anchor in lowered for anchor in anchors):
+        return pattern.sub('', text)
+    return text
+
+
+def _similarity(text1: str, text2: str, floor: float = 0.0) -> float:
+    """SequenceMatcher ratio of two strings.
+    
+    When one of the matcher's cheap upper bounds already falls below floor,
+    that bound is returned instead of the exact ratio; it is just as far
+    below floor, so callers that compare against floor decide the same way.
+    """
+    matcher = SequenceMatcher(None, text1, text2)
+    bound = matcher.real_quick_ratio()
+    if bound >= floor:
+        bound = matcher.quick_ratio()
+        if bound >= floor:
+            return matcher.ratio()
+    return bound
+
+
+def _normalize_query(query: str) -> str:
+    """Collapse whitespace and drop stray "Narrated By:" labels from a query."""
+    return _strip_matches(_RE_NARRATED_BY, _RE_WS.sub(' ', query), 'narrated by:').strip()
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains name."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Selectors for the book detail page, compiled once so get_book_details
+# does each lookup in libxml2 instead of walking the tree from Python.
+_XP_COVER_IMG = etree.XPath(f"//img[{_has_class('bc-image-inset-border')}]")
+_XP_ASIN_INPUT = etree.XPath("//input[@name='asin']")
+_XP_H1_HEADING = etree.XPath(f"//h1[{_has_class('bc-heading')}]")
+_XP_H1_SLOT_TITLE = etree.XPath("//h1[@slot='title']")
+_XP_H1 = etree.XPath("//h1")
+_XP_H2 = etree.XPath("//h2")
+_XP_PAGE_TITLE = etree.XPath("//title")
+_XP_META_DESCRIPTION = etree.XPath("//meta[@name='description']")
+_XP_AUTHOR_LI = etree.XPath(f"//li[{_has_class('authorLabel')}]")
+_XP_NARRATOR_LI = etree.XPath(f"//li[{_has_class('narratorLabel')}]")
+_XP_SERIES_LI = etree.XPath(f"//li[{_has_class('seriesLabel')}]")
+_XP_CATEGORIES_LI = etree.XPath(f"//li[{_has_class('categoriesLabel')}]")
+_XP_RELEASE_LI = etree.XPath(f"//li[{_has_class('releaseDateLabel')}]")
+_XP_SUMMARY = etree.XPath(
+    f"(//div[{_has_class('productPublisherSummary')}])[1]//span[{_has_class('bc-text')}]"
+)
+_XP_COPYRIGHT = etree.XPath(f"//p[{_has_class('bc-text')}][contains(., '©')]")
+_XP_RATING = etree.XPath(
+    f"(//li[{_has_class('ratingsLabel')}])[1]//span[{_has_class('bc-text')}]"
+)
+_XP_LINKS = etree.XPath(".//a")
+
+# Selectors for the search results page. The per-result ones are relative
+# to a product <li> and each returns the first match in document order.
+_XP_PRODUCTS = etree.XPath(f"//li[{_has_class('productListItem')}]")
+_XP_PRODUCT_LIST_ITEMS = etree.XPath(
+    f"(//div[@data-widget='productList'])[1]//li[{_has_class('bc-list-item')}]"
+)
+_XP_RESULT_HEADING_LINK = etree.XPath(f"(.//h3[{_has_class('bc-heading')}])[1]//a")
+_XP_RESULT_HEADING = etree.XPath(f".//h3[{_has_class('bc-heading')}]")
+_XP_RESULT_LINK = etree.XPath(f".//a[{_has_class('bc-link')}]")
+# The labelled <li> fields of a result, fetched in one walk of its subtree
+_RESULT_LABEL_CLASSES = frozenset({
+    'subtitle', 'authorLabel', 'narratorLabel', 'runtimeLabel', 'releaseDateLabel',
+})
+_XP_RESULT_LABELS = etree.XPath(
+    ".//li[" + " or ".join(_has_class(name) for name in sorted(_RESULT_LABEL_CLASSES)) + "]"
+)
+
+
+# Byte markers for the start of the result list, used to skip the rest of the
+# page before parsing, and the charset declaration in the skipped head
+_RESULT_MARKERS = (b'productListItem', b'data-widget="productList"')
+_RE_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+# A © in a raw page: the byte ending it in UTF-8 and Latin-1, or an entity
+_RE_COPYRIGHT_SIGN = re.compile(rb'\xa9|&copy;|&#0*169;|&#x0*a9;', re.IGNORECASE)
+
+
+def _first_text(elems: list, default: str = '') -> str:
+    """Stripped text of the first element in an XPath result, or default."""
+    return elems[0].text_content().strip() if elems else default
+
+
+def _first_link_text(elems: list, default: str = '') -> str:
+    """Stripped text of the first link under the first element, or default."""
+    if not elems:
+        return default
+    links = _XP_LINKS(elems[0])
+    return links[0].text_content().strip() if links else default
+
+
+def _result_labels(product) -> Dict[str, list]:
+    """First <li> of each label class under a search result, keyed by class.
+    
+    Each value is a one-element list, the shape _first_text and
+    _first_link_text take; classes the result doesn't have are left out.
+    """
+    labels = {}
+    for li in _XP_RESULT_LABELS(product):
+        for name in li.get('class', '').split():
+            if name in _RESULT_LABEL_CLASSES and name not in labels:
+                labels[name] = [li]
+    return labels
+
+# Suffix families that share a tag layout
+_MP3_EXTS = frozenset({'.mp3'})
+_MP4_EXTS = frozenset({'.m4b', '.m4a', '.aac'})
+_VORBIS_EXTS = frozenset({'.ogg', '.oga', '.opus', '.flac'})
+
+# Buffer size for the file handles tags are written through
+_TAG_IO_BUFFER_SIZE = 1 << 20
+
+# Minimum slack left after a tag block. Keeping it (and never shrinking
+# existing padding) lets later re-tags rewrite the tag in place instead of
+# shifting the whole audio payload.
+_MIN_TAG_PADDING = 4096
+# ID3 TXXX frames written from metadata fields when they are set, as
+# (description, field)
+_ID3_OPTIONAL_TXXX = (('WWWAUDIOFILE', 'url'), ('ASIN', 'asin'), ('RATING WMP', 'rating'))
+
+
+def _tag_padding(info) -> int:
+    """mutagen padding callback: keep existing padding, reserve some if short."""
+    return max(_MIN_TAG_PADDING, info.padding)
+
+
+def _tag_snapshot(tags) -> Dict:
+    """Copy a tag container's contents so a retag can tell whether it changed.
+    
+    Values are wrapped in lists, the shape every format reads them back as,
+    so freshly assigned values compare equal to the ones loaded from disk.
+    """
+    if tags is None:
+        return {}
+    return {key: value if isinstance(value, list) else [value] for key, value in tags.items()}
+
+
+def _keys_by_ext(mp3_keys: Tuple, mp4_keys: Tuple, vorbis_keys: Tuple) -> Dict[str, Tuple]:
+    """Map every lowercase suffix of each tag layout to that layout's keys."""
+    table = {}
+    for exts, keys in ((_MP3_EXTS, mp3_keys), (_MP4_EXTS, mp4_keys), (_VORBIS_EXTS, vorbis_keys)):
+        table.update(dict.fromkeys(exts, keys))
+    return table
+
+
+# Tag keys holding (album, artist, album artist, title) in each layout
+_MP3_QUERY_KEYS = ('TALB', 'TPE1', 'TPE2', 'TIT2')
+_MP4_QUERY_KEYS = ('\xa9alb', '\xa9ART', 'aART', '\xa9nam')
+_VORBIS_QUERY_KEYS = ('album', 'artist', 'albumartist', 'title')
+_QUERY_KEYS_BY_EXT = _keys_by_ext(_MP3_QUERY_KEYS, _MP4_QUERY_KEYS, _VORBIS_QUERY_KEYS)
+_ALBUM_KEY_BY_EXT = {ext: keys[0] for ext, keys in _QUERY_KEYS_BY_EXT.items()}
+
+
+# Covers are embedded in every track, so larger ones are shrunk to this many
+# pixels a side first; the image file saved next to the audio is left alone
+_MAX_EMBEDDED_COVER_SIDE = 1000
+_EMBEDDED_COVER_QUALITY = 85
+
 
+def _shrink_cover(cover_data: Dict) -> Dict:
+    """Downscale a loaded cover for embedding, re-encoding it as JPEG.
+    
+    Returns cover_data unchanged without Pillow, when the image is already
+    small enough, or when it can't be decoded.
+    """
+    if not PIL_AVAILABLE:
+        return cover_data
+    try:
+        with Image.open(io.BytesIO(cover_data['data'])) as image:
+            if max(image.size) <= _MAX_EMBEDDED_COVER_SIDE:
+                return cover_data
+            image.thumbnail((_MAX_EMBEDDED_COVER_SIDE, _MAX_EMBEDDED_COVER_SIDE))
+            buffer = io.BytesIO()
+            image.convert('RGB').save(buffer, format='JPEG', quality=_EMBEDDED_COVER_QUALITY)
+    except Exception as e:
+        if DEBUG:
+            console.print(f"[dim]Debug: Embedding cover at original size: {e}[/dim]")
+        return cover_data
+    return dict(cover_data, data=buffer.getvalue(), mime='image/jpeg', format=MP4Cover.FORMAT_JPEG)
+
+
+def _first_tag_value(value) -> Optional[str]:
+    """First entry of a tag value (frame or list) as a string, or None if empty."""
+    return str(value[0]) if value else None
+
+
+def _mp4_text_atom(text: str) -> List[MP4FreeForm]:
+    """Value for a freeform iTunes atom holding UTF-8 text."""
+    return [MP4FreeForm(text.encode('utf-8'), AtomDataType.UTF8)]
+
+
+# Fields shown in the before/after table and the keys holding them per layout
+_BASIC_TAG_FIELDS = ('title', 'artist', 'album', 'composer', 'year')
+_MP3_BASIC_KEYS = ('TIT2', 'TPE1', 'TALB', 'TCOM', 'TDRC')
+_MP4_BASIC_KEYS = ('\xa9nam', '\xa9ART', '\xa9alb', '\xa9wrt', '\xa9day')
+_VORBIS_BASIC_KEYS = ('title', 'artist', 'album', 'composer', 'date')
+_BASIC_KEYS_BY_EXT = _keys_by_ext(_MP3_BASIC_KEYS, _MP4_BASIC_KEYS, _VORBIS_BASIC_KEYS)
+
+# (label, key) of the plain text fields the info command shows per layout
+_MP3_INFO_FIELDS = (
+    ('Title', 'TIT2'), ('Artist', 'TPE1'), ('Album', 'TALB'), ('Album Artist', 'TPE2'),
+    ('Composer (Narrator)', 'TCOM'), ('Genre', 'TCON'), ('Year', 'TDRC'),
+    ('Publisher', 'TPUB'), ('Track', 'TRCK'),
+)
+_MP4_INFO_FIELDS = (
+    ('Title', '\xa9nam'), ('Artist', '\xa9ART'), ('Album', '\xa9alb'), ('Album Artist', 'aART'),
+    ('Composer (Narrator)', '\xa9wrt'), ('Genre', '\xa9gen'), ('Year', '\xa9day'),
+    ('Publisher', '\xa9pub'),
+)
+_VORBIS_INFO_FIELDS = (
+    ('Title', 'title'), ('Artist', 'artist'), ('Album', 'album'), ('Album Artist', 'albumartist'),
+    ('Composer (Narrator)', 'composer'), ('Genre', 'genre'), ('Date', 'date'),
+    ('Publisher', 'publisher'),
+)
+_INFO_FIELDS_BY_EXT = _keys_by_ext(_MP3_INFO_FIELDS, _MP4_INFO_FIELDS, _VORBIS_INFO_FIELDS)
+# Custom ID3 TXXX descriptions shown by info
+_INFO_TXXX_FIELDS = ('ASIN', 'SERIES', 'SERIES-PART', 'ITUNESMEDIATYPE')
+# Fields that must match for info to show files as one group (Track and
+# Duration vary per file); missing ones count as ''
+_SIG_FIELDS = ('Title', 'Artist', 'Album', 'Album Artist', 'Composer (Narrator)',
+               'Genre', 'Year', 'Publisher', 'SERIES', 'ITUNESMEDIATYPE')
+_SIG_GETTER = operator.itemgetter(*_SIG_FIELDS)
+_EMPTY_SIG = dict.fromkeys(_SIG_FIELDS, '')
+
+
+def _current_basic_tags(file: Path) -> Dict[str, str]:
+    """Title, artist, album, composer and year currently tagged on a file.
+    
+    Parsed results are cached; a changed size or modification time (e.g.
+    after tagging) makes the next call parse the file again.
+    """
+    try:
+        stat = file.stat()
+    except OSError:
+        return dict.fromkeys(_BASIC_TAG_FIELDS, '')
+    return dict(_read_basic_tags(file, stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=4096)
+def _read_basic_tags(file: Path, mtime_ns: int, size: int) -> Tuple[Tuple[str, str], ...]:
+    """Parse the basic tags of one version of a file; see _current_basic_tags."""
+    values = dict.fromkeys(_BASIC_TAG_FIELDS, '')
+    keys = _BASIC_KEYS_BY_EXT.get(file.suffix.lower())
+    try:
+        audio = File(file)
+        if keys and audio and audio.tags:
+            for field, key in zip(_BASIC_TAG_FIELDS, keys):
+                values[field] = _first_tag_value(audio.tags.get(key)) or ''
+    except Exception:
+        pass
+    return tuple(values.items())
+
+
+@lru_cache(maxsize=1)
 def get_optimal_workers():
-    """Determine optimal number of workers based on CPU cores."""
+    """Determine optimal number of workers based on CPU cores.
+    
+    The CPU count doesn't change while we run, so it is worked out once.
+    """
     try:
-        # Get CPU count
-        cpu_count = os.cpu_count() or 4
+        # Get CPU count; on Python 3.13+ only the CPUs this process may run on
+        cpu_count = (getattr(os, 'process_cpu_count', None) or os.cpu_count)() or 4
         # For I/O bound tasks like file tagging, we can use more workers than CPU cores
         # But cap it at a reasonable number to avoid overwhelming the system
         optimal = min(cpu_count * 2, 16)
@@ -63,6 +445,22 @@ def get_optimal_workers():
         return 4  # Fallback to 4 if we can't determine CPU count
 
 
+# Tagging pools shared across update_tags calls, keyed by worker count, so
+# tagging several books in a row doesn't spin up and join a pool per book.
+_tag_executors: Dict[int, ThreadPoolExecutor] = {}
+_tag_executors_lock = threading.Lock()
+
+
+def _get_tag_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Return the shared tagging pool for a worker count, creating it on first use."""
+    with _tag_executors_lock:
+        executor = _tag_executors.get(max_workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='audtag-tag')
+            _tag_executors[max_workers] = executor
+        return executor
+
+
 class AudibleBlockedError(Exception):
     """Raised when Audible rejects our request (bot-detection / 5xx / non-HTML)."""
 
@@ -76,12 +474,29 @@ class AudibleScraper:
     # Markers that appear on Audible's soft-503 "Whoops" bot-detection page,
     # which sometimes comes back with a 200 status.
     _BLOCK_MARKERS = (
-        "<!-- 503 error at",
-        "crackedegg.jpg",
-        "Type the characters you see in this image",  # captcha wall
+        b"<!-- 503 error at",
+        b"crackedegg.jpg",
+        b"Type the characters you see in this image",  # captcha wall
     )
 
-    def __init__(self):
+    # Number of top search results whose detail pages are fetched in the
+    # background while the user is still choosing.
+    PREFETCH_COUNT = 3
+
+    # Upper bound on how much of a page is read. Search and detail pages are
+    # a few hundred KB; anything far beyond that is not a page we can parse.
+    MAX_PAGE_BYTES = 4_000_000
+
+    # Connections kept open per host: enough for the prefetch workers plus
+    # the foreground request, so none of them pays for a fresh TLS handshake.
+    POOL_SIZE = 16
+
+    # How long a page in the on-disk cache is reused before it's fetched again
+    PAGE_CACHE_TTL = 7 * 24 * 3600
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Create a scraper; pages are cached under cache_dir when it's given."""
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': (
@@ -98,154 +513,269 @@ class AudibleScraper:
             'Sec-Fetch-Site': 'none',
             'Sec-Fetch-User': '?1',
         })
+        # Transient failures are retried with backoff on the pooled
+        # connection. raise_on_status=False hands the last response back so
+        # _get still reports blocks and 5xx with its own messages.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=('GET', 'HEAD'),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.POOL_SIZE, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._prefetch_executor = None
+        self._prefetched = {}
+
+    def _get(self, url: str) -> bytes:
+        """HTTP GET with robust error detection. Raises AudibleBlockedError on block/5xx.
+
+        Returns the raw body bytes so lxml can pick up the page's declared
+        encoding itself instead of parsing a re-decoded str. The body is
+        streamed and truncated at MAX_PAGE_BYTES.
+        """
+        cached = self._cached_page(url)
+        if cached is not None:
+            return cached
 
-    def _get(self, url: str) -> str:
-        """HTTP GET with robust error detection. Raises AudibleBlockedError on block/5xx."""
         try:
-            response = self.session.get(url, timeout=30)
+            response = self.session.get(url, timeout=(5, 30), stream=True)
         except requests.RequestException as e:
             raise AudibleBlockedError(f"Network error reaching Audible: {e}") from e
 
-        if response.status_code >= 500:
-            raise AudibleBlockedError(
-                f"Audible returned HTTP {response.status_code} (likely bot-detection). "
-                f"Try again in a minute."
-            )
-        if response.status_code != 200:
-            raise AudibleBlockedError(
-                f"Audible returned HTTP {response.status_code} for {url}"
-            )
+        try:
+            if response.status_code >= 500:
+                raise AudibleBlockedError(
+                    f"Audible returned HTTP {response.status_code} (likely bot-detection). "
+                    f"Try again in a minute."
+                )
+            if response.status_code != 200:
+                raise AudibleBlockedError(
+                    f"Audible returned HTTP {response.status_code} for {url}"
+                )
+            body = self._read_body(response)
+        except requests.RequestException as e:
+            raise AudibleBlockedError(f"Network error reaching Audible: {e}") from e
+        finally:
+            response.close()
 
-        body = response.text
         for marker in self._BLOCK_MARKERS:
             if marker in body:
                 raise AudibleBlockedError(
                     "Audible served its bot-detection page (soft 503 / captcha). "
                     "Try again in a minute, or from a different network."
                 )
+        self._store_page(url, body)
         return body
 
+    def _page_cache_path(self, url: str) -> Optional[Path]:
+        """Where a page's body is cached, or None when caching is off."""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _cached_page(self, url: str) -> Optional[bytes]:
+        """A cached body for url younger than PAGE_CACHE_TTL, if there is one."""
+        path = self._page_cache_path(url)
+        if path is None:
+            return None
+        try:
+            if time.time() - path.stat().st_mtime > self.PAGE_CACHE_TTL:
+                return None
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def _store_page(self, url: str, body: bytes):
+        """Cache a page body that passed the block checks; failures are ignored."""
+        path = self._page_cache_path(url)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Written aside and renamed, so a reader never sees half a page
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(body)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def _read_body(self, response) -> bytes:
+        """Read a streamed response body, stopping at MAX_PAGE_BYTES."""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.MAX_PAGE_BYTES:
+                break
+        return b''.join(chunks)[:self.MAX_PAGE_BYTES]
+
+    def prefetch_details(self, urls: List[str]):
+        """Start fetching detail pages in the background.
+
+        Called with the top search results so the page for whichever book the
+        user picks is usually already downloaded by the time they confirm.
+        """
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=self.PREFETCH_COUNT, thread_name_prefix='audtag-prefetch'
+            )
+        for url in urls[:self.PREFETCH_COUNT]:
+            if url and url not in self._prefetched:
+                self._prefetched[url] = self._prefetch_executor.submit(self._get, url)
+
+    def get_book_details_batch(self, urls: List[str]) -> List[Dict]:
+        """Fetch detailed metadata for several books, in the order given.
+
+        The pages download concurrently over the pooled session; parsing
+        then runs in order as each book's page is taken from the queue.
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(self.POOL_SIZE, len(urls))),
+                                thread_name_prefix='audtag-details') as executor:
+            for url in urls:
+                if url not in self._prefetched:
+                    self._prefetched[url] = executor.submit(self._get, url)
+            return [self.get_book_details(url) for url in urls]
+
+    def _get_page(self, url: str) -> bytes:
+        """Return a page body, reusing a prefetched download when one exists."""
+        future = self._prefetched.pop(url, None)
+        if future is not None:
+            try:
+                return future.result()
+            except AudibleBlockedError:
+                # Background fetch failed - retry in the foreground below
+                pass
+        return self._get(url)
+
     def search(self, query: str) -> List[Dict]:
         """Search Audible for books matching the query."""
         url = f"{self.SEARCH_URL}{quote_plus(query)}"
         console.print(f"[cyan]Searching Audible for: {query}[/cyan]")
 
+        # Prefetches from a previous search are for books we won't pick now
+        self._prefetched.clear()
+
         body = self._get(url)
-        soup = BeautifulSoup(body, 'html.parser')
+        try:
+            tree = self._parse_results_region(body)
+        except etree.ParserError:
+            return []
 
-        results = []
         # Find all product containers
-        products = soup.find_all('li', class_='productListItem')
-
+        products = _XP_PRODUCTS(tree)
         if not products:
             # Try alternative structure
-            products = soup.find_all('div', {'data-widget': 'productList'})
-            if products:
-                products = products[0].find_all('li', class_='bc-list-item')
-
-        for product in products[:20]:  # Limit to 20 results
-            try:
-                result = self._parse_search_result(product)
-                if result:
-                    results.append(result)
-            except Exception as e:
-                console.print(f"[yellow]Warning: Failed to parse result: {e}[/yellow]")
+            products = _XP_PRODUCT_LIST_ITEMS(tree)
+        products = products[:20]  # Limit to 20 results
+
+        # Extract column by column rather than result by result; products
+        # without a usable title link are dropped before the other columns
+        # are read.
+        links = [self._result_link(product) for product in products]
+        titles = [link.text_content().strip() if link is not None else '' for link in links]
+        keep = [i for i, title in enumerate(titles) if title]
+        products = [products[i] for i in keep]
+        titles = [titles[i] for i in keep]
+        urls = [
+            self.BASE_URL + links[i].get('href', '').split('?')[0] + '?ipRedirectOverride=true&overrideBaseCountry=true'
+            for i in keep
+        ]
+        labels = [_result_labels(p) for p in products]
+        subtitles = [_first_text(l.get('subtitle')) for l in labels]
+        authors = [_first_link_text(l.get('authorLabel'), 'Unknown') for l in labels]
+        narrators = [_first_link_text(l.get('narratorLabel')) for l in labels]
+        durations = [self._parse_duration(_first_text(l.get('runtimeLabel'))) for l in labels]
+        years = [self._parse_release_year(_first_text(l.get('releaseDateLabel'))) for l in labels]
+
+        return [
+            {
+                'title': title,
+                'url': url,
+                'subtitle': subtitle,
+                'author': author,
+                'narrator': narrator,
+                'duration': duration,
+                'year': year,
+            }
+            for title, url, subtitle, author, narrator, duration, year
+            in zip(titles, urls, subtitles, authors, narrators, durations, years)
+        ]
 
-        return results
-    
-    def _parse_search_result(self, product) -> Optional[Dict]:
-        """Parse a single search result."""
-        result = {}
-        
-        # Title and URL
-        title_elem = product.find('h3', class_='bc-heading') or product.find('a', class_='bc-link')
-        if not title_elem:
-            return None
+    @staticmethod
+    def _parse_results_region(body: bytes):
+        """Parse only the part of a search page that holds the result list.
         
-        if title_elem.name == 'h3':
-            link = title_elem.find('a')
-            if link:
-                result['title'] = link.text.strip()
-                result['url'] = self.BASE_URL + link.get('href', '').split('?')[0] + '?ipRedirectOverride=true&overrideBaseCountry=true'
-        else:
-            result['title'] = title_elem.text.strip()
-            result['url'] = self.BASE_URL + title_elem.get('href', '').split('?')[0] + '?ipRedirectOverride=true&overrideBaseCountry=true'
-        
-        # Subtitle
-        subtitle = product.find('li', class_='subtitle')
-        if subtitle:
-            result['subtitle'] = subtitle.text.strip()
-        else:
-            result['subtitle'] = ''
-        
-        # Author
-        author_elem = product.find('li', class_='authorLabel')
-        if author_elem:
-            author_link = author_elem.find('a')
-            result['author'] = author_link.text.strip() if author_link else 'Unknown'
-        else:
-            result['author'] = 'Unknown'
-        
-        # Narrator
-        narrator_elem = product.find('li', class_='narratorLabel')
-        if narrator_elem:
-            narrator_link = narrator_elem.find('a')
-            result['narrator'] = narrator_link.text.strip() if narrator_link else ''
-        else:
-            result['narrator'] = ''
-        
-        # Duration - compress format from "11 hrs and 41 mins" to "11:41:00"
-        runtime = product.find('li', class_='runtimeLabel')
-        if runtime:
-            duration_text = runtime.text.replace('Length:', '').strip()
-            # Parse "X hrs and Y mins" format
-            import re
-            hours_match = re.search(r'(\d+)\s*hr', duration_text)
-            mins_match = re.search(r'(\d+)\s*min', duration_text)
-            
-            hours = int(hours_match.group(1)) if hours_match else 0
-            mins = int(mins_match.group(1)) if mins_match else 0
-            
-            # Format as HH:MM:SS
-            result['duration'] = f"{hours:02d}:{mins:02d}:00"
-        else:
-            result['duration'] = ''
-        
-        # Release date/year - extract year from MM-DD-YYYY format
-        release_elem = product.find('li', class_='releaseDateLabel')
-        if release_elem:
-            release_text = release_elem.text.replace('Release date:', '').strip()
-            # Try to extract just the year from various formats
-            import re
-            # Match patterns like MM-DD-YY or MM-DD-YYYY
-            if '-' in release_text:
-                parts = release_text.split('-')
-                if len(parts) >= 3:
-                    # Last part should be the year
-                    year_part = parts[-1].strip()
-                    # Handle 2-digit year (e.g., 24 -> 2024)
-                    if len(year_part) == 2 and year_part.isdigit():
-                        year_num = int(year_part)
-                        if year_num < 50:
-                            result['year'] = f"20{year_part}"
-                        else:
-                            result['year'] = f"19{year_part}"
-                    elif len(year_part) == 4 and year_part.isdigit():
-                        result['year'] = year_part
-                    else:
-                        # Try regex as fallback
-                        year_match = re.search(r'(19\d{2}|20\d{2})', release_text)
-                        result['year'] = year_match.group() if year_match else ''
-                else:
-                    result['year'] = ''
-            else:
-                # Try to find a 4-digit year
-                year_match = re.search(r'(19\d{2}|20\d{2})', release_text)
-                result['year'] = year_match.group() if year_match else ''
+        Everything before the first result (head, inline scripts, navigation)
+        is cut off with a plain bytes search; libxml2 recovers from the tags
+        that are left unclosed. The page's declared charset is passed on
+        explicitly since the <meta> that declares it is cut off with the head.
+        """
+        for marker in _RESULT_MARKERS:
+            pos = body.find(marker)
+            if pos >= 0:
+                start = body.rfind(b'<', 0, pos)
+                if start > 0:
+                    charset = _RE_CHARSET.search(body, 0, start)
+                    encoding = charset.group(1).decode('ascii') if charset else 'utf-8'
+                    try:
+                        parser = lxml_html.HTMLParser(encoding=encoding)
+                    except LookupError:
+                        break  # Unknown charset - let libxml2 parse the whole page
+                    return lxml_html.document_fromstring(body[start:], parser=parser)
+                break
+        return lxml_html.document_fromstring(body)
+    
+    @staticmethod
+    def _result_link(product):
+        """Return the title link of a search result, or None."""
+        # The bc-heading <h3> wins when present, even if it has no link
+        if _XP_RESULT_HEADING(product):
+            links = _XP_RESULT_HEADING_LINK(product)
         else:
-            result['year'] = ''
-        
-        return result if result.get('title') else None
+            links = _XP_RESULT_LINK(product)
+        return links[0] if links else None
+
+    @staticmethod
+    def _parse_duration(runtime_text: str) -> str:
+        """Compress "11 hrs and 41 mins" to "11:41:00"; '' when absent."""
+        if not runtime_text:
+            return ''
+        # Parse "X hrs and Y mins" format in one scan; the "Length:" label
+        # can't match, so there is no need to strip it first. The pattern
+        # always matches (at worst the empty string at the end).
+        match = _RE_DURATION.search(runtime_text)
+        hours = int(match['hours'] or 0)
+        mins = int(match['mins'] or 0)
+        
+        # Format as HH:MM:SS
+        return f"{hours:02d}:{mins:02d}:00"
+
+    @staticmethod
+    def _parse_release_year(release_text: str) -> str:
+        """Extract the year from a search result's release date."""
+        release_text = release_text.replace('Release date:', '').strip()
+        if not release_text:
+            return ''
+        # Try to extract just the year from various formats
+        # Match patterns like MM-DD-YY or MM-DD-YYYY
+        if '-' in release_text:
+            parts = release_text.split('-')
+            if len(parts) < 3:
+                return ''
+            # Last part should be the year
+            year_part = parts[-1].strip()
+            # Handle 2-digit year (e.g., 24 -> 2024)
+            if len(year_part) == 2 and year_part.isdigit():
+                return f"20{year_part}" if int(year_part) < 50 else f"19{year_part}"
+            if len(year_part) == 4 and year_part.isdigit():
+                return year_part
+        # Try to find a 4-digit year
+        year_match = _RE_YEAR.search(release_text)
+        return year_match.group() if year_match else ''
     
     def get_book_details(self, url: str) -> Dict:
         """Fetch detailed metadata for a specific book."""
@@ -254,45 +784,44 @@ class AudibleScraper:
         else:
             console.print(f"[cyan]Fetching book details...[/cyan]")
 
-        body = self._get(url)
-        soup = BeautifulSoup(body, 'html.parser')
+        body = self._get_page(url)
+        try:
+            tree = lxml_html.document_fromstring(body)
+        except etree.ParserError:
+            # Empty or unparseable page - nothing to extract
+            tree = lxml_html.document_fromstring('<html></html>')
         
         details = {'url': url}
         
         # Cover image
-        image_elem = soup.find('img', class_='bc-image-inset-border')
-        if image_elem:
-            cover_url = image_elem.get('src', '')
+        image_elems = _XP_COVER_IMG(tree)
+        if image_elems:
+            cover_url = image_elems[0].get('src', '')
             # Upgrade to highest resolution available
             # Try multiple size replacements to get the best quality
             # Amazon/Audible supports up to _SL5000_ for some images
-            for size_marker in ['_SL175_', '_SL300_', '_SL500_', '_SS500_', '_SX500_', '_SL600_', '_SL800_', '_SL1000_', '_SL1200_', '_SL1500_', '_SL2000_', '_SL2400_', '_SL3000_']:
-                if size_marker in cover_url:
-                    # Try highest quality first (5000px)
-                    cover_url = cover_url.replace(size_marker, '_SL5000_')
-                    break
-            else:
-                # If no known size marker found, try appending size parameter
-                if '._' not in cover_url:
-                    # Add size parameter before file extension
-                    parts = cover_url.rsplit('.', 1)
-                    if len(parts) == 2:
-                        cover_url = f"{parts[0]}._SL5000_.{parts[1]}"
+            cover_url, upgraded = _RE_COVER_SIZE_MARKER.subn('_SL5000_', cover_url)
+            # If no known size marker found, try appending size parameter
+            if not upgraded and '._' not in cover_url:
+                # Add size parameter before file extension
+                parts = cover_url.rsplit('.', 1)
+                if len(parts) == 2:
+                    cover_url = f"{parts[0]}._SL5000_.{parts[1]}"
             
             details['cover_url'] = cover_url
             if DEBUG:
                 console.print(f"[dim]Debug: Cover URL: {cover_url}[/dim]")
         
         # ASIN
-        asin_input = soup.find('input', {'name': 'asin'})
-        if asin_input:
-            details['asin'] = asin_input.get('value', '')
+        asin_inputs = _XP_ASIN_INPUT(tree)
+        if asin_inputs:
+            details['asin'] = asin_inputs[0].get('value', '')
         
         # Title and subtitle - try multiple methods
         # Method 1: Try h1 with bc-heading class (old structure)
-        title_elem = soup.find('h1', class_='bc-heading')
-        if title_elem:
-            title_text = title_elem.text.strip()
+        title_elems = _XP_H1_HEADING(tree)
+        if title_elems:
+            title_text = title_elems[0].text_content().strip()
             if DEBUG:
                 console.print(f"[dim]Debug: Raw title from bc-heading: '{title_text}'[/dim]")
             if ':' in title_text:
@@ -304,21 +833,21 @@ class AudibleScraper:
                 details['subtitle'] = ''
         else:
             # Method 2: Try h1 with slot="title" (new structure)
-            title_elem = soup.find('h1', attrs={'slot': 'title'})
-            if not title_elem:
+            title_elems = _XP_H1_SLOT_TITLE(tree)
+            if not title_elems:
                 # Method 3: Try any h1
-                title_elem = soup.find('h1')
+                title_elems = _XP_H1(tree)
             
-            if title_elem:
-                details['title'] = title_elem.text.strip()
+            if title_elems:
+                details['title'] = title_elems[0].text_content().strip()
                 if DEBUG:
                     console.print(f"[dim]Debug: Found title from h1: '{details['title']}'[/dim]")
                 
                 # Look for subtitle in next h2
-                subtitle_elem = soup.find('h2')
-                if subtitle_elem and 'bc-heading' not in subtitle_elem.get('class', []):
+                subtitle_elems = _XP_H2(tree)
+                if subtitle_elems and 'bc-heading' not in subtitle_elems[0].get('class', '').split():
                     # Make sure it's not an error message h2
-                    subtitle_text = subtitle_elem.text.strip()
+                    subtitle_text = subtitle_elems[0].text_content().strip()
                     if subtitle_text and 'failed' not in subtitle_text.lower():
                         details['subtitle'] = subtitle_text
                         if DEBUG:
@@ -335,20 +864,19 @@ class AudibleScraper:
             console.print(f"[dim]Debug: Parsed title: '{details.get('title', '')}', subtitle: '{details.get('subtitle', '')}'[/dim]")
         
         # Author - try multiple methods
-        author_elem = soup.find('li', class_='authorLabel')
-        if author_elem:
-            authors = []
-            for link in author_elem.find_all('a'):
-                authors.append(link.text.strip())
+        author_elems = _XP_AUTHOR_LI(tree)
+        if author_elems:
+            authors = [link.text_content().strip() for link in _XP_LINKS(author_elems[0])]
             details['author'] = ', '.join(authors)
             if DEBUG:
                 console.print(f"[dim]Debug: Found author(s) from li: {details['author']}[/dim]")
         else:
             # Try finding author from meta tags or title
-            title_elem = soup.find('title')
-            if title_elem and ' by ' in title_elem.text:
+            page_titles = _XP_PAGE_TITLE(tree)
+            page_title = page_titles[0].text_content() if page_titles else ''
+            if ' by ' in page_title:
                 # Format is usually "Book Title Audiobook by Author Name"
-                author_part = title_elem.text.split(' by ')[-1].strip()
+                author_part = page_title.split(' by ')[-1].strip()
                 details['author'] = author_part
                 if DEBUG:
                     console.print(f"[dim]Debug: Found author from title: {details['author']}[/dim]")
@@ -356,19 +884,17 @@ class AudibleScraper:
                 console.print("[dim]Debug: No author found[/dim]")
         
         # Narrator - try multiple methods
-        narrator_elem = soup.find('li', class_='narratorLabel')
-        if narrator_elem:
-            narrators = []
-            for link in narrator_elem.find_all('a'):
-                narrators.append(link.text.strip())
+        narrator_elems = _XP_NARRATOR_LI(tree)
+        if narrator_elems:
+            narrators = [link.text_content().strip() for link in _XP_LINKS(narrator_elems[0])]
             details['narrator'] = ', '.join(narrators)
             if DEBUG:
                 console.print(f"[dim]Debug: Found narrator(s) from li: {details['narrator']}[/dim]")
         else:
             # Try finding from meta description
-            meta_desc = soup.find('meta', {'name': 'description'})
-            if meta_desc:
-                content = meta_desc.get('content', '')
+            meta_descs = _XP_META_DESCRIPTION(tree)
+            if meta_descs:
+                content = meta_descs[0].get('content', '')
                 if 'narrated by' in content.lower():
                     # Format is usually "Audiobook by Author, narrated by Narrator. ..."
                     # Don't lowercase before splitting to preserve case
@@ -380,13 +906,8 @@ class AudibleScraper:
                         # Extract narrator, looking for period or comma as delimiter
                         narrator_text = parts[1].strip()
                         # Find the end of the narrator name (usually ends with period or comma)
-                        end_markers = ['. ', ', ', ' and ', ' with ']
-                        end_pos = len(narrator_text)
-                        for marker in end_markers:
-                            pos = narrator_text.find(marker)
-                            if pos > 0 and pos < end_pos:
-                                end_pos = pos
-                        narrator_part = narrator_text[:end_pos].strip()
+                        end = _RE_NARRATOR_END.search(narrator_text, 1)
+                        narrator_part = narrator_text[:end.start() if end else len(narrator_text)].strip()
                         details['narrator'] = narrator_part
                         if DEBUG:
                             console.print(f"[dim]Debug: Found narrator from meta: {details['narrator']}[/dim]")
@@ -399,7 +920,7 @@ class AudibleScraper:
         if details.get('narrator'):
             narrator = details['narrator']
             # Remove introduction/foreword by patterns
-            narrator = re.sub(r'[;,]\s*(introduction|foreword|afterword|preface)\s+by.*', '', narrator, flags=re.IGNORECASE)
+            narrator = _strip_matches(_RE_INTRO_BY, narrator, 'by')
             # If there are multiple narrators separated by comma, take only the first
             if ',' in narrator and 'introduction' not in narrator.lower():
                 narrator = narrator.split(',')[0].strip()
@@ -408,68 +929,63 @@ class AudibleScraper:
                 console.print(f"[dim]Debug: Cleaned narrator to: {details['narrator']}[/dim]")
         
         # Series
-        series_elem = soup.find('li', class_='seriesLabel')
-        if series_elem:
-            series_link = series_elem.find('a')
-            if series_link:
-                details['series'] = series_link.text.strip()
+        series_elems = _XP_SERIES_LI(tree)
+        if series_elems:
+            series_links = _XP_LINKS(series_elems[0])
+            if series_links:
+                details['series'] = series_links[0].text_content().strip()
                 # Try to extract book number
-                series_text = series_elem.text
-                match = re.search(r'Book (\d+)', series_text)
+                series_text = series_elems[0].text_content()
+                match = _RE_BOOK_NUM.search(series_text)
                 if match:
                     details['series_part'] = match.group(1)
         
         # Categories/Genres
-        categories_elem = soup.find('li', class_='categoriesLabel')
-        if categories_elem:
-            categories = []
-            for link in categories_elem.find_all('a'):
-                categories.append(link.text.strip())
+        categories_elems = _XP_CATEGORIES_LI(tree)
+        if categories_elems:
+            categories = [link.text_content().strip() for link in _XP_LINKS(categories_elems[0])]
             details['genre'] = '/'.join(categories[:2])  # Max 2 genres
         
         # Publisher's Summary
-        summary_section = soup.find('div', class_='productPublisherSummary')
-        if summary_section:
-            summary_elem = summary_section.find('span', class_='bc-text')
-            if summary_elem:
-                details['description'] = summary_elem.text.strip()
-        
-        # Publisher and copyright
-        copyright_elem = soup.find('p', class_='bc-text', string=re.compile(r'©'))
-        if copyright_elem:
-            copyright_text = copyright_elem.text.strip()
+        summary_elems = _XP_SUMMARY(tree)
+        if summary_elems:
+            details['description'] = summary_elems[0].text_content().strip()
+        
+        # Publisher and copyright; pages without a © anywhere in the raw
+        # bytes skip the paragraph scan
+        copyright_elems = _XP_COPYRIGHT(tree) if _RE_COPYRIGHT_SIGN.search(body) else []
+        if copyright_elems:
+            copyright_text = copyright_elems[0].text_content().strip()
             # Extract year
-            year_match = re.search(r'©(\d{4})', copyright_text)
+            year_match = _RE_COPY_YEAR.search(copyright_text)
             if year_match:
                 details['year'] = year_match.group(1)
             # Extract publisher
-            pub_match = re.search(r'\(P\)(\d{4})\s+(.+)', copyright_text)
+            pub_match = _RE_PUB.search(copyright_text)
             if pub_match:
                 details['release_year'] = pub_match.group(1)
                 details['publisher'] = pub_match.group(2).strip()
         
         # Also try to get release date/year from detail page (as fallback)
         if not details.get('year'):
-            release_elem = soup.find('li', class_='releaseDateLabel')
-            if release_elem:
-                release_text = release_elem.text.replace('Release date:', '').strip()
+            release_elems = _XP_RELEASE_LI(tree)
+            if release_elems:
+                release_text = release_elems[0].text_content().replace('Release date:', '').strip()
                 # Extract year from various date formats
-                year_match = re.search(r'(19\d{2}|20\d{2})', release_text)
+                year_match = _RE_YEAR.search(release_text)
                 if year_match:
                     details['year'] = year_match.group(1)
                     if DEBUG:
                         console.print(f"[dim]Debug: Extracted year {details['year']} from release date[/dim]")
         
         # Rating
-        rating_elem = soup.find('li', class_='ratingsLabel')
-        if rating_elem:
-            stars_elem = rating_elem.find('span', class_='bc-text')
-            if stars_elem:
-                rating_text = stars_elem.text.strip()
-                # Extract numeric rating
-                match = re.search(r'([\d.]+)', rating_text)
-                if match:
-                    details['rating'] = match.group(1)
+        stars_elems = _XP_RATING(tree)
+        if stars_elems:
+            rating_text = stars_elems[0].text_content().strip()
+            # Extract numeric rating
+            match = _RE_RATING.search(rating_text)
+            if match:
+                details['rating'] = match.group(1)
         
         if DEBUG:
             console.print("[dim]Debug: Metadata collected:[/dim]")
@@ -484,12 +1000,28 @@ class AudiobookTagger:
     """Updates audio files with audiobook metadata."""
     
     # Supported formats
-    SUPPORTED_FORMATS = {'.mp3', '.m4b', '.m4a', '.ogg', '.oga', '.opus', '.flac', '.wma', '.aac'}
+    SUPPORTED_FORMATS = frozenset({'.mp3', '.m4b', '.m4a', '.ogg', '.oga', '.opus', '.flac', '.wma', '.aac'})
     
-    def __init__(self, files: List[Path]):
-        self.files = sorted(files)
+    def __init__(self, files: List[Path], assume_sorted: bool = False):
+        # Natural order, so "Track 2" comes before "Track 10" and track
+        # numbers follow the listening order
+        self.files = list(files) if assume_sorted else sorted(files, key=_natural_sort_key)
+        # Lowercase suffix of each file, parallel to self.files
+        self.exts = [f.suffix.lower() for f in self.files]
         # Group files by format
-        self.formats = set(f.suffix.lower() for f in self.files)
+        self.formats = set(self.exts)
+        # Format-specific writers keyed by lowercase suffix; anything else
+        # goes through the generic mutagen handler
+        self._writers = {
+            '.mp3': self._update_mp3,
+            '.m4b': self._update_mp4,
+            '.m4a': self._update_mp4,
+            '.aac': self._update_mp4,
+            '.ogg': self._update_ogg,
+            '.oga': self._update_ogg,
+            '.opus': self._update_ogg,
+            '.flac': self._update_flac,
+        }
     
     def _is_meaningful_title(self, title: str, filename: str = "") -> bool:
         """
@@ -503,58 +1035,30 @@ class AudiobookTagger:
         
         title_lower = title.lower().strip()
         
-        # Generic patterns that suggest auto-generated titles
-        generic_patterns = [
-            r'^track\s*\d+$',           # Track 01, Track 1
-            r'^pt\d+$',                  # pt001, pt01
-            r'^part\s*\d+$',             # Part 1, part 01
-            r'^audio\s*track\s*\d+$',   # Audio Track 1
-            r'^untitled',               # Untitled, Untitled Track
-            r'^unknown',                # Unknown, Unknown Track
-            r'^audiobook$',             # Generic "Audiobook"
-            r'^chapter$',               # Just "Chapter" without number
-        ]
-        
-        # Check if title matches any generic pattern
-        import re
+        if title_lower in _GENERIC_TITLES:
+            return False
         
         # Special case: Year-based titles (1984, 2001, etc.) are meaningful for certain books
-        # Don't treat 4-digit years as generic
-        if re.match(r'^(19|20)\d{2}$', title_lower):
-            # It's a year from 1900-2099, consider it meaningful
-            return True
+        # Don't treat 4-digit years as generic, only other pure numbers
+        if title_lower.isdecimal():
+            # A year from 1900-2099 is meaningful
+            return len(title_lower) == 4 and title_lower[:2] in ('19', '20')
         
-        # Only treat pure numbers as generic if they're not years
-        if re.match(r'^\d+$', title_lower):
+        # Placeholder names are generic
+        if _RE_GENERIC_TITLE.match(title_lower):
             return False
-        for pattern in generic_patterns:
-            if re.match(pattern, title_lower):
-                return False
         
         # Check if title is same as filename stem (suggests no real metadata)
         if filename:
             filename_stem = Path(filename).stem.lower()
             # Remove common suffixes from filename for comparison
-            filename_stem = re.sub(r'[\s_-]*(pt|part)?\d+$', '', filename_stem)
+            filename_stem = _RE_STEM_PART_NUM.sub('', filename_stem)
             if title_lower == filename_stem:
                 return False
         
-        # Meaningful patterns that suggest real chapter/section titles
-        meaningful_keywords = [
-            'chapter', 'prologue', 'epilogue', 'introduction', 'intro',
-            'preface', 'foreword', 'acknowledgment', 'appendix',
-            'credit', 'opening', 'closing', 'interlude', 'excerpt',
-            'author', 'narrator', 'publisher', 'copyright',
-            'dedication', 'contents', 'glossary', 'note', 'afterword',
-            'act', 'scene', 'section', 'verse'
-        ]
-        
-        # Check if title contains meaningful keywords
-        for keyword in meaningful_keywords:
-            if keyword in title_lower:
-                # But make sure it's not JUST the keyword
-                if title_lower != keyword:
-                    return True
+        # Check if title contains meaningful keywords, but isn't JUST the keyword
+        if title_lower not in _BARE_TITLE_KEYWORDS and _RE_TITLE_KEYWORD.search(title_lower):
+            return True
         
         # If title has more than 3 words, it's probably meaningful
         if len(title.split()) > 3:
@@ -567,100 +1071,104 @@ class AudiobookTagger:
         # Default: if we're not sure, preserve it
         return len(title) > 10  # Arbitrary length suggesting real content
     
-    def get_initial_search_query(self) -> str:
-        """Extract initial search query from existing tags or filename."""
-        queries = []
-        
-        if DEBUG:
-            console.print(f"[dim]Debug: Analyzing {self.files[0].name}[/dim]")
+    def _read_tags(self, file: Path, ext: str):
+        """Load only a file's tags, skipping audio parsing where mutagen allows.
         
-        # First try to get metadata from file tags
-        for file in self.files:
+        MP3 goes straight to the leading ID3 block instead of letting MP3()
+        scan for the first audio frame. Returns None when there are no tags.
+        """
+        if ext in _MP3_EXTS:
             try:
-                audio = File(file)
-                if not audio:
-                    continue
-                
-                # Collect all possible metadata
-                album = None
-                artist = None
-                title = None
-                albumartist = None
-                
-                if hasattr(audio, 'tags') and audio.tags:
-                    # Try different tag formats based on file type
-                    if file.suffix.lower() in ['.mp3']:
-                        album = str(audio.tags.get('TALB', [''])[0]) if audio.tags.get('TALB') else None
-                        artist = str(audio.tags.get('TPE1', [''])[0]) if audio.tags.get('TPE1') else None
-                        albumartist = str(audio.tags.get('TPE2', [''])[0]) if audio.tags.get('TPE2') else None
-                        title = str(audio.tags.get('TIT2', [''])[0]) if audio.tags.get('TIT2') else None
-                    elif file.suffix.lower() in ['.m4b', '.m4a', '.aac']:
-                        # M4B tags are stored differently
-                        album = audio.tags.get('\xa9alb', [None])[0] if '\xa9alb' in audio.tags else None
-                        artist = audio.tags.get('\xa9ART', [None])[0] if '\xa9ART' in audio.tags else None
-                        albumartist = audio.tags.get('aART', [None])[0] if 'aART' in audio.tags else None
-                        title = audio.tags.get('\xa9nam', [None])[0] if '\xa9nam' in audio.tags else None
-                        
-                        if DEBUG:
-                            console.print(f"[dim]Debug M4B tags - Album: {album}, Artist: {artist}, AlbumArtist: {albumartist}, Title: {title}[/dim]")
-                        
-                    elif file.suffix.lower() in ['.ogg', '.oga', '.opus', '.flac']:
-                        album = audio.tags.get('album', [None])[0] if 'album' in audio.tags else None
-                        artist = audio.tags.get('artist', [None])[0] if 'artist' in audio.tags else None
-                        albumartist = audio.tags.get('albumartist', [None])[0] if 'albumartist' in audio.tags else None
-                        title = audio.tags.get('title', [None])[0] if 'title' in audio.tags else None
-                
-                # Build query from available metadata
-                if album:
-                    # Remove CD numbers if present
-                    album = re.sub(r'[- ]+cd ?\d+$', '', str(album), flags=re.IGNORECASE)
-                    # Remove common audiobook suffixes
-                    album = re.sub(r'\s*\(unabridged\)\s*$', '', album, flags=re.IGNORECASE)
-                    album = re.sub(r'\s*\(abridged\)\s*$', '', album, flags=re.IGNORECASE)
-                    
-                    # Prefer albumartist over artist for audiobooks
-                    if albumartist and albumartist not in ['Unknown', 'Various Artists']:
-                        queries.append(f"{albumartist} {album}")
-                    elif artist and artist not in ['Unknown', 'Various Artists']:
-                        queries.append(f"{artist} {album}")
-                    else:
-                        queries.append(album)
+                return ID3(file)
+            except ID3NoHeaderError:
+                return None
+        if ext in ('.m4b', '.m4a'):
+            return MP4(file).tags
+        if ext == '.flac':
+            return FLAC(file).tags
+        audio = (ReadOnlyFile or File)(file)
+        return audio.tags if audio else None
+    
+    def _query_from_tags(self, file: Path) -> Optional[str]:
+        """Build a search query from one file's existing tags, or None if unusable."""
+        try:
+            ext = file.suffix.lower()
+            tags = self._read_tags(file, ext)
+            
+            # Collect all possible metadata
+            album = None
+            artist = None
+            title = None
+            albumartist = None
+            
+            if tags:
+                # Tag keys differ by file type
+                keys = _QUERY_KEYS_BY_EXT.get(ext)
+                if keys:
+                    album, artist, albumartist, title = (_first_tag_value(tags.get(key)) for key in keys)
                     
-                    # If we have a good query, clean and return it
-                    if queries:
-                        # Replace tabs with spaces and multiple spaces with single space
-                        query = queries[0].replace('\t', ' ')
-                        query = re.sub(r'\s+', ' ', query)
-                        # Remove "Narrated By:" from the query (cleanup from previous mistaken tags)
-                        query = re.sub(r'Narrated By:\s*', '', query, flags=re.IGNORECASE)
-                        return query.strip()
+                    if DEBUG and ext in _MP4_EXTS:
+                        console.print(f"[dim]Debug M4B tags - Album: {album}, Artist: {artist}, AlbumArtist: {albumartist}, Title: {title}[/dim]")
+            
+            # Build query from available metadata
+            queries = []
+            if album:
+                # Remove CD numbers if present
+                album = _strip_matches(_RE_CD_SUFFIX, album, 'cd')
+                # Remove common audiobook suffixes
+                album = _strip_matches(_RE_EDITION_SUFFIX, album, 'dged)')
                 
-                # Try title as fallback
-                if title and title not in ['Unknown', 'Track']:
-                    # Clean up title
-                    title = re.sub(r'\s*\(unabridged\)\s*$', '', str(title), flags=re.IGNORECASE)
-                    title = re.sub(r'\s*\(abridged\)\s*$', '', str(title), flags=re.IGNORECASE)
-                    # Remove "Narrated By:" from title
-                    title = re.sub(r'Narrated By:\s*', '', title, flags=re.IGNORECASE)
-                    if artist and artist not in ['Unknown', 'Various Artists']:
-                        query = f"{artist} {title}".replace('\t', ' ')
-                        query = re.sub(r'\s+', ' ', query)
-                        query = re.sub(r'Narrated By:\s*', '', query, flags=re.IGNORECASE)
-                        return query.strip()
-                    query = str(title).replace('\t', ' ')
-                    query = re.sub(r'\s+', ' ', query)
-                    query = re.sub(r'Narrated By:\s*', '', query, flags=re.IGNORECASE)
-                    return query.strip()
+                # Prefer albumartist over artist for audiobooks
+                if albumartist and albumartist not in ['Unknown', 'Various Artists']:
+                    queries.append(f"{albumartist} {album}")
+                elif artist and artist not in ['Unknown', 'Various Artists']:
+                    queries.append(f"{artist} {album}")
+                else:
+                    queries.append(album)
                 
-                # Just artist as last resort from tags
+                # If we have a good query, clean and return it
+                if queries:
+                    return _normalize_query(queries[0])
+            
+            # Try title as fallback
+            if title and title not in ['Unknown', 'Track']:
+                # Clean up title
+                title = _strip_matches(_RE_EDITION_SUFFIX, title, 'dged)')
+                # Remove "Narrated By:" from title
+                title = _strip_matches(_RE_NARRATED_BY, title, 'narrated by:')
                 if artist and artist not in ['Unknown', 'Various Artists']:
-                    query = str(artist).replace('\t', ' ')
-                    query = re.sub(r'\s+', ' ', query)
-                    query = re.sub(r'Narrated By:\s*', '', query, flags=re.IGNORECASE)
-                    return query.strip()
-                    
-            except Exception as e:
-                pass
+                    return _normalize_query(f"{artist} {title}")
+                return _normalize_query(title)
+            
+            # Just artist as last resort from tags
+            if artist and artist not in ['Unknown', 'Various Artists']:
+                return _normalize_query(artist)
+        except Exception:
+            pass
+        return None
+    
+    def get_initial_search_query(self) -> str:
+        """Extract initial search query from existing tags or filename."""
+        if DEBUG:
+            console.print(f"[dim]Debug: Analyzing {self.files[0].name}[/dim]")
+        
+        # First try to get metadata from file tags. The parts of one book are
+        # usually tagged alike, so the first file alone answers the common
+        # case. Only if it has nothing usable are the rest probed, a batch at
+        # a time on a thread pool since tag reads are I/O bound; results are
+        # consumed in file order so the query matches a sequential scan.
+        query = self._query_from_tags(self.files[0])
+        if query is not None:
+            return query
+        rest = self.files[1:]
+        if rest:
+            batch_size = min(8, len(rest))
+            with ThreadPoolExecutor(max_workers=batch_size) as executor:
+                for start in range(0, len(rest), batch_size):
+                    batch = rest[start:start + batch_size]
+                    for query in executor.map(self._query_from_tags, batch):
+                        if query is not None:
+                            return query
         
         # Fallback to filename and directory parsing
         stem = self.files[0].stem
@@ -673,8 +1181,7 @@ class AudiobookTagger:
         # If parent directory looks like it might be the book title, use it
         if parent_dir and parent_dir not in ['.', '..', '/', 'audiobooks', 'Audiobooks', 'Audio.Books', 'Audio.Books.incoming', 'incoming']:
             # Clean up the parent directory name
-            parent_clean = re.sub(r'[_\.]', ' ', parent_dir)
-            parent_clean = re.sub(r'\s+', ' ', parent_clean).strip()
+            parent_clean = _RE_WS.sub(' ', parent_dir.translate(_SEP_TO_SPACE)).strip()
             
             # If filename is generic but parent dir is descriptive, prefer parent
             if stem.lower() in ['audiobook', 'book', 'audio', parent_clean.lower(), 'track1', 'track01', '01', '1']:
@@ -691,8 +1198,8 @@ class AudiobookTagger:
         # Common patterns: "Author - Title", "Title by Author", "Title"
         
         # Remove common file numbering patterns
-        stem = re.sub(r'^\d+[-_\s\.]*', '', stem)  # Remove leading numbers
-        stem = re.sub(r'[-_](\d+|CD\d+|Part\d+|Chapter\d+)$', '', stem, flags=re.IGNORECASE)  # Remove trailing numbers
+        stem = _RE_LEAD_NUM.sub('', stem)  # Remove leading numbers
+        stem = _RE_TRAIL_PART.sub('', stem)  # Remove trailing numbers
         
         # Try to parse "Author - Title" pattern
         if ' - ' in stem:
@@ -700,39 +1207,20 @@ class AudiobookTagger:
             if len(parts) == 2:
                 # Could be "Author - Title" or "Title - Author"
                 # Usually author comes first in audiobook filenames
-                query = f"{parts[0].strip()} {parts[1].strip()}".replace('\t', ' ')
-                query = re.sub(r'\s+', ' ', query)
-                query = re.sub(r'Narrated By:\s*', '', query, flags=re.IGNORECASE)
-                return query.strip()
+                return _normalize_query(f"{parts[0].strip()} {parts[1].strip()}")
         
         # Try to parse "Title by Author" pattern
-        if ' by ' in stem.lower():
-            parts = stem.lower().split(' by ', 1)
-            if len(parts) == 2:
-                title = stem[:stem.lower().find(' by ')].strip()
-                author = stem[stem.lower().find(' by ') + 4:].strip()
-                query = f"{author} {title}"
-                query = re.sub(r'\s+', ' ', query)
-                query = re.sub(r'Narrated By:\s*', '', query, flags=re.IGNORECASE)
-                return query.strip()
+        by = _RE_BY_SEP.search(stem)
+        if by:
+            title = stem[:by.start()].strip()
+            author = stem[by.end():].strip()
+            return _normalize_query(f"{author} {title}")
         
-        # Clean up underscores and dots used as spaces
-        stem = re.sub(r'[_\.]', ' ', stem)
-        stem = re.sub(r'\s+', ' ', stem)  # Normalize multiple spaces
+        # Clean up underscores and dots used as spaces, then remove common
+        # audiobook indicators
+        stem = _strip_matches(_RE_QUERY_SUFFIX, stem.translate(_SEP_TO_SPACE), 'dged)', 'boo')
         
-        # Remove common audiobook indicators
-        stem = re.sub(r'\s*\(unabridged\)\s*$', '', stem, flags=re.IGNORECASE)
-        stem = re.sub(r'\s*\(abridged\)\s*$', '', stem, flags=re.IGNORECASE)
-        stem = re.sub(r'\s*audiobook\s*$', '', stem, flags=re.IGNORECASE)
-        
-        # Replace tabs with spaces and multiple spaces with single space
-        stem = stem.replace('\t', ' ')
-        stem = re.sub(r'\s+', ' ', stem)
-        
-        # Remove "Narrated By:" from the query (cleanup from previous mistaken tags)
-        stem = re.sub(r'Narrated By:\s*', '', stem, flags=re.IGNORECASE)
-        
-        return stem.strip()
+        return _normalize_query(stem)
     
     def update_tags(self, metadata: Dict, max_workers: Optional[int] = None, progress_callback=None):
         """Update all audio files with the metadata using parallel processing.
@@ -762,42 +1250,40 @@ class AudiobookTagger:
         # Artist field should only be the author
         artist_combined = metadata.get('author', '')
         
+        # Load each directory's cover once and build the format-specific
+        # picture objects up front; every file then shares them
+        covers = {
+            directory: self._build_cover_art(self._get_cover_data(directory))
+            for directory in {file.parent for file in self.files}
+        }
+        
         # Function to update a single file
         def update_single_file(args):
-            file, track_num = args
+            file, track_num, ext = args
             try:
-                ext = file.suffix.lower()
-                
-                if ext == '.mp3':
-                    self._update_mp3(file, metadata, artist_combined, track_num)
-                elif ext in ['.m4b', '.m4a', '.aac']:
-                    self._update_mp4(file, metadata, artist_combined, track_num)
-                elif ext in ['.ogg', '.oga', '.opus']:
-                    self._update_ogg(file, metadata, artist_combined, track_num)
-                elif ext == '.flac':
-                    self._update_flac(file, metadata, artist_combined, track_num)
-                else:
-                    # Generic mutagen handler for other formats
-                    self._update_generic(file, metadata, artist_combined, track_num)
-                
+                writer = self._writers.get(ext, self._update_generic)
+                # Large buffers keep mutagen's small reads and writes from
+                # turning into thousands of round trips on network storage
+                with open(file, 'rb+', buffering=_TAG_IO_BUFFER_SIZE) as fileobj:
+                    writer(file, metadata, artist_combined, track_num, covers[file.parent], fileobj)
                 return (file, True, None)
             except Exception as e:
                 return (file, False, str(e))
         
         # Prepare file list with track numbers
-        file_args = [(file, i) for i, file in enumerate(self.files, 1)]
+        file_args = [(file, i, ext) for i, (file, ext) in enumerate(zip(self.files, self.exts), 1)]
         
-        # Use ThreadPoolExecutor for parallel processing
+        # Use the shared thread pool for parallel processing; the pool only
+        # starts as many threads as there are files to tag
+        executor = _get_tag_executor(max_workers)
         if progress_callback:
             # Background mode - no progress bar, use callback
-            with ThreadPoolExecutor(max_workers=min(max_workers, len(self.files))) as executor:
-                # Submit all tasks
-                futures = {executor.submit(update_single_file, args): args[0] for args in file_args}
-                
-                # Process completed tasks
-                for future in as_completed(futures):
-                    file, success, error = future.result()
-                    progress_callback(file, success, error)
+            futures = [executor.submit(update_single_file, args) for args in file_args]
+            
+            # Process completed tasks
+            for future in as_completed(futures):
+                file, success, error = future.result()
+                progress_callback(file, success, error)
         else:
             # Interactive mode - show progress bar
             with Progress(
@@ -809,37 +1295,37 @@ class AudiobookTagger:
             ) as progress:
                 task = progress.add_task("[cyan]Tagging files...", total=len(self.files))
                 
-                with ThreadPoolExecutor(max_workers=min(max_workers, len(self.files))) as executor:
-                    # Submit all tasks
-                    futures = {executor.submit(update_single_file, args): args[0] for args in file_args}
-                    
-                    # Process completed tasks
-                    for future in as_completed(futures):
-                        file, success, error = future.result()
-                        if success:
-                            console.print(f"  [green]✓[/green] Updated: {file.name}")
-                        else:
-                            console.print(f"  [red]✗[/red] Failed to update {file.name}: {error}")
-                        progress.update(task, advance=1)
+                # Submit all tasks
+                futures = [executor.submit(update_single_file, args) for args in file_args]
+                
+                # Process completed tasks
+                for future in as_completed(futures):
+                    file, success, error = future.result()
+                    if success:
+                        console.print(f"  [green]✓[/green] Updated: {file.name}")
+                    else:
+                        console.print(f"  [red]✗[/red] Failed to update {file.name}: {error}")
+                    progress.update(task, advance=1)
     
-    def _update_mp3(self, file: Path, metadata: Dict, artist_combined: str, track_num: int):
+    def _update_mp3(self, file: Path, metadata: Dict, artist_combined: str, track_num: int,
+                    cover: Optional[Dict] = None, fileobj=None):
         """Update MP3 file with ID3 tags."""
-        audio = MP3(file, ID3=ID3)
+        audio = MP3(fileobj or file, ID3=ID3)
         
         # Get existing title before clearing tags
         existing_title = ""
-        if hasattr(audio, 'tags') and audio.tags and audio.tags.get('TIT2'):
-            existing_title = str(audio.tags.get('TIT2', [''])[0])
-        
-        # Clear existing tags
-        audio.delete()
-        audio.save()
+        if audio.tags:
+            existing_title = _first_tag_value(audio.tags.get('TIT2')) or ''
         
-        # Reload with fresh tags
-        audio = MP3(file, ID3=ID3)
+        # Only a tag that is already ID3v2.4 may be left as is
+        before = _tag_snapshot(audio.tags) if audio.tags and audio.tags.version == (2, 4, 0) else None
         
-        # Look for cover image file
-        cover_data = self._get_cover_data(file.parent)
+        # Clear existing tags in memory only - the single save() below
+        # replaces the on-disk tag instead of a delete/save/reload round-trip
+        if audio.tags is None:
+            audio.add_tags()
+        else:
+            audio.tags.clear()
         
         # Set standard tags - with smart title detection
         # Check if existing title is meaningful
@@ -858,40 +1344,42 @@ class AudiobookTagger:
                     console.print(f"[dim]Debug: [yellow]REPLACE[/yellow] title for {file.name}: '{existing_title}' → '{title}'[/dim]")
                 else:
                     console.print(f"[dim]Debug: [blue]SET[/blue] title for {file.name}: '{title}'[/dim]")
-        audio['TIT2'] = TIT2(encoding=3, text=title)
+        # Build every frame first and hand them to the tag in one update
+        frames = {}
+        frames['TIT2'] = TIT2(encoding=3, text=title)
         
         # Album - just the main title, no subtitle
         album_title = metadata.get('title', '')
-        audio['TALB'] = TALB(encoding=3, text=album_title)
+        frames['TALB'] = TALB(encoding=3, text=album_title)
         
         # Artists
-        audio['TPE1'] = TPE1(encoding=3, text=artist_combined)  # Artist
-        audio['TPE2'] = TPE2(encoding=3, text=metadata.get('author', ''))  # Album Artist
-        audio['TCOM'] = TCOM(encoding=3, text=metadata.get('narrator', ''))  # Composer (narrator)
+        frames['TPE1'] = TPE1(encoding=3, text=artist_combined)  # Artist
+        frames['TPE2'] = TPE2(encoding=3, text=metadata.get('author', ''))  # Album Artist
+        frames['TCOM'] = TCOM(encoding=3, text=metadata.get('narrator', ''))  # Composer (narrator)
         
         # Publisher
         if metadata.get('publisher'):
-            audio['TPUB'] = TPUB(text=metadata['publisher'])
+            frames['TPUB'] = TPUB(text=metadata['publisher'])
         
         # Year
         if metadata.get('year'):
-            audio['TDRC'] = TDRC(encoding=3, text=metadata['year'])
+            frames['TDRC'] = TDRC(encoding=3, text=metadata['year'])
         if metadata.get('release_year'):
-            audio['TDRL'] = TDRL(encoding=3, text=metadata['release_year'])
+            frames['TDRL'] = TDRL(encoding=3, text=metadata['release_year'])
         
         # Genre
         if metadata.get('genre'):
-            audio['TCON'] = TCON(text=metadata['genre'])
+            frames['TCON'] = TCON(text=metadata['genre'])
         
         # Description/Comment
         if metadata.get('description'):
-            audio['COMM::eng'] = COMM(
+            frames['COMM::eng'] = COMM(
                 encoding=3,
                 lang='eng',
                 desc='',
                 text=metadata['description'][:1000]  # Limit length
             )
-            audio['TXXX:DESCRIPTION'] = TXXX(
+            frames['TXXX:DESCRIPTION'] = TXXX(
                 encoding=3,
                 desc='DESCRIPTION',
                 text=metadata['description']
@@ -899,60 +1387,60 @@ class AudiobookTagger:
         
         # Series information
         if metadata.get('series'):
-            audio['TXXX:SERIES'] = TXXX(encoding=3, desc='SERIES', text=metadata['series'])
+            frames['TXXX:SERIES'] = TXXX(encoding=3, desc='SERIES', text=metadata['series'])
             if metadata.get('series_part'):
-                audio['TXXX:SERIES-PART'] = TXXX(encoding=3, desc='SERIES-PART', text=metadata['series_part'])
+                frames['TXXX:SERIES-PART'] = TXXX(encoding=3, desc='SERIES-PART', text=metadata['series_part'])
                 album_sort = f"{metadata['series']} {metadata['series_part']} - {metadata['title']}"
-                audio['TSOP'] = TSOP(text=album_sort)
+                frames['TSOP'] = TSOP(text=album_sort)
                 content_group = f"{metadata['series']}, Book #{metadata['series_part']}"
-                audio['TIT1'] = TIT1(encoding=3, text=content_group)
-                audio['TXXX:MOVEMENTNAME'] = TXXX(encoding=3, desc='MOVEMENTNAME', text=metadata['series'])
-                audio['TXXX:MOVEMENT'] = TXXX(encoding=3, desc='MOVEMENT', text=metadata['series_part'])
-                audio['TXXX:SHOWMOVEMENT'] = TXXX(encoding=3, desc='SHOWMOVEMENT', text='1')
+                frames['TIT1'] = TIT1(encoding=3, text=content_group)
+                frames['TXXX:MOVEMENTNAME'] = TXXX(encoding=3, desc='MOVEMENTNAME', text=metadata['series'])
+                frames['TXXX:MOVEMENT'] = TXXX(encoding=3, desc='MOVEMENT', text=metadata['series_part'])
+                frames['TXXX:SHOWMOVEMENT'] = TXXX(encoding=3, desc='SHOWMOVEMENT', text='1')
         
         # iTunes specific tags
-        audio['TXXX:ITUNESMEDIATYPE'] = TXXX(encoding=3, desc='ITUNESMEDIATYPE', text='Audiobook')
-        audio['TXXX:ITUNESGAPLESS'] = TXXX(encoding=3, desc='ITUNESGAPLESS', text='1')
+        frames['TXXX:ITUNESMEDIATYPE'] = TXXX(encoding=3, desc='ITUNESMEDIATYPE', text='Audiobook')
+        frames['TXXX:ITUNESGAPLESS'] = TXXX(encoding=3, desc='ITUNESGAPLESS', text='1')
         
         # Additional metadata
-        if metadata.get('url'):
-            audio['TXXX:WWWAUDIOFILE'] = TXXX(encoding=3, desc='WWWAUDIOFILE', text=metadata['url'])
-        if metadata.get('asin'):
-            audio['TXXX:ASIN'] = TXXX(encoding=3, desc='ASIN', text=metadata['asin'])
-        if metadata.get('rating'):
-            audio['TXXX:RATING WMP'] = TXXX(encoding=3, desc='RATING WMP', text=metadata['rating'])
+        for desc, field in _ID3_OPTIONAL_TXXX:
+            value = metadata.get(field)
+            if value:
+                frames[f'TXXX:{desc}'] = TXXX(encoding=3, desc=desc, text=value)
         
         # Track number
         if len(self.files) > 1:
-            audio['TRCK'] = TRCK(encoding=3, text=f"{track_num}/{len(self.files)}")
-            audio['TPOS'] = TPOS(encoding=3, text='1/1')
+            frames['TRCK'] = TRCK(encoding=3, text=f"{track_num}/{len(self.files)}")
+            frames['TPOS'] = TPOS(encoding=3, text='1/1')
         
         # Embed cover art if available
-        if cover_data:
-            audio['APIC'] = APIC(
-                encoding=3,
-                mime=cover_data['mime'],
-                type=3,  # Cover (front)
-                desc='Cover',
-                data=cover_data['data']
-            )
+        if cover:
+            frames[cover['apic'].HashKey] = cover['apic']
+        
+        audio.tags.update(frames)
+        
+        if _tag_snapshot(audio.tags) == before:
+            return  # Already tagged with this metadata - leave the file untouched
         
-        audio.save()
+        if fileobj is not None:
+            fileobj.seek(0)  # mutagen saves from the current position
+        audio.save(fileobj, padding=_tag_padding)
     
-    def _update_mp4(self, file: Path, metadata: Dict, artist_combined: str, track_num: int):
+    def _update_mp4(self, file: Path, metadata: Dict, artist_combined: str, track_num: int,
+                    cover: Optional[Dict] = None, fileobj=None):
         """Update MP4/M4B/M4A files."""
-        audio = MP4(file)
+        audio = MP4(fileobj or file)
         
         # Get existing title before clearing tags
         existing_title = ""
         if audio.tags and '\xa9nam' in audio.tags:
             existing_title = audio.tags['\xa9nam'][0] or ''
         
-        # Clear existing tags
-        audio.clear()
+        before = _tag_snapshot(audio.tags)
         
-        # Look for cover image file
-        cover_data = self._get_cover_data(file.parent)
+        # Clear existing tags in memory; the padded save below reuses the
+        # space they took on disk
+        audio.clear()
         
         # Set standard tags - with smart title detection
         if self._is_meaningful_title(existing_title, str(file)):
@@ -969,73 +1457,87 @@ class AudiobookTagger:
         # Album - just the main title, no subtitle
         album_title = metadata.get('title', '')
         
-        audio['\xa9nam'] = title  # Title (with subtitle)
-        audio['\xa9alb'] = album_title  # Album (without subtitle)
-        audio['\xa9ART'] = artist_combined  # Artist
-        audio['aART'] = metadata.get('author', '')  # Album Artist
-        audio['\xa9wrt'] = metadata.get('narrator', '')  # Composer (narrator)
+        # Build every atom first and hand them to the tag in one update
+        tags = {
+            '\xa9nam': [title],  # Title (with subtitle)
+            '\xa9alb': [album_title],  # Album (without subtitle)
+            '\xa9ART': [artist_combined],  # Artist
+            'aART': [metadata.get('author', '')],  # Album Artist
+            '\xa9wrt': [metadata.get('narrator', '')],  # Composer (narrator)
+        }
         
         # Year and genre
         if metadata.get('year'):
-            audio['\xa9day'] = metadata['year']
+            tags['\xa9day'] = [metadata['year']]
         if metadata.get('genre'):
-            audio['\xa9gen'] = metadata['genre']
+            tags['\xa9gen'] = [metadata['genre']]
         
         # Description/Comment
         if metadata.get('description'):
-            audio['\xa9cmt'] = metadata['description'][:1000]
-            audio['desc'] = metadata['description']
+            tags['\xa9cmt'] = [metadata['description'][:1000]]
+            tags['desc'] = [metadata['description']]
         
         # Publisher
         if metadata.get('publisher'):
-            audio['\xa9pub'] = metadata['publisher']
+            tags['\xa9pub'] = [metadata['publisher']]
         
         # Track number
         if len(self.files) > 1:
-            audio['trkn'] = [(track_num, len(self.files))]
+            tags['trkn'] = [(track_num, len(self.files))]
         
         # Disc number
-        audio['disk'] = [(1, 1)]
+        tags['disk'] = [(1, 1)]
         
         # iTunes specific - mark as audiobook
-        audio['stik'] = [2]  # Media type: 2 = audiobook
-        audio['pgap'] = True  # Gapless playback
+        tags['stik'] = [2]  # Media type: 2 = audiobook
+        tags['pgap'] = True  # Gapless playback
         
         # Custom tags for series
         if metadata.get('series'):
-            audio['----:com.apple.iTunes:SERIES'] = metadata['series'].encode('utf-8')
+            tags['----:com.apple.iTunes:SERIES'] = _mp4_text_atom(metadata['series'])
             if metadata.get('series_part'):
-                audio['----:com.apple.iTunes:SERIES-PART'] = metadata['series_part'].encode('utf-8')
-                audio['soal'] = f"{metadata['series']} {metadata['series_part']} - {metadata['title']}"
+                tags['----:com.apple.iTunes:SERIES-PART'] = _mp4_text_atom(metadata['series_part'])
+                tags['soal'] = [f"{metadata['series']} {metadata['series_part']} - {metadata['title']}"]
         
         # Additional metadata
         if metadata.get('asin'):
-            audio['----:com.apple.iTunes:ASIN'] = metadata['asin'].encode('utf-8')
+            tags['----:com.apple.iTunes:ASIN'] = _mp4_text_atom(metadata['asin'])
         if metadata.get('url'):
-            audio['----:com.apple.iTunes:WWWAUDIOFILE'] = metadata['url'].encode('utf-8')
+            tags['----:com.apple.iTunes:WWWAUDIOFILE'] = _mp4_text_atom(metadata['url'])
         
         # Embed cover art if available
-        if cover_data:
-            audio['covr'] = [MP4Cover(cover_data['data'], imageformat=cover_data['format'])]
+        if cover:
+            tags['covr'] = [cover['mp4']]
+        
+        audio.update(tags)
+        
+        if _tag_snapshot(audio.tags) == before:
+            return  # Already tagged with this metadata - leave the file untouched
         
-        audio.save()
+        if fileobj is not None:
+            fileobj.seek(0)  # mutagen saves from the current position
+        audio.save(fileobj, padding=_tag_padding)
     
-    def _update_ogg(self, file: Path, metadata: Dict, artist_combined: str, track_num: int):
+    def _update_ogg(self, file: Path, metadata: Dict, artist_combined: str, track_num: int,
+                    cover: Optional[Dict] = None, fileobj=None):
         """Update OGG/Opus files."""
-        audio = File(file)
+        # .opus always holds Opus, so skip the sniff; an .ogg/.oga container
+        # may carry Vorbis, Opus or FLAC and still needs it
+        loader = OggOpus if file.suffix.lower() == '.opus' else File
+        audio = loader(fileobj or file)
         
         # Get existing title before clearing tags
         existing_title = ""
         if hasattr(audio, 'tags') and audio.tags and 'title' in audio.tags:
             existing_title = audio.tags['title'][0] or ''
         
-        # Clear existing tags
+        before = _tag_snapshot(audio.tags)
+        
+        # Clear existing tags in memory; the padded save below reuses the
+        # space they took on disk
         if hasattr(audio, 'clear'):
             audio.clear()
         
-        # Look for cover image file
-        cover_data = self._get_cover_data(file.parent)
-        
         # Set standard tags - with smart title detection
         if self._is_meaningful_title(existing_title, str(file)):
             title = existing_title
@@ -1048,74 +1550,39 @@ class AudiobookTagger:
             if DEBUG and existing_title:
                 console.print(f"[dim]Debug: Replacing generic title '{existing_title}' with '{title}' for {file.name}[/dim]")
         
-        audio['title'] = title
-        # Album - just the main title, no subtitle
-        album_title = metadata.get('title', '')
-        audio['album'] = album_title
-        audio['artist'] = artist_combined
-        audio['albumartist'] = metadata.get('author', '')
-        audio['composer'] = metadata.get('narrator', '')
-        
-        # Additional metadata
-        if metadata.get('year'):
-            audio['date'] = metadata['year']
-        if metadata.get('genre'):
-            audio['genre'] = metadata['genre']
-        if metadata.get('publisher'):
-            audio['publisher'] = metadata['publisher']
-        
-        # Media type for consistency
-        audio['itunesmediatype'] = 'Audiobook'
-        if metadata.get('description'):
-            audio['comment'] = metadata['description'][:1000]
-            audio['description'] = metadata['description']
+        comments = self._vorbis_comments(metadata, title, artist_combined, track_num)
         
-        # Series information
-        if metadata.get('series'):
-            audio['series'] = metadata['series']
-            if metadata.get('series_part'):
-                audio['seriespart'] = metadata['series_part']
-                audio['albumsort'] = f"{metadata['series']} {metadata['series_part']} - {metadata['title']}"
+        # Embed cover art if available (OGG uses base64 encoded metadata)
+        if cover:
+            comments['metadata_block_picture'] = [cover['vorbis_picture']]
         
-        # Track number
-        if len(self.files) > 1:
-            audio['tracknumber'] = str(track_num)
-            audio['tracktotal'] = str(len(self.files))
+        audio.update(comments)
         
-        # Additional tags
-        if metadata.get('asin'):
-            audio['asin'] = metadata['asin']
-        if metadata.get('url'):
-            audio['wwwaudiofile'] = metadata['url']
+        if _tag_snapshot(audio.tags) == before:
+            return  # Already tagged with this metadata - leave the file untouched
         
-        # Embed cover art if available (OGG uses base64 encoded metadata)
-        if cover_data:
-            import base64
-            picture = Picture()
-            picture.type = 3  # Cover (front)
-            picture.mime = cover_data['mime']
-            picture.desc = 'Cover'
-            picture.data = cover_data['data']
-            audio['metadata_block_picture'] = base64.b64encode(picture.write()).decode('ascii')
-        
-        audio.save()
-    
-    def _update_flac(self, file: Path, metadata: Dict, artist_combined: str, track_num: int):
+        if fileobj is not None:
+            fileobj.seek(0)  # mutagen saves from the current position
+        audio.save(fileobj, padding=_tag_padding)
+    
+    def _update_flac(self, file: Path, metadata: Dict, artist_combined: str, track_num: int,
+                     cover: Optional[Dict] = None, fileobj=None):
         """Update FLAC files."""
-        audio = FLAC(file)
+        audio = FLAC(fileobj or file)
         
         # Get existing title before clearing tags
         existing_title = ""
         if audio.tags and 'title' in audio.tags:
             existing_title = audio.tags['title'][0] or ''
         
-        # Clear existing tags
+        # Pictures live outside the comment block, so compare their raw blocks too
+        before = (_tag_snapshot(audio.tags), [picture.write() for picture in audio.pictures])
+        
+        # Clear existing tags in memory; the padded save below reuses the
+        # space they took on disk
         audio.clear()
         audio.clear_pictures()  # Also clear any existing pictures
         
-        # Look for cover image file
-        cover_data = self._get_cover_data(file.parent)
-        
         # Set standard tags - with smart title detection
         if self._is_meaningful_title(existing_title, str(file)):
             title = existing_title
@@ -1128,70 +1595,80 @@ class AudiobookTagger:
             if DEBUG and existing_title:
                 console.print(f"[dim]Debug: Replacing generic title '{existing_title}' with '{title}' for {file.name}[/dim]")
         
-        audio['title'] = title
+        comments = self._vorbis_comments(metadata, title, artist_combined, track_num)
+        
+        audio.update(comments)
+        
+        # Embed cover art if available
+        if cover:
+            audio.add_picture(cover['picture'])
+        
+        if (_tag_snapshot(audio.tags), [picture.write() for picture in audio.pictures]) == before:
+            return  # Already tagged with this metadata - leave the file untouched
+        
+        if fileobj is not None:
+            fileobj.seek(0)  # mutagen saves from the current position
+        audio.save(fileobj, padding=_tag_padding)
+    
+    def _vorbis_comments(self, metadata: Dict, title: str, artist_combined: str,
+                         track_num: int) -> Dict[str, List[str]]:
+        """Build the Vorbis comments shared by the OGG and FLAC writers."""
         # Album - just the main title, no subtitle
-        album_title = metadata.get('title', '')
-        audio['album'] = album_title
-        audio['artist'] = artist_combined
-        audio['albumartist'] = metadata.get('author', '')
-        audio['composer'] = metadata.get('narrator', '')
+        comments = {
+            'title': [title],
+            'album': [metadata.get('title', '')],
+            'artist': [artist_combined],
+            'albumartist': [metadata.get('author', '')],
+            'composer': [metadata.get('narrator', '')],
+        }
         
         # Additional metadata
         if metadata.get('year'):
-            audio['date'] = metadata['year']
+            comments['date'] = [metadata['year']]
         if metadata.get('genre'):
-            audio['genre'] = metadata['genre']
+            comments['genre'] = [metadata['genre']]
         if metadata.get('publisher'):
-            audio['publisher'] = metadata['publisher']
+            comments['publisher'] = [metadata['publisher']]
         
         # Media type for consistency
-        audio['itunesmediatype'] = 'Audiobook'
+        comments['itunesmediatype'] = ['Audiobook']
         if metadata.get('description'):
-            audio['comment'] = metadata['description'][:1000]
-            audio['description'] = metadata['description']
+            comments['comment'] = [metadata['description'][:1000]]
+            comments['description'] = [metadata['description']]
         
         # Series information
         if metadata.get('series'):
-            audio['series'] = metadata['series']
+            comments['series'] = [metadata['series']]
             if metadata.get('series_part'):
-                audio['seriespart'] = metadata['series_part']
-                audio['albumsort'] = f"{metadata['series']} {metadata['series_part']} - {metadata['title']}"
+                comments['seriespart'] = [metadata['series_part']]
+                comments['albumsort'] = [f"{metadata['series']} {metadata['series_part']} - {metadata['title']}"]
         
         # Track number
         if len(self.files) > 1:
-            audio['tracknumber'] = str(track_num)
-            audio['tracktotal'] = str(len(self.files))
+            comments['tracknumber'] = [str(track_num)]
+            comments['tracktotal'] = [str(len(self.files))]
         
         # Additional tags
         if metadata.get('asin'):
-            audio['asin'] = metadata['asin']
+            comments['asin'] = [metadata['asin']]
         if metadata.get('url'):
-            audio['wwwaudiofile'] = metadata['url']
+            comments['wwwaudiofile'] = [metadata['url']]
         
-        # Embed cover art if available
-        if cover_data:
-            picture = Picture()
-            picture.type = 3  # Cover (front)
-            picture.mime = cover_data['mime']
-            picture.desc = 'Cover'
-            picture.data = cover_data['data']
-            audio.add_picture(picture)
-        
-        audio.save()
+        return comments
     
-    def _update_generic(self, file: Path, metadata: Dict, artist_combined: str, track_num: int):
+    def _update_generic(self, file: Path, metadata: Dict, artist_combined: str, track_num: int,
+                        cover: Optional[Dict] = None, fileobj=None):
         """Update other audio files using generic mutagen interface."""
-        audio = File(file)
+        audio = File(fileobj or file)
         if not audio:
             raise Exception(f"Unsupported format: {file.suffix}")
         
+        before = _tag_snapshot(audio.tags)
+        
         # Try to clear existing tags
         if hasattr(audio, 'clear'):
             audio.clear()
         
-        # Look for cover image file
-        cover_data = self._get_cover_data(file.parent)
-        
         # Use common tag names
         title = metadata.get('title', '')
         if metadata.get('subtitle'):
@@ -1213,28 +1690,56 @@ class AudiobookTagger:
         # Note: Generic format may not support embedded covers
         # Cover will still be saved as separate file
         
-        audio.save()
+        if audio.tags is not None and _tag_snapshot(audio.tags) == before:
+            return  # Already tagged with this metadata - leave the file untouched
+        
+        if fileobj is not None:
+            fileobj.seek(0)  # mutagen saves from the current position
+        audio.save(fileobj)
+    
+    def _build_cover_art(self, cover_data: Optional[Dict]) -> Optional[Dict]:
+        """Wrap loaded cover bytes in the picture object each format embeds."""
+        if not cover_data:
+            return None
+        
+        cover_data = _shrink_cover(cover_data)
+        picture = Picture()
+        picture.type = 3  # Cover (front)
+        picture.mime = cover_data['mime']
+        picture.desc = 'Cover'
+        picture.data = cover_data['data']
+        
+        return {
+            'apic': APIC(
+                encoding=3,
+                mime=cover_data['mime'],
+                type=3,  # Cover (front)
+                desc='Cover',
+                data=cover_data['data']
+            ),
+            'mp4': MP4Cover(cover_data['data'], imageformat=cover_data['format']),
+            'picture': picture,
+            # OGG stores the FLAC picture block base64 encoded in a comment
+            'vorbis_picture': base64.b64encode(picture.write()).decode('ascii'),
+        }
     
     def _get_cover_data(self, directory: Path) -> Optional[Dict]:
         """Find and load cover image from directory, preferring larger files."""
-        # Look for cover images in order of preference
-        cover_patterns = [
-            'cover.jpg', 'cover.jpeg', 'cover.png',
-            '*cover*.jpg', '*cover*.jpeg', '*cover*.png',
-            '*.jpg', '*.jpeg', '*.png'
-        ]
-        
-        # Collect all potential cover files
+        # Collect every image in the directory in one listing; hidden files
+        # (e.g. macOS "._cover.jpg" metadata) are not images
         all_covers = []
-        for pattern in cover_patterns:
-            matches = list(directory.glob(pattern))
-            for cover_file in matches:
-                if cover_file.suffix.lower() in ['.jpg', '.jpeg', '.png']:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.') or os.path.splitext(entry.name)[1].lower() not in _COVER_IMAGE_EXTS:
+                        continue
                     try:
-                        size = cover_file.stat().st_size
-                        all_covers.append((size, cover_file))
-                    except:
+                        if entry.is_file():
+                            all_covers.append((entry.stat().st_size, Path(entry.path)))
+                    except OSError:
                         pass
+        except OSError:
+            return None
         
         # Sort by size (largest first) and take the biggest
         if all_covers:
@@ -1258,8 +1763,6 @@ class AudiobookTagger:
                 
                 if DEBUG:
                     try:
-                        from PIL import Image
-                        import io
                         img = Image.open(io.BytesIO(data))
                         width, height = img.size
                         console.print(f"[dim]Debug: Using cover {cover_file.name} ({width}x{height}, {len(data):,} bytes)[/dim]")
@@ -1279,19 +1782,152 @@ class AudiobookTagger:
         return None
 
 
-def download_and_save_cover(url: str, save_path: Path) -> bool:
+# Image suffixes the move task carries along as cover art
+_COVER_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png'})
+
+
+def _scan_files(root: Path, suffixes, recursive: bool = True) -> List[Path]:
+    """Find files under root whose lowercased suffix is in suffixes.
+    
+    A single scandir walk with an explicit stack: directory entries carry
+    their type, so no extra stat per file. Each directory's entries are
+    sorted by name, so files come back grouped by directory in a stable
+    order: a directory's files, then its subdirectories in turn. Unreadable
+    directories are skipped. With recursive=False only root's own files
+    are listed.
+    """
+    found = []
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        subdirs.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in suffixes:
+                    found.append(Path(entry.path))
+            except OSError:
+                continue
+        stack.extend(reversed(subdirs))
+    return found
+
+
+def _collect_audio_files(root: Path) -> List[Path]:
+    """Find supported audio files under root in a single directory walk.
+    
+    Suffixes are matched case-insensitively, so ".MP3" and ".Mp3" are found
+    without a separate pass per spelling.
+    """
+    return _scan_files(root, AudiobookTagger.SUPPORTED_FORMATS)
+
+
+# Bytes from the start of each file hinted to the kernel before parsing
+_PREFETCH_BYTES = 1 << 17
+
+
+def _prefetch_tag_regions(paths: List[Path]):
+    """Ask the kernel to start reading the head of each file ahead of parsing.
+    
+    Only a hint: does nothing where posix_fadvise is unavailable and ignores
+    files that can't be opened.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, _PREFETCH_BYTES, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+# Covers larger than this are skipped in favour of the next resolution down;
+# the image is embedded in every file, so a multi-MB cover bloats each tag.
+_MAX_COVER_BYTES = 2 * 1024 * 1024
+# Anything this small is a placeholder or error stub rather than a cover
+_MIN_COVER_BYTES = 1000
+
+_COVER_RESOLUTIONS = ['_SL5000_', '_SL4000_', '_SL3000_', '_SL2400_', '_SL2000_', '_SL1500_', '_SL1200_', '_SL1000_', '_SL800_', '_SS500_', '_SL500_', '_SL300_']
+_RE_COVER_MARKER = re.compile('|'.join(map(re.escape, [
+    '_SL5000_', '_SL4000_', '_SL3000_', '_SL2400_', '_SL2000_', '_SL1500_', '_SL1200_', '_SL1000_',
+    '_SL800_', '_SL600_', '_SS500_', '_SL500_', '_SL300_', '_SL175_', '_SX500_'])))
+
+
+def _is_image(data: bytes) -> bool:
+    """Check for a JPEG or PNG signature."""
+    return data.startswith(b'\xff\xd8\xff') or data.startswith(b'\x89PNG\r\n\x1a\n')
+
+
+def _read_cover(response, limit: Optional[int]) -> Optional[bytearray]:
+    """Stream a cover body into one buffer preallocated from Content-Length.
+    
+    Returns None as soon as the body is known to exceed limit, without
+    downloading the rest of it.
+    """
+    try:
+        expected = int(response.headers.get('Content-Length', 0))
+    except (TypeError, ValueError):
+        expected = 0
+    if limit is not None and expected > limit:
+        return None
+    
+    buffer = bytearray(expected)
+    size = 0
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        # Slice assignment fills the preallocated space and grows the buffer
+        # if the server sent more than it announced
+        buffer[size:size + len(chunk)] = chunk
+        size += len(chunk)
+        if limit is not None and size > limit:
+            return None
+    del buffer[size:]
+    return buffer
+
+
+def make_cover_session() -> requests.Session:
+    """Session for cover downloads, pooled and retrying like the scraper's.
+    
+    Covers for every book come from the same image host, so one session
+    shared by the background taggers keeps those connections alive.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=('GET', 'HEAD'),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def download_and_save_cover(url: str, save_path: Path, session: Optional[requests.Session] = None) -> bool:
     """Download cover image from URL and save to file with fallback to lower resolutions."""
+    get = session.get if session is not None else requests.get
+
     # Try different resolutions in order of preference (highest to lowest)
     # Amazon supports up to _SL5000_ for some book covers
-    resolutions = ['_SL5000_', '_SL4000_', '_SL3000_', '_SL2400_', '_SL2000_', '_SL1500_', '_SL1200_', '_SL1000_', '_SL800_', '_SS500_', '_SL500_', '_SL300_']
+    marker = _RE_COVER_MARKER.search(url)
+    # Without a size marker every attempt would fetch the same URL
+    resolutions = _COVER_RESOLUTIONS if marker else _COVER_RESOLUTIONS[:1]
     
     for resolution in resolutions:
-        test_url = url
         # Replace current resolution marker with the test resolution
-        for marker in ['_SL5000_', '_SL4000_', '_SL3000_', '_SL2400_', '_SL2000_', '_SL1500_', '_SL1200_', '_SL1000_', '_SL800_', '_SL600_', '_SS500_', '_SL500_', '_SL300_', '_SL175_', '_SX500_']:
-            if marker in test_url:
-                test_url = test_url.replace(marker, resolution)
-                break
+        test_url = url[:marker.start()] + resolution + url[marker.end():] if marker else url
         
         try:
             if DEBUG:
@@ -1299,30 +1935,44 @@ def download_and_save_cover(url: str, save_path: Path) -> bool:
             else:
                 console.print(f"[cyan]Downloading cover art...[/cyan]")
             
-            response = requests.get(test_url, timeout=10)
-            response.raise_for_status()
-            
-            # Check if we got a valid image (not a placeholder)
-            content = response.content
-            if len(content) > 1000:  # Minimum size check for valid image
-                # Save to file
-                save_path.write_bytes(content)
-                
-                # Try to get image dimensions for logging
-                try:
-                    from PIL import Image
-                    import io
-                    img = Image.open(io.BytesIO(content))
-                    width, height = img.size
-                    size_info = f" ({width}x{height})"
-                except:
-                    size_info = ""
-                
+            response = get(test_url, timeout=10, stream=True)
+            try:
+                response.raise_for_status()
+                # A placeholder announced by its Content-Length is skipped
+                # without transferring the body
+                announced = response.headers.get('Content-Length', '')
+                if announced.isdigit() and int(announced) <= _MIN_COVER_BYTES:
+                    continue
+                # Oversized covers are abandoned for the next resolution down,
+                # unless this is the last one left
+                content = _read_cover(response, None if resolution == resolutions[-1] else _MAX_COVER_BYTES)
+            finally:
+                response.close()
+            if content is None:
                 if DEBUG:
-                    console.print(f"[dim]Debug: Saved {len(content):,} bytes to {save_path.name} at {resolution}{size_info}[/dim]")
-                else:
-                    console.print(f"[green]✓[/green] Saved cover art as {save_path.name}{size_info}")
-                return True
+                    console.print(f"[dim]Debug: Cover at {resolution} is over {_MAX_COVER_BYTES:,} bytes, trying smaller[/dim]")
+                continue
+            
+            # Check if we got a valid image (not a placeholder or error page)
+            if len(content) <= _MIN_COVER_BYTES or not _is_image(content):
+                continue
+            
+            # Save to file
+            save_path.write_bytes(content)
+            
+            # Try to get image dimensions for logging
+            try:
+                img = Image.open(io.BytesIO(content))
+                width, height = img.size
+                size_info = f" ({width}x{height})"
+            except:
+                size_info = ""
+            
+            if DEBUG:
+                console.print(f"[dim]Debug: Saved {len(content):,} bytes to {save_path.name} at {resolution}{size_info}[/dim]")
+            else:
+                console.print(f"[green]✓[/green] Saved cover art as {save_path.name}{size_info}")
+            return True
         except Exception as e:
             if DEBUG:
                 console.print(f"[dim]Debug: Failed at {resolution}: {e}[/dim]")
@@ -1341,18 +1991,16 @@ def group_files_by_book(audio_files):
     - 'name': Display name for the group
     - 'query': Suggested search query for the group
     """
-    from difflib import SequenceMatcher
-    
     def normalize_for_comparison(text):
         """Normalize text for comparison by removing numbers and common separators."""
         # Remove leading/trailing numbers and common track indicators
-        text = re.sub(r'^\d+[-_\s\.\)]*', '', text)
-        text = re.sub(r'[-_\s]*\d+$', '', text)
-        text = re.sub(r'\b(?:pt|part|chapter|ch|track|cd|disc|disk|vol|volume)\b[-_\s]*\d*', '', text, flags=re.IGNORECASE)
+        text = _RE_LEAD_NUM_PUNCT.sub('', text)
+        text = _RE_TRAIL_NUM.sub('', text)
+        text = _RE_PART_WORD.sub('', text)
         # Remove file extensions if present
-        text = re.sub(r'\.(mp3|m4b|m4a|aac|ogg|opus|flac)$', '', text, flags=re.IGNORECASE)
+        text = _RE_AUDIO_EXT.sub('', text)
         # Normalize separators
-        text = re.sub(r'[-_\s]+', ' ', text)
+        text = _RE_SEP_RUN.sub(' ', text)
         return text.strip().lower()
     
     def is_book_like_name(name):
@@ -1379,9 +2027,9 @@ def group_files_by_book(audio_files):
         words = name.split()
         return len(words) >= 1 and not all(w.isdigit() for w in words)
     
-    def get_similarity(text1, text2):
+    def get_similarity(text1, text2, floor=0.0):
         """Get similarity ratio between two strings."""
-        return SequenceMatcher(None, normalize_for_comparison(text1), normalize_for_comparison(text2)).ratio()
+        return _similarity(normalize_for_comparison(text1), normalize_for_comparison(text2), floor)
     
     def should_group_together(files):
         """Determine if files should be grouped as one book based on similarity."""
@@ -1397,11 +2045,10 @@ def group_files_by_book(audio_files):
         
         # Check if files are numbered sequentially (like chapters or years)
         # Extract any numbers from the filenames
-        import re
         file_numbers = []
         for f in files:
             # Look for numbers in the filename (track numbers, years, etc.)
-            numbers = re.findall(r'\b(\d+)\b', f.stem)
+            numbers = _RE_WORD_NUM.findall(f.stem)
             if numbers:
                 file_numbers.append(int(numbers[0]))  # Use first number found
         
@@ -1424,11 +2071,14 @@ def group_files_by_book(audio_files):
         
         # Check pairwise similarity
         # Instead of requiring ALL files to be similar, check if most are similar
+        # Names go through normalization a second time, as get_similarity
+        # would do, but once per name rather than once per pair. Only which
+        # side of 0.5 and 0.7 each ratio falls on matters below.
+        compared = [normalize_for_comparison(name) for name in normalized_names]
         similarities = []
-        for i in range(len(normalized_names)):
-            for j in range(i + 1, len(normalized_names)):
-                similarity = get_similarity(normalized_names[i], normalized_names[j])
-                similarities.append(similarity)
+        for i in range(len(compared)):
+            for j in range(i + 1, len(compared)):
+                similarities.append(_similarity(compared[i], compared[j], 0.5))
         
         # If most files are similar (median similarity > 0.5), group them
         if similarities:
@@ -1454,15 +2104,8 @@ def group_files_by_book(audio_files):
             try:
                 audio = File(file)
                 if audio and hasattr(audio, 'tags') and audio.tags:
-                    album = None
-                    if file.suffix.lower() == '.mp3':
-                        album = str(audio.tags.get('TALB', [''])[0]) if audio.tags.get('TALB') else None
-                    elif file.suffix.lower() in ['.m4b', '.m4a', '.aac']:
-                        album = audio.tags.get('\xa9alb', [None])[0] if '\xa9alb' in audio.tags else None
-                    elif file.suffix.lower() in ['.ogg', '.opus']:
-                        album = audio.get('album', [None])[0] if 'album' in audio else None
-                    elif file.suffix.lower() == '.flac':
-                        album = audio.get('album', [None])[0] if 'album' in audio else None
+                    album_key = _ALBUM_KEY_BY_EXT.get(file.suffix.lower())
+                    album = _first_tag_value(audio.tags.get(album_key)) if album_key else None
                     
                     if album and album.strip():
                         album_names.add(album.strip())
@@ -1531,7 +2174,7 @@ def group_files_by_book(audio_files):
                 # Try to find a matching group
                 matched = False
                 for group in file_groups:
-                    if get_similarity(normalized, group['normalized']) >= 0.7:
+                    if get_similarity(normalized, group['normalized'], 0.7) >= 0.7:
                         group['files'].append(file)
                         matched = True
                         break
@@ -1576,13 +2219,9 @@ def tag_files(files, debug=False, workers=None):
             if path.is_dir():
                 status.update(f"[cyan]Scanning: {path.name}...[/cyan]")
                 # Recursively search for all supported formats in directory
-                for ext in AudiobookTagger.SUPPORTED_FORMATS:
-                    found_files = list(path.rglob(f'*{ext}'))
-                    audio_files.extend(found_files)
-                    found_files = list(path.rglob(f'*{ext.upper()}'))
-                    audio_files.extend(found_files)
-                    if audio_files:
-                        status.update(f"[cyan]Found {len(audio_files)} files so far...[/cyan]")
+                audio_files.extend(_collect_audio_files(path))
+                if audio_files:
+                    status.update(f"[cyan]Found {len(audio_files)} files so far...[/cyan]")
             else:
                 # Check if file has supported extension
                 if path.suffix.lower() in AudiobookTagger.SUPPORTED_FORMATS:
@@ -1612,11 +2251,12 @@ def tag_files(files, debug=False, workers=None):
         console.print(f"\n[cyan]Found {len(audio_files)} files in {book_groups[0]['name']}[/cyan]")
     
     # Set up for concurrent processing
-    import threading
-    from queue import Queue
-    import time
-    
-    scraper = AudibleScraper()
+    # Audible pages are cached on disk only when AUDTAG_CACHE_DIR is set
+    scraper = AudibleScraper(cache_dir=os.environ.get('AUDTAG_CACHE_DIR'))
+    cover_session = make_cover_session()
+    # Covers start downloading as soon as a book is queued, so the network
+    # fetch overlaps with tagging of the books queued before it
+    cover_pool = ThreadPoolExecutor(max_workers=4)
     tagging_queue = Queue()
     tagging_results = {}
     tagging_lock = threading.Lock()
@@ -1631,29 +2271,12 @@ def tag_files(files, debug=False, workers=None):
             if item is None:  # Sentinel to stop
                 break
             
-            book_idx, group, tagger, metadata, cover_url = item
+            book_idx, group, tagger, metadata, cover_download = item
             
             try:
-                # Download cover if available
-                if cover_url:
-                    cover_dir = tagger.files[0].parent
-                    first_file = tagger.files[0]
-                    base_name = first_file.stem
-                    
-                    # Remove track numbers and extensions to get base name
-                    import re
-                    base_name = re.sub(r'[-_\s]*(?:pt|part|chapter|ch|track|cd|disc)[-_\s]*\d+.*$', '', base_name, flags=re.IGNORECASE)
-                    base_name = re.sub(r'^\d+[-_\s]*', '', base_name)
-                    base_name = base_name.strip()
-                    
-                    if base_name and base_name != first_file.stem:
-                        cover_filename = f"{base_name} - cover.jpg"
-                    else:
-                        cover_filename = "cover.jpg"
-                    
-                    cover_path = cover_dir / cover_filename
-                    if not cover_path.exists():
-                        download_and_save_cover(cover_url, cover_path)
+                # The cover must be on disk before tagging embeds it
+                if cover_download:
+                    cover_download.result()
                 
                 # Progress callback for per-file updates
                 def file_progress(file, success, error):
@@ -1826,6 +2449,9 @@ def tag_files(files, debug=False, workers=None):
                         continue
                     # Don't print here - the search() method will print it
     
+        # Start downloading the likeliest detail pages while the user decides
+        scraper.prefetch_details([r.get('url') for r in results])
+
         # Display results
         table = Table(title="Search Results")
         table.add_column("#", style="cyan", width=3)
@@ -1991,143 +2617,45 @@ def tag_files(files, debug=False, workers=None):
         if metadata.get('subtitle'):
             new_title = f"{new_title}: {metadata['subtitle']}"
     
-        # Show before/after comparison
-        if len(tagger.files) > 1:
-            # For multiple files, show a combined view
-            # Get a representative file for current tags (use the first one)
-            file = tagger.files[0]
-            current_title = ""
-            current_artist = ""
-            current_album = ""
-            current_composer = ""
-            current_year = ""
-        
-            try:
-                audio = File(file)
-                if audio and hasattr(audio, 'tags') and audio.tags:
-                    if file.suffix.lower() == '.mp3':
-                        current_title = str(audio.tags.get('TIT2', [''])[0]) if audio.tags.get('TIT2') else ''
-                        current_artist = str(audio.tags.get('TPE1', [''])[0]) if audio.tags.get('TPE1') else ''
-                        current_album = str(audio.tags.get('TALB', [''])[0]) if audio.tags.get('TALB') else ''
-                        current_composer = str(audio.tags.get('TCOM', [''])[0]) if audio.tags.get('TCOM') else ''
-                        current_year = str(audio.tags.get('TDRC', [''])[0]) if audio.tags.get('TDRC') else ''
-                    elif file.suffix.lower() in ['.m4b', '.m4a', '.aac']:
-                        current_title = audio.tags.get('\xa9nam', [''])[0] or '' if '\xa9nam' in audio.tags else ''
-                        current_artist = audio.tags.get('\xa9ART', [''])[0] or '' if '\xa9ART' in audio.tags else ''
-                        current_album = audio.tags.get('\xa9alb', [''])[0] or '' if '\xa9alb' in audio.tags else ''
-                        current_composer = audio.tags.get('\xa9wrt', [''])[0] or '' if '\xa9wrt' in audio.tags else ''
-                        current_year = audio.tags.get('\xa9day', [''])[0] or '' if '\xa9day' in audio.tags else ''
-                    elif file.suffix.lower() in ['.ogg', '.oga', '.opus', '.flac']:
-                        current_title = audio.tags.get('title', [''])[0] or '' if 'title' in audio.tags else ''
-                        current_artist = audio.tags.get('artist', [''])[0] or '' if 'artist' in audio.tags else ''
-                        current_album = audio.tags.get('album', [''])[0] or '' if 'album' in audio.tags else ''
-                        current_composer = audio.tags.get('composer', [''])[0] or '' if 'composer' in audio.tags else ''
-                        current_year = audio.tags.get('date', [''])[0] or '' if 'date' in audio.tags else ''
-            except:
-                pass
-            
-            # Check if current title is meaningful and will be preserved
-            if tagger._is_meaningful_title(current_title, str(file)):
-                # Title will be preserved during tagging
-                new_title = current_title + " [preserved]"
-        
-            # Create comparison table
-            compare_table = Table(show_header=False, box=None, padding=(0, 2))
-            compare_table.add_column("Field", style="cyan", width=20)
-            compare_table.add_column("Current", style="red", width=40)
-            compare_table.add_column("→", style="white", width=3)
-            compare_table.add_column("New", style="green", width=40)
-        
-            # Show changes (these will apply to all files)
-            compare_table.add_row("Title:", current_title or "(empty)", "→", new_title)
-            compare_table.add_row("Artist:", current_artist or "(empty)", "→", new_artist_combined)
-            # Album - just the main title, no subtitle
-            album_title = metadata.get('title', '')
-            compare_table.add_row("Album:", current_album or "(empty)", "→", album_title)
-            compare_table.add_row("Composer (Narrator):", current_composer or "(empty)", "→", metadata.get('narrator', ''))
-            compare_table.add_row("Year:", current_year or "(empty)", "→", metadata.get('year', '(not found)'))
-        
-            # Add additional fields that will be updated
-            if metadata.get('genre'):
-                compare_table.add_row("Genre:", "(not set)", "→", metadata.get('genre', ''))
-            if metadata.get('publisher'):
-                compare_table.add_row("Publisher:", "(not set)", "→", metadata.get('publisher', ''))
-            if metadata.get('series'):
-                series_info = metadata['series']
-                if metadata.get('series_part'):
-                    series_info += f", Book #{metadata['series_part']}"
-                compare_table.add_row("Series:", "(not set)", "→", series_info)
-        
-            console.print(compare_table)
-        else:
-            # Single file - show specific name
-            file = tagger.files[0]
-            # File name already shown above in search results section
-        
-            # Get current tags
-            current_title = ""
-            current_artist = ""
-            current_album = ""
-            current_composer = ""
-            current_year = ""
-        
-            try:
-                audio = File(file)
-                if audio and hasattr(audio, 'tags') and audio.tags:
-                    if file.suffix.lower() == '.mp3':
-                        current_title = str(audio.tags.get('TIT2', [''])[0]) if audio.tags.get('TIT2') else ''
-                        current_artist = str(audio.tags.get('TPE1', [''])[0]) if audio.tags.get('TPE1') else ''
-                        current_album = str(audio.tags.get('TALB', [''])[0]) if audio.tags.get('TALB') else ''
-                        current_composer = str(audio.tags.get('TCOM', [''])[0]) if audio.tags.get('TCOM') else ''
-                        current_year = str(audio.tags.get('TDRC', [''])[0]) if audio.tags.get('TDRC') else ''
-                    elif file.suffix.lower() in ['.m4b', '.m4a', '.aac']:
-                        current_title = audio.tags.get('\xa9nam', [''])[0] or '' if '\xa9nam' in audio.tags else ''
-                        current_artist = audio.tags.get('\xa9ART', [''])[0] or '' if '\xa9ART' in audio.tags else ''
-                        current_album = audio.tags.get('\xa9alb', [''])[0] or '' if '\xa9alb' in audio.tags else ''
-                        current_composer = audio.tags.get('\xa9wrt', [''])[0] or '' if '\xa9wrt' in audio.tags else ''
-                        current_year = audio.tags.get('\xa9day', [''])[0] or '' if '\xa9day' in audio.tags else ''
-                    elif file.suffix.lower() in ['.ogg', '.oga', '.opus', '.flac']:
-                        current_title = audio.tags.get('title', [''])[0] or '' if 'title' in audio.tags else ''
-                        current_artist = audio.tags.get('artist', [''])[0] or '' if 'artist' in audio.tags else ''
-                        current_album = audio.tags.get('album', [''])[0] or '' if 'album' in audio.tags else ''
-                        current_composer = audio.tags.get('composer', [''])[0] or '' if 'composer' in audio.tags else ''
-                        current_year = audio.tags.get('date', [''])[0] or '' if 'date' in audio.tags else ''
-            except:
-                pass
-            
-            # Check if current title is meaningful and will be preserved
-            if tagger._is_meaningful_title(current_title, str(file)):
-                # Title will be preserved during tagging
-                new_title = current_title + " [preserved]"
-        
-            # Create comparison table
-            compare_table = Table(show_header=False, box=None, padding=(0, 2))
-            compare_table.add_column("Field", style="cyan", width=20)
-            compare_table.add_column("Current", style="red", width=40)
-            compare_table.add_column("→", style="white", width=3)
-            compare_table.add_column("New", style="green", width=40)
-        
-            # Show changes
-            compare_table.add_row("Title:", current_title or "(empty)", "→", new_title)
-            compare_table.add_row("Artist:", current_artist or "(empty)", "→", new_artist_combined)
-            # Album - just the main title, no subtitle
-            album_title = metadata.get('title', '')
-            compare_table.add_row("Album:", current_album or "(empty)", "→", album_title)
-            compare_table.add_row("Composer (Narrator):", current_composer or "(empty)", "→", metadata.get('narrator', ''))
-            compare_table.add_row("Year:", current_year or "(empty)", "→", metadata.get('year', '(not found)'))
-        
-            # Add additional fields that will be updated
-            if metadata.get('genre'):
-                compare_table.add_row("Genre:", "(not set)", "→", metadata.get('genre', ''))
-            if metadata.get('publisher'):
-                compare_table.add_row("Publisher:", "(not set)", "→", metadata.get('publisher', ''))
-            if metadata.get('series'):
-                series_info = metadata['series']
-                if metadata.get('series_part'):
-                    series_info += f", Book #{metadata['series_part']}"
-                compare_table.add_row("Series:", "(not set)", "→", series_info)
-        
-            console.print(compare_table)
+        # Show before/after comparison, using the first file as representative
+        # of the current tags when there are several
+        file = tagger.files[0]
+        current = _current_basic_tags(file)
+        current_title = current['title']
+    
+        # Check if current title is meaningful and will be preserved
+        if tagger._is_meaningful_title(current_title, str(file)):
+            # Title will be preserved during tagging
+            new_title = current_title + " [preserved]"
+    
+        # Create comparison table
+        compare_table = Table(show_header=False, box=None, padding=(0, 2))
+        compare_table.add_column("Field", style="cyan", width=20)
+        compare_table.add_column("Current", style="red", width=40)
+        compare_table.add_column("→", style="white", width=3)
+        compare_table.add_column("New", style="green", width=40)
+    
+        # Show changes (these will apply to all files)
+        compare_table.add_row("Title:", current_title or "(empty)", "→", new_title)
+        compare_table.add_row("Artist:", current['artist'] or "(empty)", "→", new_artist_combined)
+        # Album - just the main title, no subtitle
+        album_title = metadata.get('title', '')
+        compare_table.add_row("Album:", current['album'] or "(empty)", "→", album_title)
+        compare_table.add_row("Composer (Narrator):", current['composer'] or "(empty)", "→", metadata.get('narrator', ''))
+        compare_table.add_row("Year:", current['year'] or "(empty)", "→", metadata.get('year', '(not found)'))
+    
+        # Add additional fields that will be updated
+        if metadata.get('genre'):
+            compare_table.add_row("Genre:", "(not set)", "→", metadata.get('genre', ''))
+        if metadata.get('publisher'):
+            compare_table.add_row("Publisher:", "(not set)", "→", metadata.get('publisher', ''))
+        if metadata.get('series'):
+            series_info = metadata['series']
+            if metadata.get('series_part'):
+                series_info += f", Book #{metadata['series_part']}"
+            compare_table.add_row("Series:", "(not set)", "→", series_info)
+    
+        console.print(compare_table)
     
         # Ask for confirmation with styled prompt
         try:
@@ -2149,15 +2677,34 @@ def tag_files(files, debug=False, workers=None):
                 console.print("[yellow]Skipping this book[/yellow]")
                 continue  # Skip to next book instead of returning
     
-        # Queue for background tagging
-        tagging_queue.put((group_idx, group, tagger, metadata, metadata.get('cover_url')))
+        # Start the cover download now and queue the book for background tagging
+        cover_download = None
+        cover_url = metadata.get('cover_url')
+        if cover_url:
+            first_file = tagger.files[0]
+            # Remove track numbers and extensions to get base name
+            base_name = _RE_TRACK_SUFFIX.sub('', first_file.stem)
+            base_name = _RE_LEAD_TRACK_NUM.sub('', base_name)
+            base_name = base_name.strip()
+            
+            if base_name and base_name != first_file.stem:
+                cover_filename = f"{base_name} - cover.jpg"
+            else:
+                cover_filename = "cover.jpg"
+            
+            cover_path = first_file.parent / cover_filename
+            if not cover_path.exists():
+                cover_download = cover_pool.submit(download_and_save_cover, cover_url, cover_path, cover_session)
+        tagging_queue.put((group_idx, group, tagger, metadata, cover_download))
         books_queued.append(group['name'])
         
         console.print("\n[green]✓[/green] Metadata collected and queued for tagging")
     
-    # Signal no more books will be added (one sentinel per thread)
+    # Signal no more books will be added (one sentinel per thread); the
+    # taggers wait on every queued download, so the pool can wind down
     for _ in tagger_threads:
         tagging_queue.put(None)
+    cover_pool.shutdown(wait=False)
     
     # Wait for all tagging to complete with progress updates
     if books_queued:
@@ -2166,8 +2713,6 @@ def tag_files(files, debug=False, workers=None):
         console.print(f"[bold cyan]{'━' * 70}[/bold cyan]\n")
         
         # Show progress while waiting
-        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-        
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -2340,7 +2885,29 @@ def tag_files(files, debug=False, workers=None):
     # Tasks are now separate commands, not automatic post-processing
 
 
-@click.group(invoke_without_command=True, context_settings={'help_option_names': ['-h', '--help']})
+class LazyTaskGroup(click.Group):
+    """Command group that builds task commands from audtag.yaml on demand.
+    
+    Built-in commands win over tasks of the same name; a task's command is
+    only constructed when it is invoked or listed in help.
+    """
+    
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(_task_configs()))
+    
+    def get_command(self, ctx, name):
+        command = super().get_command(ctx, name)
+        if command is not None:
+            return command
+        task = _task_configs().get(name)
+        if task is None:
+            return None
+        command = _make_task_command(name, task.get('description', f"Execute {name} task"), task)
+        self.add_command(command)
+        return command
+
+
+@click.group(cls=LazyTaskGroup, invoke_without_command=True, context_settings={'help_option_names': ['-h', '--help']})
 @click.pass_context
 @click.option('--debug', is_flag=True, help='Show debug output')
 def cli(ctx, debug):
@@ -2374,18 +2941,81 @@ def tag(ctx, files, workers):
     tag_files(files, debug, workers)
 
 
+def _read_audio(file_path: Path):
+    """Parse a file for reading only, through a read-only memory map.
+    
+    mutagen seeks and reads in small steps while scanning headers and frames;
+    over a map those are memory copies instead of one syscall each. A map
+    can't seek past its end the way a file can, so empty files and files
+    that fail to parse from the map go through File directly.
+    """
+    if ReadOnlyFile is not None:
+        return ReadOnlyFile(file_path)
+    with open(file_path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return File(mapped, filename=str(file_path))
+        except Exception:
+            pass
+    return File(file_path)
+
+
+def _extract_metadata(file_path: Path) -> Optional[Dict]:
+    """Read the tags and audio properties info displays for one file.
+    
+    Returns None for a file without tags and {'error': ...} when it can't be
+    read, so one bad file never stops the others.
+    """
+    try:
+        audio = _read_audio(file_path)
+        if not audio or not hasattr(audio, 'tags') or not audio.tags:
+            return None
+        
+        # Extract metadata based on format
+        ext = file_path.suffix.lower()
+        metadata = {label: _first_tag_value(audio.tags.get(key)) or ''
+                    for label, key in _INFO_FIELDS_BY_EXT.get(ext, ())}
+        if ext in _MP3_EXTS:
+            # Check for custom tags
+            for field_name in _INFO_TXXX_FIELDS:
+                frame = audio.tags.get(f'TXXX:{field_name}')
+                if frame is not None:
+                    metadata[field_name] = str(frame)
+        elif ext in _MP4_EXTS:
+            trkn = audio.tags.get('trkn')
+            metadata['Track'] = f"{trkn[0][0]}/{trkn[0][1]}" if trkn else ''
+            
+            # Media type
+            if 'stik' in audio.tags:
+                media_type = audio.tags['stik'][0]
+                metadata['Media Type'] = "Audiobook" if media_type == 2 else f"Type {media_type}"
+        
+        # Add audio properties
+        if hasattr(audio.info, 'length'):
+            duration = int(audio.info.length)
+            hours, remainder = divmod(duration, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            metadata['Duration'] = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        if hasattr(audio.info, 'bitrate'):
+            metadata['Bitrate'] = f"{audio.info.bitrate} bps"
+        if hasattr(audio.info, 'sample_rate'):
+            metadata['Sample Rate'] = f"{audio.info.sample_rate} Hz"
+            
+        return metadata
+        
+    except Exception as e:
+        return {'error': str(e)}
+
+
 @cli.command(context_settings={'help_option_names': ['-h', '--help']})
 @click.argument('files', nargs=-1, required=True, type=click.Path(exists=True))
 @click.pass_context
 def info(ctx, files):
     """Show metadata information for audio files."""
     audio_files = []
-    for path in files:
-        path = Path(path)
+    for path in map(Path, files):
         if path.is_dir():
-            for ext in AudiobookTagger.SUPPORTED_FORMATS:
-                audio_files.extend(path.rglob(f'*{ext}'))
-                audio_files.extend(path.rglob(f'*{ext.upper()}'))
+            audio_files.extend(_collect_audio_files(path))
         else:
             if path.suffix.lower() in AudiobookTagger.SUPPORTED_FORMATS:
                 audio_files.append(path)
@@ -2396,160 +3026,103 @@ def info(ctx, files):
         console.print(f"[red]No supported audio files found![/red]")
         return
     
-    # First, collect all file metadata
-    file_metadata = {}
-    
-    for file_path in sorted(audio_files):
+    # First, collect all file metadata. The walk already lists each directory
+    # in name order, so files keep argument order without a global sort.
+    # Hardlinks of one file read the same, so each inode is parsed once
+    # through the first path seen for it
+    readers_by_inode = {}
+    readers = []
+    for file_path in audio_files:
         try:
-            audio = File(file_path)
-            if not audio or not hasattr(audio, 'tags') or not audio.tags:
-                file_metadata[file_path] = None
-                continue
-            
-            # Extract metadata based on format
-            metadata = {}
-            if file_path.suffix.lower() == '.mp3':
-                metadata['Title'] = str(audio.tags.get('TIT2', [''])[0]) if audio.tags.get('TIT2') else ''
-                metadata['Artist'] = str(audio.tags.get('TPE1', [''])[0]) if audio.tags.get('TPE1') else ''
-                metadata['Album'] = str(audio.tags.get('TALB', [''])[0]) if audio.tags.get('TALB') else ''
-                metadata['Album Artist'] = str(audio.tags.get('TPE2', [''])[0]) if audio.tags.get('TPE2') else ''
-                metadata['Composer (Narrator)'] = str(audio.tags.get('TCOM', [''])[0]) if audio.tags.get('TCOM') else ''
-                metadata['Genre'] = str(audio.tags.get('TCON', [''])[0]) if audio.tags.get('TCON') else ''
-                metadata['Year'] = str(audio.tags.get('TDRC', [''])[0]) if audio.tags.get('TDRC') else ''
-                metadata['Publisher'] = str(audio.tags.get('TPUB', [''])[0]) if audio.tags.get('TPUB') else ''
-                metadata['Track'] = str(audio.tags.get('TRCK', [''])[0]) if audio.tags.get('TRCK') else ''
-                
-                # Check for custom tags
-                for tag_key, tag_value in audio.tags.items():
-                    if tag_key.startswith('TXXX:'):
-                        field_name = tag_key[5:]
-                        if field_name in ['ASIN', 'SERIES', 'SERIES-PART', 'ITUNESMEDIATYPE']:
-                            metadata[field_name] = str(tag_value)
-                            
-            elif file_path.suffix.lower() in ['.m4b', '.m4a', '.aac']:
-                metadata['Title'] = audio.tags.get('\xa9nam', [''])[0] or '' if '\xa9nam' in audio.tags else ''
-                metadata['Artist'] = audio.tags.get('\xa9ART', [''])[0] or '' if '\xa9ART' in audio.tags else ''
-                metadata['Album'] = audio.tags.get('\xa9alb', [''])[0] or '' if '\xa9alb' in audio.tags else ''
-                metadata['Album Artist'] = audio.tags.get('aART', [''])[0] or '' if 'aART' in audio.tags else ''
-                metadata['Composer (Narrator)'] = audio.tags.get('\xa9wrt', [''])[0] or '' if '\xa9wrt' in audio.tags else ''
-                metadata['Genre'] = audio.tags.get('\xa9gen', [''])[0] or '' if '\xa9gen' in audio.tags else ''
-                metadata['Year'] = audio.tags.get('\xa9day', [''])[0] or '' if '\xa9day' in audio.tags else ''
-                metadata['Publisher'] = audio.tags.get('\xa9pub', [''])[0] or '' if '\xa9pub' in audio.tags else ''
-                metadata['Track'] = f"{audio.tags.get('trkn', [(0,0)])[0][0]}/{audio.tags.get('trkn', [(0,0)])[0][1]}" if 'trkn' in audio.tags else ''
-                
-                # Media type
-                if 'stik' in audio.tags:
-                    media_type = audio.tags['stik'][0]
-                    media_type_str = "Audiobook" if media_type == 2 else f"Type {media_type}"
-                    metadata['Media Type'] = media_type_str
-                    
-            elif file_path.suffix.lower() in ['.ogg', '.oga', '.opus', '.flac']:
-                metadata['Title'] = audio.tags.get('title', [''])[0] or '' if 'title' in audio.tags else ''
-                metadata['Artist'] = audio.tags.get('artist', [''])[0] or '' if 'artist' in audio.tags else ''
-                metadata['Album'] = audio.tags.get('album', [''])[0] or '' if 'album' in audio.tags else ''
-                metadata['Album Artist'] = audio.tags.get('albumartist', [''])[0] or '' if 'albumartist' in audio.tags else ''
-                metadata['Composer (Narrator)'] = audio.tags.get('composer', [''])[0] or '' if 'composer' in audio.tags else ''
-                metadata['Genre'] = audio.tags.get('genre', [''])[0] or '' if 'genre' in audio.tags else ''
-                metadata['Date'] = audio.tags.get('date', [''])[0] or '' if 'date' in audio.tags else ''
-                metadata['Publisher'] = audio.tags.get('publisher', [''])[0] or '' if 'publisher' in audio.tags else ''
-            
-            # Add audio properties
-            if hasattr(audio.info, 'length'):
-                duration = int(audio.info.length)
-                hours, remainder = divmod(duration, 3600)
-                minutes, seconds = divmod(remainder, 60)
-                metadata['Duration'] = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            if hasattr(audio.info, 'bitrate'):
-                metadata['Bitrate'] = f"{audio.info.bitrate} bps"
-            if hasattr(audio.info, 'sample_rate'):
-                metadata['Sample Rate'] = f"{audio.info.sample_rate} Hz"
-                
-            file_metadata[file_path] = metadata
-            
-        except Exception as e:
-            file_metadata[file_path] = {'error': str(e)}
+            stat = file_path.stat()
+            identity = (stat.st_dev, stat.st_ino)
+        except OSError:
+            identity = file_path
+        readers.append(readers_by_inode.setdefault(identity, file_path))
+    
+    # Reads are independent, so they run on a thread pool, with a single
+    # thread hinting the file heads to the page cache ahead of the parsers
+    unique_files = list(readers_by_inode.values())
+    threading.Thread(target=_prefetch_tag_regions, args=(unique_files,), daemon=True).start()
+    with ThreadPoolExecutor(max_workers=min(get_optimal_workers(), len(unique_files))) as executor:
+        parsed = dict(zip(unique_files, executor.map(_extract_metadata, unique_files)))
+    file_metadata = {file_path: parsed[reader] for file_path, reader in zip(audio_files, readers)}
     
     # Now group files by their tag signatures (excluding Track and Duration which vary per file)
-    tag_groups = {}
+    tag_groups = defaultdict(list)
+    no_tags = []
+    errors = []
     
     for file_path, metadata in file_metadata.items():
         if metadata is None:
-            # No tags found
-            if 'no_tags' not in tag_groups:
-                tag_groups['no_tags'] = []
-            tag_groups['no_tags'].append(file_path)
+            no_tags.append(file_path)
         elif 'error' in metadata:
-            # Error reading
-            if 'error' not in tag_groups:
-                tag_groups['error'] = []
-            tag_groups['error'].append((file_path, metadata['error']))
+            errors.append((file_path, metadata['error']))
         else:
             # Create a signature from the metadata (excluding file-specific fields)
-            signature_fields = ['Title', 'Artist', 'Album', 'Album Artist', 'Composer (Narrator)', 
-                              'Genre', 'Year', 'Publisher', 'SERIES', 'ITUNESMEDIATYPE']
-            signature = tuple(metadata.get(field, '') for field in signature_fields)
-            
-            if signature not in tag_groups:
-                tag_groups[signature] = []
+            signature = _SIG_GETTER({**_EMPTY_SIG, **metadata})
             tag_groups[signature].append(file_path)
     
-    # Display the grouped information
-    for signature, file_paths in tag_groups.items():
-        if signature == 'no_tags':
-            console.print(f"\n[bold yellow]Files with no tags:[/bold yellow]")
+    # Display the grouped information, rendered and written in one go
+    output = []
+    for file_paths in tag_groups.values():
+        # Regular files with tags
+        if len(file_paths) > 1:
+            # Multiple files with same tags - show grouped
+            output.append(f"\n[bold cyan]Files: {len(file_paths)} files with identical tags[/bold cyan]")
+            output.append("[dim]" + ", ".join(f.name for f in file_paths[:5]) + 
+                         (" ..." if len(file_paths) > 5 else "") + "[/dim]")
+        else:
+            # Single file
+            output.append(f"\n[bold cyan]File: {file_paths[0].name}[/bold cyan]")
+            output.append(f"[dim]Path: {file_paths[0]}[/dim]")
+        
+        # Show the metadata table
+        metadata = file_metadata[file_paths[0]]
+        tag_table = Table(show_header=False, box=None, padding=(0, 2))
+        tag_table.add_column("Field", style="cyan", width=25)
+        tag_table.add_column("Value", style="white")
+        
+        # Show common tags
+        for field in ['Title', 'Artist', 'Album', 'Album Artist', 'Composer (Narrator)', 
+                     'Genre', 'Year', 'Publisher', 'SERIES', 'SERIES-PART', 'ITUNESMEDIATYPE', 
+                     'Media Type', 'ASIN']:
+            if field in metadata and metadata[field]:
+                tag_table.add_row(f"{field}:", metadata[field])
+        
+        # For grouped files, show track numbers as a range
+        if len(file_paths) > 1:
+            tracks = []
             for fp in file_paths:
-                console.print(f"  • {fp.name}")
-        elif signature == 'error':
-            console.print(f"\n[bold red]Files with errors:[/bold red]")
-            for fp, error in file_paths:
-                console.print(f"  • {fp.name}: {error}")
+                if fp in file_metadata and 'Track' in file_metadata[fp]:
+                    tracks.append(file_metadata[fp]['Track'])
+            if tracks:
+                tag_table.add_row("Tracks:", f"{tracks[0]} to {tracks[-1]}")
         else:
-            # Regular files with tags
-            if len(file_paths) > 1:
-                # Multiple files with same tags - show grouped
-                console.print(f"\n[bold cyan]Files: {len(file_paths)} files with identical tags[/bold cyan]")
-                console.print("[dim]" + ", ".join(f.name for f in file_paths[:5]) + 
-                             (" ..." if len(file_paths) > 5 else "") + "[/dim]")
-            else:
-                # Single file
-                console.print(f"\n[bold cyan]File: {file_paths[0].name}[/bold cyan]")
-                console.print(f"[dim]Path: {file_paths[0]}[/dim]")
-            
-            # Show the metadata table
-            metadata = file_metadata[file_paths[0]]
-            tag_table = Table(show_header=False, box=None, padding=(0, 2))
-            tag_table.add_column("Field", style="cyan", width=25)
-            tag_table.add_column("Value", style="white")
+            # Single file - show its track
+            if 'Track' in metadata and metadata['Track']:
+                tag_table.add_row("Track:", metadata['Track'])
+        
+        # Show audio properties (these might vary slightly)
+        if 'Duration' in metadata:
+            tag_table.add_row("Duration:", metadata['Duration'])
+        if 'Bitrate' in metadata:
+            tag_table.add_row("Bitrate:", metadata['Bitrate'])
+        if 'Sample Rate' in metadata:
+            tag_table.add_row("Sample Rate:", metadata['Sample Rate'])
             
-            # Show common tags
-            for field in ['Title', 'Artist', 'Album', 'Album Artist', 'Composer (Narrator)', 
-                         'Genre', 'Year', 'Publisher', 'SERIES', 'SERIES-PART', 'ITUNESMEDIATYPE', 
-                         'Media Type', 'ASIN']:
-                if field in metadata and metadata[field]:
-                    tag_table.add_row(f"{field}:", metadata[field])
-            
-            # For grouped files, show track numbers as a range
-            if len(file_paths) > 1:
-                tracks = []
-                for fp in file_paths:
-                    if fp in file_metadata and 'Track' in file_metadata[fp]:
-                        tracks.append(file_metadata[fp]['Track'])
-                if tracks:
-                    tag_table.add_row("Tracks:", f"{tracks[0]} to {tracks[-1]}")
-            else:
-                # Single file - show its track
-                if 'Track' in metadata and metadata['Track']:
-                    tag_table.add_row("Track:", metadata['Track'])
-            
-            # Show audio properties (these might vary slightly)
-            if 'Duration' in metadata:
-                tag_table.add_row("Duration:", metadata['Duration'])
-            if 'Bitrate' in metadata:
-                tag_table.add_row("Bitrate:", metadata['Bitrate'])
-            if 'Sample Rate' in metadata:
-                tag_table.add_row("Sample Rate:", metadata['Sample Rate'])
-                
-            console.print(tag_table)
+        output.append(tag_table)
+
+    if no_tags:
+        output.append(f"\n[bold yellow]Files with no tags:[/bold yellow]")
+        for fp in no_tags:
+            output.append(f"  • {fp.name}")
+    if errors:
+        output.append(f"\n[bold red]Files with errors:[/bold red]")
+        for fp, error in errors:
+            output.append(f"  • {fp.name}: {error}")
+    
+    console.print(Group(*output))
 
 
 def group_files_for_prep(audio_files):
@@ -2562,24 +3135,13 @@ def group_files_for_prep(audio_files):
 
     Returns a dict mapping group_name -> list of file paths
     """
-    from difflib import SequenceMatcher
-    from collections import defaultdict
-
     def get_album_from_file(file_path):
         """Extract album name from audio file metadata."""
         try:
             audio = File(file_path)
             if audio and hasattr(audio, 'tags') and audio.tags:
-                if file_path.suffix.lower() == '.mp3':
-                    album = str(audio.tags.get('TALB', [''])[0]) if audio.tags.get('TALB') else None
-                elif file_path.suffix.lower() in ['.m4b', '.m4a', '.aac']:
-                    album = audio.tags.get('\xa9alb', [None])[0] if '\xa9alb' in audio.tags else None
-                elif file_path.suffix.lower() in ['.ogg', '.oga', '.opus']:
-                    album = audio.get('album', [None])[0] if 'album' in audio else None
-                elif file_path.suffix.lower() == '.flac':
-                    album = audio.get('album', [None])[0] if 'album' in audio else None
-                else:
-                    album = None
+                album_key = _ALBUM_KEY_BY_EXT.get(file_path.suffix.lower())
+                album = _first_tag_value(audio.tags.get(album_key)) if album_key else None
 
                 if album and album.strip():
                     return album.strip()
@@ -2594,12 +3156,12 @@ def group_files_for_prep(audio_files):
         but preserves numbers that are part of the book name (e.g., book1 vs book2).
         """
         # Remove extension
-        name = re.sub(r'\.(mp3|m4b|m4a|aac|ogg|oga|opus|flac)$', '', name, flags=re.IGNORECASE)
+        name = _RE_AUDIO_EXT.sub('', name)
         # Remove trailing part indicators with separator (e.g., -a, -b, _1, _part1, -chapter2)
-        name = re.sub(r'[-_\s]+(part|pt|ch|chapter|track|cd|disc)[-_\s]*\d*$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'[-_\s]+[a-z]$', '', name, flags=re.IGNORECASE)  # trailing single letter after separator
+        name = _RE_GROUP_PART.sub('', name)
+        name = _RE_TRAIL_LETTER.sub('', name)  # trailing single letter after separator
         # Normalize separators
-        name = re.sub(r'[-_\s]+', ' ', name)
+        name = _RE_SEP_RUN.sub(' ', name)
         return name.strip().lower()
 
     def get_base_name(name):
@@ -2608,18 +3170,14 @@ def group_files_for_prep(audio_files):
         Similar to normalize but returns original casing for directory name.
         """
         # Remove extension
-        name = re.sub(r'\.(mp3|m4b|m4a|aac|ogg|oga|opus|flac)$', '', name, flags=re.IGNORECASE)
+        name = _RE_AUDIO_EXT.sub('', name)
         # Remove trailing part indicators with separator
-        name = re.sub(r'[-_\s]+(part|pt|ch|chapter|track|cd|disc)[-_\s]*[a-z0-9]*$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'[-_\s]+[a-z]$', '', name, flags=re.IGNORECASE)  # trailing single letter after separator
+        name = _RE_BASE_PART.sub('', name)
+        name = _RE_TRAIL_LETTER.sub('', name)  # trailing single letter after separator
         # Clean up
-        name = re.sub(r'[-_\s]+', ' ', name)
+        name = _RE_SEP_RUN.sub(' ', name)
         return name.strip()
 
-    def get_similarity(text1, text2):
-        """Get similarity ratio between two strings."""
-        return SequenceMatcher(None, text1, text2).ratio()
-
     # First, try to group by album metadata
     files_by_album = defaultdict(list)
     files_without_album = []
@@ -2628,8 +3186,8 @@ def group_files_for_prep(audio_files):
         album = get_album_from_file(file_path)
         if album:
             # Sanitize album name for use as directory name
-            safe_album = re.sub(r'[<>:"/\\|?*]', '_', album)
-            safe_album = re.sub(r'\s+', ' ', safe_album).strip()
+            safe_album = album.translate(_UNSAFE_PATH_CHARS)
+            safe_album = _RE_WS.sub(' ', safe_album).strip()
             files_by_album[safe_album].append(file_path)
         else:
             files_without_album.append(file_path)
@@ -2654,7 +3212,7 @@ def group_files_for_prep(audio_files):
         if not matched and len(normalized) > 10:
             for group_name in list(files_by_name.keys()):
                 existing_normalized = normalize_filename(group_name)
-                if len(existing_normalized) > 10 and get_similarity(normalized, existing_normalized) >= 0.85:
+                if len(existing_normalized) > 10 and _similarity(normalized, existing_normalized, 0.85) >= 0.85:
                     files_by_name[group_name].append(file_path)
                     matched = True
                     break
@@ -2682,9 +3240,9 @@ def group_files_for_prep(audio_files):
 def sanitize_dirname(name):
     """Sanitize a name for use as a directory name."""
     # Replace problematic characters
-    name = re.sub(r'[<>:"/\\|?*]', '_', name)
+    name = name.translate(_UNSAFE_PATH_CHARS)
     # Clean up multiple spaces/underscores
-    name = re.sub(r'[\s_]+', ' ', name)
+    name = _RE_SPACE_RUN.sub(' ', name)
     # Remove leading/trailing spaces, dots, underscores
     name = name.strip('. _')
     return name
@@ -2705,9 +3263,7 @@ def prep_files(files, dry_run=False, yes=False):
                     console.print(f"[yellow]Warning: {path.name} is not a supported audio format[/yellow]")
             elif path.is_dir():
                 # Only process files directly in the directory, not recursively
-                for ext in AudiobookTagger.SUPPORTED_FORMATS:
-                    audio_files.extend(path.glob(f'*{ext}'))
-                    audio_files.extend(path.glob(f'*{ext.upper()}'))
+                audio_files.extend(_scan_files(path, AudiobookTagger.SUPPORTED_FORMATS, recursive=False))
 
     if not audio_files:
         console.print("[red]No supported audio files found![/red]")
@@ -2784,8 +3340,6 @@ def prep_files(files, dry_run=False, yes=False):
             return
 
     # Perform moves
-    import shutil
-
     moved_count = 0
     errors = []
 
@@ -2835,220 +3389,205 @@ def prep(ctx, files, dry_run, yes):
 
 
 # Dynamically register task commands from configuration
-def register_task_commands():
-    """Register task commands from audtag.yaml configuration."""
+# Sample tag values used to render the pattern examples in task help
+_EXAMPLE_VALUES = {
+    'artist': 'Brandon Sanderson',
+    'album': 'The Way of Kings',
+    'title': 'Chapter 1 - Stormblessed',
+    'track': 1,
+    'year': '2010',
+    'filename': 'audiobook',
+    'ext': 'm4b',
+}
+
+
+class _Placeholder:
+    """Stands in for a pattern variable without an example value; renders as written."""
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    def __format__(self, spec: str) -> str:
+        return f"{{{self.name}:{spec}}}" if spec else f"{{{self.name}}}"
+
+
+class _ExampleValues(dict):
+    def __missing__(self, key):
+        return _Placeholder(key)
+
+
+def _render_example(template: str, **values) -> str:
+    """Fill a task pattern with the sample values in one pass."""
+    try:
+        return template.format_map(_ExampleValues(_EXAMPLE_VALUES, **values))
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        # Patterns the example can't render are shown unchanged
+        return template
+
+
+@lru_cache(maxsize=8)
+def _get_task_system(config_path: Optional[str] = None, debug: bool = False) -> 'TaskSystem':
+    """Load the task configuration once per config path and debug setting."""
+    return TaskSystem(config_path=config_path, debug=debug)
+
+
+def _task_configs() -> Dict[str, Dict]:
+    """Task definitions from audtag.yaml keyed by name; empty if unavailable."""
     if not TASK_SYSTEM_AVAILABLE:
-        return
-        
+        return {}
     try:
-        # Load task configuration
-        task_system = TaskSystem()
-        tasks = task_system.get_available_tasks()
+        tasks = _get_task_system().get_available_tasks()
+    except Exception:
+        # Silently fail - tasks just won't be available
+        return {}
+    return {task['name']: task for task in tasks if task.get('name')}
+
+
+def _make_task_command(name: str, desc: str, task_config: Dict) -> click.Command:
+    """Build the CLI command that runs one configured task."""
+    # Build short help text for the command listing
+    short_help = desc
+    
+    # Build epilog text with task configuration details
+    epilog = "\n\b\nTask Configuration:\n\b\n"
+    epilog += f"Name: {task_config.get('name', 'N/A')}\n"
+    
+    if task_config.get('destination'):
+        epilog += f"Destination: {task_config.get('destination')}\n"
+    if task_config.get('naming_pattern'):
+        epilog += f"Naming Pattern: {task_config.get('naming_pattern')}\n"
+    
+    # Add example showing how patterns work
+    epilog += "\n\b\nExample:\n\b\n"
+    epilog += "Given a file with these tags:\n"
+    epilog += "  Artist: Brandon Sanderson\n"
+    epilog += "  Album: The Way of Kings\n" 
+    epilog += "  Title: Chapter 1 - Stormblessed\n"
+    epilog += "  Track: 1\n"
+    epilog += "\n"
+    
+    if name == 'move' and task_config.get('destination'):
+        example_dest = _render_example(task_config['destination'], date=datetime(2024, 1, 15))
+        example_name = _render_example(task_config.get('naming_pattern', '{filename}.{ext}'))
+        epilog += f"Would move to: {example_dest}{example_name}\n"
+        
+    elif name == 'copy' and task_config.get('destination'):
+        example_dest = _render_example(task_config['destination'], date=datetime.now())
+        example_name = _render_example(task_config.get('naming_pattern', '{filename}.{ext}'))
+        epilog += f"Would copy to: {example_dest}{example_name}\n"
+        
+    elif name == 'rename' and task_config.get('naming_pattern'):
+        example_name = _render_example(task_config['naming_pattern'])
+        epilog += f"Would rename to: {example_name}\n"
+    
+    epilog += "\n\b\nPattern Variables:\n\b\n"
+    epilog += "{artist}       - Artist/Author name\n"
+    epilog += "{album}        - Album/Book title\n"
+    epilog += "{title}        - Track/Chapter title\n"
+    epilog += "{track}        - Track number\n"
+    epilog += "{track:02d}    - Track with zero padding\n"
+    epilog += "{year}         - Year\n"
+    epilog += "{genre}        - Genre\n"
+    epilog += "{composer}     - Composer/Narrator\n"
+    epilog += "{filename}     - Original filename\n"
+    epilog += "{ext}          - File extension\n"
+    epilog += "{date:%Y-%m-%d} - Current date"
+    
+    @click.command(name=name, short_help=short_help, epilog=epilog,
+                   context_settings={'help_option_names': ['-h', '--help'], 
+                                     'max_content_width': 120})
+    @click.argument('files', nargs=-1, required=True, type=click.Path(exists=True))
+    @click.option('--dry-run', '-n', is_flag=True, help='Show what would be done without doing it')
+    @click.option('--config', '-c', type=click.Path(exists=True), default=None, 
+                help='Path to task configuration file (default: ~/audtag.yaml or ./audtag.yaml)')
+    @click.pass_context
+    def task_command(ctx, files, dry_run, config):
+        debug = ctx.obj.get('debug', False) if ctx.obj else False
+        
+        # Collect audio files and cover images silently
+        audio_files = []
+        for path in files:
+            path = Path(path)
+            if path.is_dir():
+                # Collect audio files
+                audio_files.extend(_collect_audio_files(path))
+                
+                # For move task, also collect cover images
+                if name == 'move':
+                    # Look for any image files with 'cover' in the name (case insensitive)
+                    cover_images = [img for img in _scan_files(path, _COVER_IMAGE_EXTS)
+                                    if 'cover' in img.stem.lower()]
+                    if debug and cover_images:
+                        console.print(f"[dim]Debug: Found {len(cover_images)} cover images[/dim]")
+                        for img in cover_images:
+                            console.print(f"[dim]  - {img.name}[/dim]")
+                    audio_files.extend(cover_images)
+            else:
+                if path.suffix.lower() in AudiobookTagger.SUPPORTED_FORMATS:
+                    audio_files.append(path)
+                # For move task, also include cover images
+                elif name == 'move' and path.suffix.lower() in _COVER_IMAGE_EXTS and 'cover' in path.stem.lower():
+                    audio_files.append(path)
+                else:
+                    console.print(f"[yellow]Warning: {path.name} is not a supported audio format[/yellow]")
         
-        for task in tasks:
-            task_name = task.get('name')
-            task_description = task.get('description', f"Execute {task_name} task")
+        if not audio_files:
+            console.print(f"[red]No files found in: {', '.join(files)}[/red]")
+            if name == 'move':
+                console.print(f"[dim]Looking for audio files and cover images[/dim]")
+            else:
+                console.print(f"[dim]Supported formats: {', '.join(sorted(AudiobookTagger.SUPPORTED_FORMATS))}[/dim]")
+            return
+        
+        # Sort files to ensure cover images come after audio files
+        audio_files.sort(key=lambda f: (f.parent, f.suffix.lower() in _COVER_IMAGE_EXTS, f.name))
+        
+        # For move/copy tasks, use smart grouping to keep related files together
+        if name in ['move', 'copy']:
+            # Separate audio files from cover images
+            audio_only = [f for f in audio_files if f.suffix.lower() not in _COVER_IMAGE_EXTS]
+            cover_images = [f for f in audio_files if f.suffix.lower() in _COVER_IMAGE_EXTS]
             
-            # Create a command function for this task
-            def make_task_command(name, desc, task_config):
-                # Build short help text for the command listing
-                short_help = desc
-                
-                # Build epilog text with task configuration details
-                epilog = "\n\b\nTask Configuration:\n\b\n"
-                epilog += f"Name: {task_config.get('name', 'N/A')}\n"
+            if audio_only:
+                # Group audio files by book
+                with console.status("[cyan]Analyzing files and grouping by book...[/cyan]", spinner="dots"):
+                    book_groups = group_files_by_book(audio_only)
                 
-                if task_config.get('destination'):
-                    epilog += f"Destination: {task_config.get('destination')}\n"
-                if task_config.get('naming_pattern'):
-                    epilog += f"Naming Pattern: {task_config.get('naming_pattern')}\n"
-                
-                # Add example showing how patterns work
-                epilog += "\n\b\nExample:\n\b\n"
-                epilog += "Given a file with these tags:\n"
-                epilog += "  Artist: Brandon Sanderson\n"
-                epilog += "  Album: The Way of Kings\n" 
-                epilog += "  Title: Chapter 1 - Stormblessed\n"
-                epilog += "  Track: 1\n"
-                epilog += "\n"
+                # Show what we found if there are multiple groups
+                if len(book_groups) > 1:
+                    total_files = sum(len(group['files']) for group in book_groups)
+                    console.print(f"\n[cyan]Found {len(book_groups)} books, {total_files} files total:[/cyan]")
+                    for i, group in enumerate(book_groups, 1):
+                        console.print(f"  {i}. [yellow]{group['name']}[/yellow] ({len(group['files'])} file{'s' if len(group['files']) > 1 else ''})")
+                    console.print()
                 
-                if name == 'move' and task_config.get('destination'):
-                    example_dest = task_config.get('destination')
-                    example_dest = example_dest.replace('{artist}', 'Brandon Sanderson')
-                    example_dest = example_dest.replace('{album}', 'The Way of Kings')
-                    example_dest = example_dest.replace('{date:%Y-%m-%d}', '2024-01-15')
-                    
-                    example_name = task_config.get('naming_pattern', '{filename}.{ext}')
-                    example_name = example_name.replace('{artist}', 'Brandon Sanderson')
-                    example_name = example_name.replace('{album}', 'The Way of Kings')
-                    example_name = example_name.replace('{title}', 'Chapter 1 - Stormblessed')
-                    example_name = example_name.replace('{track}', '1')
-                    example_name = example_name.replace('{track:02d}', '01')
-                    example_name = example_name.replace('{track:03d}', '001')
-                    example_name = example_name.replace('{year}', '2010')
-                    example_name = example_name.replace('{filename}', 'audiobook')
-                    example_name = example_name.replace('{ext}', 'm4b')
-                    
-                    epilog += f"Would move to: {example_dest}{example_name}\n"
+                # Process each book group separately
+                for group in book_groups:
+                    group_files = group['files']
                     
-                elif name == 'copy' and task_config.get('destination'):
-                    example_dest = task_config.get('destination')
-                    example_dest = example_dest.replace('{artist}', 'Brandon Sanderson')
-                    example_dest = example_dest.replace('{album}', 'The Way of Kings')
-                    from datetime import datetime
-                    example_dest = example_dest.replace('{date:%Y-%m-%d}', datetime.now().strftime('%Y-%m-%d'))
+                    # Add cover images from the same directories as the group files
+                    group_dirs = set(f.parent for f in group_files)
+                    group_covers = [img for img in cover_images if img.parent in group_dirs]
                     
-                    example_name = task_config.get('naming_pattern', '{filename}.{ext}')
-                    example_name = example_name.replace('{artist}', 'Brandon Sanderson')
-                    example_name = example_name.replace('{album}', 'The Way of Kings')
-                    example_name = example_name.replace('{title}', 'Chapter 1 - Stormblessed')
-                    example_name = example_name.replace('{track}', '1')
-                    example_name = example_name.replace('{track:02d}', '01')
-                    example_name = example_name.replace('{track:03d}', '001')
-                    example_name = example_name.replace('{year}', '2010')
-                    example_name = example_name.replace('{filename}', 'audiobook')
-                    example_name = example_name.replace('{ext}', 'm4b')
-                    
-                    epilog += f"Would copy to: {example_dest}{example_name}\n"
-                    
-                elif name == 'rename' and task_config.get('naming_pattern'):
-                    example_name = task_config.get('naming_pattern')
-                    example_name = example_name.replace('{artist}', 'Brandon Sanderson')
-                    example_name = example_name.replace('{album}', 'The Way of Kings')
-                    example_name = example_name.replace('{title}', 'Chapter 1 - Stormblessed')
-                    example_name = example_name.replace('{track}', '1')
-                    example_name = example_name.replace('{track:02d}', '01')
-                    example_name = example_name.replace('{track:03d}', '001')
-                    example_name = example_name.replace('{year}', '2010')
-                    example_name = example_name.replace('{filename}', 'audiobook')
-                    example_name = example_name.replace('{ext}', 'm4b')
-                    
-                    epilog += f"Would rename to: {example_name}\n"
-                
-                epilog += "\n\b\nPattern Variables:\n\b\n"
-                epilog += "{artist}       - Artist/Author name\n"
-                epilog += "{album}        - Album/Book title\n"
-                epilog += "{title}        - Track/Chapter title\n"
-                epilog += "{track}        - Track number\n"
-                epilog += "{track:02d}    - Track with zero padding\n"
-                epilog += "{year}         - Year\n"
-                epilog += "{genre}        - Genre\n"
-                epilog += "{composer}     - Composer/Narrator\n"
-                epilog += "{filename}     - Original filename\n"
-                epilog += "{ext}          - File extension\n"
-                epilog += "{date:%Y-%m-%d} - Current date"
-                
-                @cli.command(name=name, short_help=short_help, epilog=epilog,
-                           context_settings={'help_option_names': ['-h', '--help'], 
-                                           'max_content_width': 120})
-                @click.argument('files', nargs=-1, required=True, type=click.Path(exists=True))
-                @click.option('--dry-run', '-n', is_flag=True, help='Show what would be done without doing it')
-                @click.option('--config', '-c', type=click.Path(exists=True), default=None, 
-                            help='Path to task configuration file (default: ~/audtag.yaml or ./audtag.yaml)')
-                @click.pass_context
-                def task_command(ctx, files, dry_run, config):
-                    debug = ctx.obj.get('debug', False) if ctx.obj else False
-                    
-                    # Collect audio files and cover images silently
-                    audio_files = []
-                    for path in files:
-                        path = Path(path)
-                        if path.is_dir():
-                            # Collect audio files
-                            for ext in AudiobookTagger.SUPPORTED_FORMATS:
-                                matches = list(path.rglob(f'*{ext}'))
-                                audio_files.extend(matches)
-                                matches = list(path.rglob(f'*{ext.upper()}'))
-                                audio_files.extend(matches)
-                            
-                            # For move task, also collect cover images
-                            if name == 'move':
-                                # Look for any image files with 'cover' in the name
-                                for ext in ['.jpg', '.jpeg', '.png']:
-                                    # Find all image files with the extension
-                                    all_images = list(path.rglob(f'*{ext}'))
-                                    # Filter for ones with 'cover' in the name (case insensitive)
-                                    cover_images = [img for img in all_images if 'cover' in img.stem.lower()]
-                                    if debug and cover_images:
-                                        console.print(f"[dim]Debug: Found {len(cover_images)} cover images with extension {ext}[/dim]")
-                                        for img in cover_images:
-                                            console.print(f"[dim]  - {img.name}[/dim]")
-                                    audio_files.extend(cover_images)
-                        else:
-                            if path.suffix.lower() in AudiobookTagger.SUPPORTED_FORMATS:
-                                audio_files.append(path)
-                            # For move task, also include cover images
-                            elif name == 'move' and path.suffix.lower() in ['.jpg', '.jpeg', '.png'] and 'cover' in path.stem.lower():
-                                audio_files.append(path)
-                            else:
-                                console.print(f"[yellow]Warning: {path.name} is not a supported audio format[/yellow]")
+                    # Combine audio files and their covers
+                    all_group_files = group_files + group_covers
+                    all_group_files.sort(key=lambda f: (f.parent, f.suffix.lower() in _COVER_IMAGE_EXTS, f.name))
                     
-                    if not audio_files:
-                        console.print(f"[red]No files found in: {', '.join(files)}[/red]")
-                        if name == 'move':
-                            console.print(f"[dim]Looking for audio files and cover images[/dim]")
-                        else:
-                            console.print(f"[dim]Supported formats: {', '.join(sorted(AudiobookTagger.SUPPORTED_FORMATS))}[/dim]")
-                        return
-                    
-                    # Sort files to ensure cover images come after audio files
-                    audio_files.sort(key=lambda f: (f.parent, f.suffix.lower() in ['.jpg', '.jpeg', '.png'], f.name))
-                    
-                    # For move/copy tasks, use smart grouping to keep related files together
-                    if name in ['move', 'copy']:
-                        # Separate audio files from cover images
-                        audio_only = [f for f in audio_files if f.suffix.lower() not in ['.jpg', '.jpeg', '.png']]
-                        cover_images = [f for f in audio_files if f.suffix.lower() in ['.jpg', '.jpeg', '.png']]
-                        
-                        if audio_only:
-                            # Group audio files by book
-                            with console.status("[cyan]Analyzing files and grouping by book...[/cyan]", spinner="dots"):
-                                book_groups = group_files_by_book(audio_only)
-                            
-                            # Show what we found if there are multiple groups
-                            if len(book_groups) > 1:
-                                total_files = sum(len(group['files']) for group in book_groups)
-                                console.print(f"\n[cyan]Found {len(book_groups)} books, {total_files} files total:[/cyan]")
-                                for i, group in enumerate(book_groups, 1):
-                                    console.print(f"  {i}. [yellow]{group['name']}[/yellow] ({len(group['files'])} file{'s' if len(group['files']) > 1 else ''})")
-                                console.print()
-                            
-                            # Process each book group separately
-                            for group in book_groups:
-                                group_files = group['files']
-                                
-                                # Add cover images from the same directories as the group files
-                                group_dirs = set(f.parent for f in group_files)
-                                group_covers = [img for img in cover_images if img.parent in group_dirs]
-                                
-                                # Combine audio files and their covers
-                                all_group_files = group_files + group_covers
-                                all_group_files.sort(key=lambda f: (f.parent, f.suffix.lower() in ['.jpg', '.jpeg', '.png'], f.name))
-                                
-                                # Execute the task for this group
-                                task_system = TaskSystem(config_path=config, debug=debug)
-                                task_system.execute_task(name, all_group_files, dry_run=dry_run, group_name=group.get('name'))
-                        else:
-                            # No audio files, just process cover images if any
-                            if cover_images:
-                                task_system = TaskSystem(config_path=config, debug=debug)
-                                task_system.execute_task(name, cover_images, dry_run=dry_run)
-                    else:
-                        # For other tasks (rename, etc.), process all files together
-                        task_system = TaskSystem(config_path=config, debug=debug)
-                        task_system.execute_task(name, audio_files, dry_run=dry_run)
-                
-                return task_command
-            
-            # Register the command
-            make_task_command(task_name, task_description, task)
-            
-    except Exception as e:
-        # Silently fail - tasks just won't be available
-        pass
+                    # Execute the task for this group
+                    task_system = _get_task_system(config, debug)
+                    task_system.execute_task(name, all_group_files, dry_run=dry_run, group_name=group.get('name'))
+            else:
+                # No audio files, just process cover images if any
+                if cover_images:
+                    task_system = _get_task_system(config, debug)
+                    task_system.execute_task(name, cover_images, dry_run=dry_run)
+        else:
+            # For other tasks (rename, etc.), process all files together
+            task_system = _get_task_system(config, debug)
+            task_system.execute_task(name, audio_files, dry_run=dry_run)
+    
+    return task_command
 
-# Register task commands on module load
-register_task_commands()
 
 if __name__ == '__main__':
     cli()
\ No newline at end of file
@@ -7,6 +7,7 @@ Supports move, copy, and rename operations with configurable patterns.
 import os
 import re
 import shutil
+import stat
 import yaml
 import hashlib
 from datetime import datetime
@@ -18,6 +19,23 @@ from mutagen import File
 
 console = Console()
 
+# Patterns used while reading names and filling in patterns, compiled once
+# at import instead of on every file
+_RE_PAREN_YEAR = re.compile(r'\((\d{4})\)')
+_RE_COVER_STEM = re.compile(r'^(.+?)\s*\(\d{4}\)\s*-\s*cover')
+_RE_WS = re.compile(r'\s+')
+_RE_DATE_FIELD = re.compile(r'\{date:([^}]+)\}')
+_RE_TRACK_FIELD = re.compile(r'\{track:(\d+)d\}')
+_RE_UNFILLED_FIELD = re.compile(r'\{[^}]+\}')
+_RE_EMPTY_PARENS = re.compile(r'\(\s*\)')
+# Characters not allowed in file names (colons are turned into dashes first)
+_UNSAFE_CHARS = str.maketrans(dict.fromkeys('<>"/\\|?*', '_'))
+
+
+def _first(value, default=''):
+    """First entry of a tag value, or default when the tag is missing or empty."""
+    return value[0] if value else default
+
 
 class TaskSystem:
     """Handles post-tagging tasks like move, copy, and rename."""
@@ -201,7 +219,6 @@ class TaskSystem:
             # 3. ./tasks.yaml (legacy name for backwards compatibility)
             
             # Use AUDTAG_CONFIG_HOME if set (for sudo usage)
-            import os
             config_home = os.environ.get('AUDTAG_CONFIG_HOME', str(Path.home()))
             home_config = Path(config_home) / "audtag.yaml"
             local_config = Path.cwd() / "audtag.yaml"
@@ -246,8 +263,7 @@ class TaskSystem:
         }
         
         # Try to extract year from filename if it's in format (YYYY)
-        import re
-        year_match = re.search(r'\((\d{4})\)', file_path.stem)
+        year_match = _RE_PAREN_YEAR.search(file_path.stem)
         if year_match:
             metadata['year'] = year_match.group(1)
         
@@ -263,7 +279,7 @@ class TaskSystem:
             
             # Also try to extract from the cover filename if it follows a pattern
             # e.g., "Book Title (2020) - cover.jpg"
-            cover_match = re.match(r'^(.+?)\s*\(\d{4}\)\s*-\s*cover', file_path.stem)
+            cover_match = _RE_COVER_STEM.match(file_path.stem)
             if cover_match and not metadata.get('album'):
                 metadata['album'] = cover_match.group(1).strip()
         
@@ -272,14 +288,13 @@ class TaskSystem:
             if audio and audio.tags:
                 # Extract common tags based on file format
                 if file_path.suffix.lower() == '.mp3':
-                    from mutagen.id3 import ID3
                     tags = audio.tags
-                    metadata['title'] = str(tags.get('TIT2', [''])[0]) if tags.get('TIT2') else ''
-                    metadata['artist'] = str(tags.get('TPE1', [''])[0]) if tags.get('TPE1') else ''
-                    metadata['album'] = str(tags.get('TALB', [''])[0]) if tags.get('TALB') else ''
-                    metadata['composer'] = str(tags.get('TCOM', [''])[0]) if tags.get('TCOM') else ''
-                    metadata['genre'] = str(tags.get('TCON', [''])[0]) if tags.get('TCON') else ''
-                    year_from_tag = str(tags.get('TDRC', [''])[0]) if tags.get('TDRC') else ''
+                    metadata['title'] = str(_first(tags.get('TIT2')))
+                    metadata['artist'] = str(_first(tags.get('TPE1')))
+                    metadata['album'] = str(_first(tags.get('TALB')))
+                    metadata['composer'] = str(_first(tags.get('TCOM')))
+                    metadata['genre'] = str(_first(tags.get('TCON')))
+                    year_from_tag = str(_first(tags.get('TDRC')))
                     if year_from_tag:  # Only override if tag has year
                         metadata['year'] = year_from_tag
                     # Extract track number
@@ -291,27 +306,27 @@ class TaskSystem:
                         metadata['track'] = 0
                         
                 elif file_path.suffix.lower() in ['.m4b', '.m4a', '.aac']:
-                    metadata['title'] = audio.tags.get('\xa9nam', [''])[0] or ''
-                    metadata['artist'] = audio.tags.get('\xa9ART', [''])[0] or ''
-                    metadata['album'] = audio.tags.get('\xa9alb', [''])[0] or ''
-                    metadata['composer'] = audio.tags.get('\xa9wrt', [''])[0] or ''
-                    metadata['genre'] = audio.tags.get('\xa9gen', [''])[0] or ''
-                    year_from_tag = audio.tags.get('\xa9day', [''])[0] or ''
+                    metadata['title'] = _first(audio.tags.get('\xa9nam')) or ''
+                    metadata['artist'] = _first(audio.tags.get('\xa9ART')) or ''
+                    metadata['album'] = _first(audio.tags.get('\xa9alb')) or ''
+                    metadata['composer'] = _first(audio.tags.get('\xa9wrt')) or ''
+                    metadata['genre'] = _first(audio.tags.get('\xa9gen')) or ''
+                    year_from_tag = _first(audio.tags.get('\xa9day')) or ''
                     if year_from_tag:  # Only override if tag has year
                         metadata['year'] = year_from_tag
-                    track = audio.tags.get('trkn', [(0, 0)])[0]
+                    track = _first(audio.tags.get('trkn'), (0, 0))
                     metadata['track'] = track[0] if isinstance(track, tuple) else track
                     
                 elif file_path.suffix.lower() in ['.ogg', '.oga', '.opus', '.flac']:
-                    metadata['title'] = audio.tags.get('title', [''])[0] or ''
-                    metadata['artist'] = audio.tags.get('artist', [''])[0] or ''
-                    metadata['album'] = audio.tags.get('album', [''])[0] or ''
-                    metadata['composer'] = audio.tags.get('composer', [''])[0] or ''
-                    metadata['genre'] = audio.tags.get('genre', [''])[0] or ''
-                    year_from_tag = audio.tags.get('date', [''])[0] or ''
+                    metadata['title'] = _first(audio.tags.get('title')) or ''
+                    metadata['artist'] = _first(audio.tags.get('artist')) or ''
+                    metadata['album'] = _first(audio.tags.get('album')) or ''
+                    metadata['composer'] = _first(audio.tags.get('composer')) or ''
+                    metadata['genre'] = _first(audio.tags.get('genre')) or ''
+                    year_from_tag = _first(audio.tags.get('date')) or ''
                     if year_from_tag:  # Only override if tag has year
                         metadata['year'] = year_from_tag
-                    track = audio.tags.get('tracknumber', ['0'])[0]
+                    track = _first(audio.tags.get('tracknumber'), '0')
                     metadata['track'] = int(track.split('/')[0]) if '/' in str(track) else int(track) if str(track).isdigit() else 0
                     
         except Exception as e:
@@ -337,9 +352,9 @@ class TaskSystem:
                 # Replace colons with dashes for better readability
                 value = value.replace(':', ' -')
                 # Replace other problematic characters with underscores
-                value = re.sub(r'[<>"/\\|?*]', '_', value)
+                value = value.translate(_UNSAFE_CHARS)
                 # Clean up multiple spaces
-                value = re.sub(r'\s+', ' ', value)
+                value = _RE_WS.sub(' ', value)
                 # Remove leading/trailing spaces, dots, underscores, and dashes
                 value = value.strip('. _-')
                 metadata[key] = value
@@ -355,21 +370,18 @@ class TaskSystem:
         - {track:02d} - Formatted track number with zero padding
         - {date:%Y-%m-%d} - Date formatting
         """
-        import re
         result = pattern
         
         # Handle date formatting
         if '{date:' in result and 'date' in metadata:
-            date_pattern = re.compile(r'\{date:([^}]+)\}')
-            for match in date_pattern.finditer(pattern):
+            for match in _RE_DATE_FIELD.finditer(pattern):
                 date_format = match.group(1)
                 formatted_date = metadata['date'].strftime(date_format)
                 result = result.replace(match.group(0), formatted_date)
         
         # Handle track formatting
         if '{track:' in result and 'track' in metadata:
-            track_pattern = re.compile(r'\{track:(\d+)d\}')
-            for match in track_pattern.finditer(pattern):
+            for match in _RE_TRACK_FIELD.finditer(pattern):
                 padding = int(match.group(1))
                 formatted_track = str(metadata['track']).zfill(padding)
                 result = result.replace(match.group(0), formatted_track)
@@ -382,11 +394,11 @@ class TaskSystem:
         # Clean up any remaining unreplaced variables
         # This handles cases where metadata doesn't have a value for a variable
         # Replace {year} with empty string if year is not in metadata
-        result = re.sub(r'\{[^}]+\}', '', result)
+        result = _RE_UNFILLED_FIELD.sub('', result)
         
         # Clean up multiple spaces and parentheses with nothing inside
-        result = re.sub(r'\(\s*\)', '', result)  # Remove empty parentheses
-        result = re.sub(r'\s+', ' ', result)  # Collapse multiple spaces
+        result = _RE_EMPTY_PARENS.sub('', result)  # Remove empty parentheses
+        result = _RE_WS.sub(' ', result)  # Collapse multiple spaces
         result = result.strip()
         
         return result
@@ -405,11 +417,10 @@ class TaskSystem:
             # Update cover filename to match the album name
             if metadata.get('album'):
                 # Try to get year from: 1) original filename, 2) audio files in same dir, 3) metadata
-                import re
                 year = None
                 
                 # First try: original filename
-                year_match = re.search(r'\((\d{4})\)', file_path.stem)
+                year_match = _RE_PAREN_YEAR.search(file_path.stem)
                 if year_match:
                     year = year_match.group(1)
                 
@@ -419,7 +430,7 @@ class TaskSystem:
                     for audio_file in file_path.parent.iterdir():
                         if audio_file.suffix.lower() in audio_extensions:
                             # Check if audio filename has year
-                            audio_year_match = re.search(r'\((\d{4})\)', audio_file.stem)
+                            audio_year_match = _RE_PAREN_YEAR.search(audio_file.stem)
                             if audio_year_match:
                                 year = audio_year_match.group(1)
                                 break
@@ -481,7 +492,6 @@ class TaskSystem:
         dest_dir.mkdir(parents=True, exist_ok=True)
         # Set directory permissions to allow all users access (rwx for dirs)
         try:
-            import stat
             dest_dir.chmod(stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO)  # 0o777 for directories
         except:
             pass  # Don't fail if we can't set permissions
@@ -490,7 +500,6 @@ class TaskSystem:
             shutil.move(str(file_path), str(dest_path))
             # Set permissions to allow all users read/write access
             try:
-                import stat
                 # chmod a+rw (equivalent to 0o666 - read/write for all, no execute)
                 dest_path.chmod(stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IWGRP | stat.S_IROTH | stat.S_IWOTH)
             except Exception as perm_error:
@@ -521,11 +530,10 @@ class TaskSystem:
             # Update cover filename to match the album name
             if metadata.get('album'):
                 # Try to get year from: 1) original filename, 2) audio files in same dir, 3) metadata
-                import re
                 year = None
                 
                 # First try: original filename
-                year_match = re.search(r'\((\d{4})\)', file_path.stem)
+                year_match = _RE_PAREN_YEAR.search(file_path.stem)
                 if year_match:
                     year = year_match.group(1)
                 
@@ -535,7 +543,7 @@ class TaskSystem:
                     for audio_file in file_path.parent.iterdir():
                         if audio_file.suffix.lower() in audio_extensions:
                             # Check if audio filename has year
-                            audio_year_match = re.search(r'\((\d{4})\)', audio_file.stem)
+                            audio_year_match = _RE_PAREN_YEAR.search(audio_file.stem)
                             if audio_year_match:
                                 year = audio_year_match.group(1)
                                 break
@@ -585,7 +593,6 @@ class TaskSystem:
         dest_dir.mkdir(parents=True, exist_ok=True)
         # Set directory permissions to allow all users access (rwx for dirs)
         try:
-            import stat
             dest_dir.chmod(stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO)  # 0o777 for directories
         except:
             pass  # Don't fail if we can't set permissions
@@ -612,11 +619,10 @@ class TaskSystem:
             # Update cover filename to match the album name
             if metadata.get('album'):
                 # Try to get year from: 1) original filename, 2) audio files in same dir, 3) metadata
-                import re
                 year = None
                 
                 # First try: original filename
-                year_match = re.search(r'\((\d{4})\)', file_path.stem)
+                year_match = _RE_PAREN_YEAR.search(file_path.stem)
                 if year_match:
                     year = year_match.group(1)
                 
@@ -626,7 +632,7 @@ class TaskSystem:
                     for audio_file in file_path.parent.iterdir():
                         if audio_file.suffix.lower() in audio_extensions:
                             # Check if audio filename has year
-                            audio_year_match = re.search(r'\((\d{4})\)', audio_file.stem)
+                            audio_year_match = _RE_PAREN_YEAR.search(audio_file.stem)
                             if audio_year_match:
                                 year = audio_year_match.group(1)
                                 break
@@ -3,7 +3,7 @@
 # requires-python = ">=3.10"
 # dependencies = [
 #     "requests",
-#     "beautifulsoup4",
+#     "lxml",
 #     "mutagen",
 #     "rich",
 #     "click",
@@ -31,6 +31,61 @@ with patch('mutagen.File'):
     import audtag
 
 
+def make_response(body, status_code=200, headers=None):
+    """Build a fake requests.Response carrying an HTML body."""
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = body
+    response.text = body.decode('utf-8', errors='replace')
+    response.iter_content.side_effect = lambda chunk_size=1: (
+        body[i:i + chunk_size] for i in range(0, len(body), chunk_size)
+    )
+    return response
+
+
+SEARCH_PAGE = '''
+<html><body>
+<ul>
+    <li class="bc-list-item productListItem">
+        <h3 class="bc-heading"><a href="/pd/Test-Book/B000000001?ref=x">Test Book Title</a></h3>
+        <ul>
+            <li class="bc-list-item subtitle">A Subtitle</li>
+            <li class="bc-list-item authorLabel">By: <a href="/author/Test-Author">Test Author</a></li>
+            <li class="bc-list-item narratorLabel">Narrated by: <a href="/search?searchNarrator=N">Test Narrator</a></li>
+            <li class="bc-list-item runtimeLabel">Length: 11 hrs and 41 mins</li>
+            <li class="bc-list-item releaseDateLabel">Release date: 03-05-24</li>
+        </ul>
+    </li>
+</ul>
+</body></html>
+'''
+
+
+DETAIL_PAGE = '''
+<html><head>
+    <title>The Hobbit Audiobook | Audible.com</title>
+</head><body>
+    <img class="bc-pub-block bc-image-inset-border" src="https://m.media-amazon.com/images/I/cover._SL500_.jpg">
+    <input type="hidden" name="asin" value="B0099SQ8KC">
+    <h1 class="bc-heading">The Hobbit: Or There and Back Again</h1>
+    <ul>
+        <li class="bc-list-item authorLabel">By: <a>J.R.R. Tolkien</a></li>
+        <li class="bc-list-item narratorLabel">Narrated by: <a>Andy Serkis</a>, <a>Someone Else</a></li>
+        <li class="bc-list-item seriesLabel">Series: <a>Middle-earth</a>, Book 1</li>
+        <li class="bc-list-item categoriesLabel"><a>Science Fiction &amp; Fantasy</a> <a>Fantasy</a> <a>Epic</a></li>
+        <li class="bc-list-item ratingsLabel"><span class="bc-text bc-pub-offscreen">4.8 out of 5 stars</span></li>
+    </ul>
+    <div class="bc-container productPublisherSummary">
+        <span class="bc-text">Bilbo Baggins is a hobbit.</span>
+    </div>
+    <p class="bc-text bc-color-secondary">©1937 J.R.R. Tolkien (P)2020 HarperCollins Publishers</p>
+</body></html>
+'''
+
+
 class TestAudibleScraper(unittest.TestCase):
     """Test AudibleScraper functionality."""
     
@@ -80,6 +135,148 @@ class TestAudibleScraper(unittest.TestCase):
         self.assertEqual(results[0]['authors'], ['Test Author'])
         self.assertEqual(results[0]['narrators'], ['Test Narrator'])
     
+    @patch('requests.Session.get')
+    def test_search_parses_result_fields(self, mock_get):
+        """Test search extracts every column from a product row."""
+        mock_get.return_value = make_response(SEARCH_PAGE)
+
+        results = self.scraper.search("test")
+        self.assertEqual(len(results), 1)
+        result = results[0]
+        self.assertEqual(result['title'], 'Test Book Title')
+        self.assertEqual(result['url'], 'https://www.audible.com/pd/Test-Book/B000000001?ipRedirectOverride=true&overrideBaseCountry=true')
+        self.assertEqual(result['subtitle'], 'A Subtitle')
+        self.assertEqual(result['author'], 'Test Author')
+        self.assertEqual(result['narrator'], 'Test Narrator')
+        self.assertEqual(result['duration'], '11:41:00')
+        self.assertEqual(result['year'], '2024')
+
+    def test_parse_duration(self):
+        """Test runtime labels with missing hours or minutes."""
+        parse = audtag.AudibleScraper._parse_duration
+        self.assertEqual(parse("Length: 11 hrs and 41 mins"), "11:41:00")
+        self.assertEqual(parse("Length: 1 hr and 1 min"), "01:01:00")
+        self.assertEqual(parse("Length: 45 mins"), "00:45:00")
+        self.assertEqual(parse("Length: 2 hrs"), "02:00:00")
+        self.assertEqual(parse(""), "")
+
+    @patch('requests.Session.get')
+    def test_search_skips_results_without_title(self, mock_get):
+        """Test columns stay aligned when a product has no title link."""
+        page = SEARCH_PAGE.replace('<ul>\n    <li', '''<ul>
+    <li class="bc-list-item productListItem">
+        <ul><li class="bc-list-item authorLabel">By: <a>Orphan Author</a></li></ul>
+    </li>
+    <li class="bc-list-item productListItem">
+        <a class="bc-link" href="/pd/Second/B000000002">Second Book</a>
+    </li>
+    <li''', 1)
+        mock_get.return_value = make_response(page)
+
+        results = self.scraper.search("test")
+
+        self.assertEqual([r['title'] for r in results], ['Second Book', 'Test Book Title'])
+        self.assertEqual([r['author'] for r in results], ['Unknown', 'Test Author'])
+        self.assertEqual(results[0]['duration'], '')
+        self.assertEqual(results[1]['year'], '2024')
+
+    @patch('requests.Session.get')
+    def test_search_keeps_charset_when_skipping_head(self, mock_get):
+        """Test non-ASCII results decode correctly once the head is cut off."""
+        page = SEARCH_PAGE.replace(
+            '<html><body>',
+            '<html><head><meta charset="utf-8"><script>var x = "<b>";</script></head><body><nav><ul><li>Menu</li></ul></nav>',
+        ).replace('Test Author', 'Anaïs Nin')
+        mock_get.return_value = make_response(page)
+
+        results = self.scraper.search("test")
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['author'], 'Anaïs Nin')
+        self.assertEqual(results[0]['title'], 'Test Book Title')
+
+    @patch('requests.Session.get')
+    def test_search_detects_block_page(self, mock_get):
+        """Test the soft-503 page raises AudibleBlockedError."""
+        mock_get.return_value = make_response('<html><img src="crackedegg.jpg"></html>')
+
+        with self.assertRaises(audtag.AudibleBlockedError):
+            self.scraper.search("test")
+
+    @patch('requests.Session.get')
+    def test_page_body_is_capped(self, mock_get):
+        """Test oversized pages are truncated at MAX_PAGE_BYTES."""
+        mock_get.return_value = make_response(b'x' * 1000)
+
+        with patch.object(audtag.AudibleScraper, 'MAX_PAGE_BYTES', 100):
+            body = self.scraper._get("https://www.audible.com/pd/test")
+
+        self.assertEqual(body, b'x' * 100)
+        mock_get.return_value.close.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_prefetched_details_are_reused(self, mock_get):
+        """Test a prefetched detail page is not downloaded twice."""
+        mock_get.return_value = make_response('<html><body><h1>Prefetched Title</h1></body></html>')
+        url = "https://www.audible.com/pd/test"
+
+        self.scraper.prefetch_details([url])
+        details = self.scraper.get_book_details(url)
+
+        self.assertEqual(details['title'], 'Prefetched Title')
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch('requests.Session.get')
+    def test_pages_cached_on_disk(self, mock_get):
+        """Test a cached page is served without a request, and block pages aren't cached."""
+        url = "https://www.audible.com/pd/test"
+        with tempfile.TemporaryDirectory() as cache_dir:
+            mock_get.return_value = make_response('<html><img src="crackedegg.jpg"></html>')
+            with self.assertRaises(audtag.AudibleBlockedError):
+                audtag.AudibleScraper(cache_dir=cache_dir)._get(url)
+            
+            mock_get.return_value = make_response(b'<html>page</html>')
+            self.assertEqual(audtag.AudibleScraper(cache_dir=cache_dir)._get(url), b'<html>page</html>')
+            self.assertEqual(audtag.AudibleScraper(cache_dir=cache_dir)._get(url), b'<html>page</html>')
+        
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('requests.Session.get')
+    def test_get_book_details_batch_keeps_order(self, mock_get):
+        """Test batch detail fetches return one result per URL, in order."""
+        pages = {
+            "https://www.audible.com/pd/one": '<html><body><h1>One</h1></body></html>',
+            "https://www.audible.com/pd/two": '<html><body><h1>Two</h1></body></html>',
+        }
+        mock_get.side_effect = lambda url, **kwargs: make_response(pages[url])
+
+        details = self.scraper.get_book_details_batch(list(pages))
+
+        self.assertEqual([d['title'] for d in details], ['One', 'Two'])
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('requests.Session.get')
+    def test_get_book_details_fields(self, mock_get):
+        """Test every field is extracted from a full detail page."""
+        mock_get.return_value = make_response(DETAIL_PAGE)
+
+        details = self.scraper.get_book_details("https://www.audible.com/pd/test")
+
+        self.assertEqual(details['cover_url'], "https://m.media-amazon.com/images/I/cover._SL5000_.jpg")
+        self.assertEqual(details['asin'], 'B0099SQ8KC')
+        self.assertEqual(details['title'], 'The Hobbit')
+        self.assertEqual(details['subtitle'], 'Or There and Back Again')
+        self.assertEqual(details['author'], 'J.R.R. Tolkien')
+        self.assertEqual(details['narrator'], 'Andy Serkis')
+        self.assertEqual(details['series'], 'Middle-earth')
+        self.assertEqual(details['series_part'], '1')
+        self.assertEqual(details['genre'], 'Science Fiction & Fantasy/Fantasy')
+        self.assertEqual(details['description'], 'Bilbo Baggins is a hobbit.')
+        self.assertEqual(details['year'], '1937')
+        self.assertEqual(details['release_year'], '2020')
+        self.assertEqual(details['publisher'], 'HarperCollins Publishers')
+        self.assertEqual(details['rating'], '4.8')
+
     @patch('requests.Session.get')
     def test_get_book_details(self, mock_get):
         """Test fetching book details."""
@@ -129,6 +326,27 @@ class TestAudiobookTagger(unittest.TestCase):
         self.assertEqual(tagger.files, [self.test_file])
         self.assertIn('.mp3', tagger.formats)
     
+    def test_files_in_natural_order(self):
+        """Test track numbers sort numerically, not lexicographically."""
+        names = ["Track 10.mp3", "Track 2.MP3", "Track 1.mp3"]
+        files = [Path(self.test_dir) / name for name in names]
+        
+        tagger = audtag.AudiobookTagger(files)
+        
+        self.assertEqual([f.name for f in tagger.files], ["Track 1.mp3", "Track 2.MP3", "Track 10.mp3"])
+        self.assertEqual(tagger.exts, ['.mp3', '.mp3', '.mp3'])
+        self.assertEqual(audtag.AudiobookTagger(files, assume_sorted=True).files, files)
+    
+    def test_meaningful_title(self):
+        """Test placeholder track titles are told apart from real chapter names."""
+        tagger = audtag.AudiobookTagger([self.test_file])
+        
+        for title in ("Track 01", "12", "pt001", "Untitled 3", "Audiobook", "chapter", "intro"):
+            self.assertFalse(tagger._is_meaningful_title(title), title)
+        for title in ("1984", "Chapter 1", "Prologue", "introduction", "The Long Night"):
+            self.assertTrue(tagger._is_meaningful_title(title), title)
+        self.assertFalse(tagger._is_meaningful_title("book", "book-pt02.mp3"))
+    
     @patch('mutagen.File')
     def test_apply_metadata(self, mock_file):
         """Test applying metadata to files."""
@@ -151,6 +369,219 @@ class TestAudiobookTagger(unittest.TestCase):
         mock_audio.save.assert_called()
 
 
+def write_silent_mp3(path, frames=20):
+    """Write a minimal MPEG-1 Layer III stream that mutagen can open."""
+    frame = bytes([0xFF, 0xFB, 0x90, 0x64]) + b'\x00' * 413
+    path.write_bytes(frame * frames)
+
+
+class TestTagWriting(unittest.TestCase):
+    """Test tags written to real files."""
+
+    METADATA = {
+        'title': 'The Way of Kings',
+        'subtitle': 'Book One',
+        'author': 'Brandon Sanderson',
+        'narrator': 'Michael Kramer',
+        'year': '2010',
+        'series': 'The Stormlight Archive',
+        'series_part': '1',
+    }
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def tag(self, files):
+        results = []
+        tagger = audtag.AudiobookTagger(files)
+        tagger.update_tags(self.METADATA, max_workers=2,
+                           progress_callback=lambda f, ok, err: results.append((f, ok, err)))
+        return results
+
+    def test_mp3_tags_replaced(self):
+        """Test MP3 tagging replaces old frames and keeps the audio intact."""
+        from mutagen.id3 import TIT2, TXXX
+        mp3 = self.test_dir / "book.mp3"
+        write_silent_mp3(mp3)
+        audio = audtag.MP3(mp3)
+        audio.add_tags()
+        audio.tags.add(TIT2(encoding=3, text='Track 01'))
+        audio.tags.add(TXXX(encoding=3, desc='STALE', text='old'))
+        audio.save()
+
+        results = self.tag([mp3])
+
+        self.assertEqual(results, [(mp3, True, None)])
+        audio = audtag.MP3(mp3)
+        self.assertEqual(str(audio.tags['TIT2']), 'The Way of Kings: Book One')
+        self.assertEqual(str(audio.tags['TALB']), 'The Way of Kings')
+        self.assertEqual(str(audio.tags['TCOM']), 'Michael Kramer')
+        self.assertEqual(str(audio.tags['TXXX:SERIES']), 'The Stormlight Archive')
+        self.assertNotIn('TXXX:STALE', audio.tags)
+        self.assertGreater(audio.info.length, 0)
+
+    def test_retag_replaces_existing_tag(self):
+        """Test a second tagging pass replaces the tag in its padding."""
+        mp3 = self.test_dir / "book.mp3"
+        write_silent_mp3(mp3)
+        self.tag([mp3])
+        size = mp3.stat().st_size
+
+        self.tag([mp3])
+
+        self.assertEqual(mp3.stat().st_size, size)
+        self.assertGreaterEqual(audtag.ID3(mp3)._padding, audtag._MIN_TAG_PADDING)
+
+    def test_unchanged_retag_skips_write(self):
+        """Test retagging with identical metadata and cover leaves the file alone."""
+        (self.test_dir / "cover.jpg").write_bytes(b'\xff\xd8\xff\xe0' + b'\x00' * 64)
+        mp3 = self.test_dir / "book.mp3"
+        write_silent_mp3(mp3)
+        self.tag([mp3])
+        os.utime(mp3, (1_000_000_000, 1_000_000_000))
+
+        results = self.tag([mp3])
+
+        self.assertEqual(results, [(mp3, True, None)])
+        self.assertEqual(mp3.stat().st_mtime, 1_000_000_000)
+        
+        self.METADATA = dict(self.METADATA, narrator='Kate Reading')
+        self.tag([mp3])
+
+        self.assertEqual(str(audtag.MP3(mp3).tags['TCOM']), 'Kate Reading')
+
+    def test_generic_retag_skips_unchanged_write(self):
+        """Test the generic writer leaves a file alone when its tags already match."""
+        class FakeAudio:
+            def __init__(self, tags):
+                self.tags = tags
+                self.saves = 0
+            def clear(self):
+                self.tags.clear()
+            def save(self, fileobj=None):
+                self.saves += 1
+        wma = self.test_dir / "book.wma"
+        tagger = audtag.AudiobookTagger([wma])
+        stale = FakeAudio({'title': ['Track 01']})
+        with patch.object(audtag, 'File', return_value=stale):
+            tagger._update_generic(wma, self.METADATA, 'Brandon Sanderson', 1)
+        
+        # Reloaded from disk, every value comes back as a list
+        current = FakeAudio({key: [value] for key, value in stale.tags.items()})
+        with patch.object(audtag, 'File', return_value=current):
+            tagger._update_generic(wma, self.METADATA, 'Brandon Sanderson', 1)
+        
+        self.assertEqual(stale.saves, 1)
+        self.assertEqual(current.saves, 0)
+
+    def test_current_basic_tags_refreshed_after_write(self):
+        """Test cached current tags are re-read once the file has been tagged."""
+        import mutagen
+        mp3 = self.test_dir / "book.mp3"
+        write_silent_mp3(mp3)
+
+        with patch.object(audtag, 'File', mutagen.File):
+            self.assertEqual(audtag._current_basic_tags(mp3)['title'], '')
+            self.tag([mp3])
+            current = audtag._current_basic_tags(mp3)
+
+        self.assertEqual(current['title'], 'The Way of Kings: Book One')
+        self.assertEqual(current['composer'], 'Michael Kramer')
+        self.assertEqual(current['year'], '2010')
+
+    def test_extract_metadata_reads_written_tags(self):
+        """Test the info fields come back from a tagged MP3."""
+        import mutagen
+        files = [self.test_dir / f"{i:02d}.mp3" for i in (1, 2)]
+        for mp3 in files:
+            write_silent_mp3(mp3)
+        self.tag(files)
+
+        with patch.object(audtag, 'File', mutagen.File):
+            metadata = audtag._extract_metadata(files[1])
+
+        self.assertEqual(metadata['Album'], 'The Way of Kings')
+        self.assertEqual(metadata['Composer (Narrator)'], 'Michael Kramer')
+        self.assertEqual(metadata['Track'], '2/2')
+        self.assertEqual(metadata['SERIES'], 'The Stormlight Archive')
+        self.assertEqual(metadata['ITUNESMEDIATYPE'], 'Audiobook')
+        self.assertNotIn('ASIN', metadata)
+
+    def test_cover_loaded_once_and_embedded(self):
+        """Test the folder cover is read once and embedded in every file."""
+        cover = b'\xff\xd8\xff\xe0' + b'\x00' * 64
+        (self.test_dir / "cover.jpg").write_bytes(cover)
+        files = [self.test_dir / f"{i:02d}.mp3" for i in range(1, 4)]
+        for mp3 in files:
+            write_silent_mp3(mp3)
+
+        with patch.object(audtag.AudiobookTagger, '_get_cover_data',
+                          autospec=True, side_effect=audtag.AudiobookTagger._get_cover_data) as load:
+            results = self.tag(files)
+
+        self.assertEqual(load.call_count, 1)
+        self.assertTrue(all(ok for _, ok, _ in results))
+        for mp3 in files:
+            self.assertEqual(audtag.MP3(mp3).tags['APIC:Cover'].data, cover)
+
+
+class TestSearchQuery(unittest.TestCase):
+    """Test initial search query construction from filenames."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.incoming = Path(self.test_dir) / "incoming"
+        self.incoming.mkdir()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def query_for(self, filename):
+        test_file = self.incoming / filename
+        test_file.write_text("")
+        with patch.object(audtag, 'File', return_value=None):
+            return audtag.AudiobookTagger([test_file]).get_initial_search_query()
+
+    def test_author_dash_title(self):
+        """Test "Author - Title" filenames."""
+        self.assertEqual(self.query_for("Brandon Sanderson - The Way of Kings.mp3"),
+                         "Brandon Sanderson The Way of Kings")
+
+    def test_title_by_author(self):
+        """Test "Title by Author" filenames put the author first."""
+        self.assertEqual(self.query_for("The Hobbit By J R R Tolkien.m4b"),
+                         "J R R Tolkien The Hobbit")
+
+    def test_tags_from_first_usable_file(self):
+        """Test the query comes from the first file, in order, with usable tags."""
+        from mutagen.id3 import ID3, TALB, TPE2
+        files = []
+        for i in range(10):
+            test_file = self.incoming / f"part{i:02d}.mp3"
+            test_file.write_text("")
+            files.append(test_file)
+        tags = ID3()
+        tags.add(TALB(encoding=3, text='The Hobbit (Unabridged)'))
+        tags.add(TPE2(encoding=3, text='J.R.R. Tolkien'))
+        tags.save(files[3])
+        tags = ID3()
+        tags.add(TALB(encoding=3, text='Wrong Book'))
+        tags.save(files[9])
+
+        query = audtag.AudiobookTagger(files).get_initial_search_query()
+
+        self.assertEqual(query, "J.R.R. Tolkien The Hobbit")
+
+    def test_separators_and_suffixes_removed(self):
+        """Test underscores, dots and audiobook suffixes are cleaned up."""
+        self.assertEqual(self.query_for("01_The_Hobbit.(Unabridged).mp3"), "The Hobbit")
+        self.assertEqual(self.query_for("The.Hobbit  Audiobook.mp3"), "The Hobbit")
+        self.assertEqual(self.query_for("The_Hobbit Audiobook (Unabridged).mp3"), "The Hobbit")
+
+
 class TestFileGrouping(unittest.TestCase):
     """Test file grouping functionality."""
     
@@ -202,6 +633,41 @@ class TestFileGrouping(unittest.TestCase):
         for group in groups:
             self.assertEqual(len(group['files']), 2)
     
+    def test_collect_audio_files_matches_suffix_case_insensitively(self):
+        """Test the directory walk finds each audio file once, whatever its suffix case."""
+        nested = Path(self.test_dir) / "Book" / "CD1"
+        nested.mkdir(parents=True)
+        for name in ("01.mp3", "02.MP3", "03.Mp3"):
+            (nested / name).write_bytes(b"")
+        (nested / "cover.jpg").write_bytes(b"")
+        
+        found = audtag._collect_audio_files(Path(self.test_dir))
+        
+        self.assertEqual(sorted(p.name for p in found), ["01.mp3", "02.MP3", "03.Mp3"])
+    
+    def test_collect_audio_files_lists_each_directory_in_name_order(self):
+        """Test the walk returns files grouped by directory, sorted by name."""
+        root = Path(self.test_dir)
+        for rel in ("b/02.mp3", "a/02.mp3", "b/01.mp3", "a/01.mp3", "00.mp3"):
+            (root / rel).parent.mkdir(exist_ok=True)
+            (root / rel).write_bytes(b"")
+        
+        found = audtag._collect_audio_files(root)
+        
+        self.assertEqual([p.relative_to(root).as_posix() for p in found],
+                         ["00.mp3", "a/01.mp3", "a/02.mp3", "b/01.mp3", "b/02.mp3"])
+    
+    def test_scan_files_without_recursion_skips_subdirectories(self):
+        """Test a non-recursive scan lists only the directory's own files."""
+        root = Path(self.test_dir)
+        for rel in ("b.MP3", "a.m4b", "notes.txt", "sub/01.mp3"):
+            (root / rel).parent.mkdir(exist_ok=True)
+            (root / rel).write_bytes(b"")
+        
+        found = audtag._scan_files(root, audtag.AudiobookTagger.SUPPORTED_FORMATS, recursive=False)
+        
+        self.assertEqual([p.name for p in found], ["a.m4b", "b.MP3"])
+    
     @patch('mutagen.File')
     def test_group_files_same_directory(self, mock_file):
         """Test grouping files in same directory."""
@@ -233,12 +699,9 @@ class TestCoverDownload(unittest.TestCase):
     def test_download_success(self, mock_get):
         """Test successful cover download."""
         # Create fake image data (>1000 bytes)
-        fake_image = b'FAKE_IMAGE_DATA' * 100
+        fake_image = b'\xff\xd8\xff\xe0' + b'FAKE_IMAGE_DATA' * 100
         
-        mock_response = Mock()
-        mock_response.content = fake_image
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(fake_image)
         
         save_path = Path(self.test_dir) / "cover.jpg"
         result = audtag.download_and_save_cover("http://example.com/image.jpg", save_path)
@@ -253,10 +716,18 @@ class TestCoverDownload(unittest.TestCase):
         # Create small data (<1000 bytes)
         small_data = b'SMALL'
         
-        mock_response = Mock()
-        mock_response.content = small_data
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(small_data)
+        
+        save_path = Path(self.test_dir) / "cover.jpg"
+        result = audtag.download_and_save_cover("http://example.com/image.jpg", save_path)
+        
+        self.assertFalse(result)
+        self.assertFalse(save_path.exists())
+    
+    @patch('requests.get')
+    def test_download_non_image_rejected(self, mock_get):
+        """Test that an HTML error page is not saved as a cover."""
+        mock_get.return_value = make_response(b'<html>' + b'x' * 2000 + b'</html>')
         
         save_path = Path(self.test_dir) / "cover.jpg"
         result = audtag.download_and_save_cover("http://example.com/image.jpg", save_path)
@@ -264,6 +735,65 @@ class TestCoverDownload(unittest.TestCase):
         self.assertFalse(result)
         self.assertFalse(save_path.exists())
     
+    @patch('requests.get')
+    def test_download_oversized_falls_back(self, mock_get):
+        """Test that an oversized cover falls back to the next resolution."""
+        small = b'\xff\xd8\xff\xe0' + b'\x00' * 5000
+        large = b'\xff\xd8\xff\xe0' + b'\x00' * 50000
+        mock_get.side_effect = lambda url, **kwargs: make_response(large if '_SL5000_' in url else small)
+        
+        save_path = Path(self.test_dir) / "cover.jpg"
+        with patch.object(audtag, '_MAX_COVER_BYTES', 10000):
+            result = audtag.download_and_save_cover("http://example.com/image._SL500_.jpg", save_path)
+        
+        self.assertTrue(result)
+        self.assertEqual(save_path.read_bytes(), small)
+        self.assertEqual(mock_get.call_count, 2)
+    
+    @patch('requests.get')
+    def test_download_oversized_skipped_by_content_length(self, mock_get):
+        """Test an announced oversized cover is abandoned before its body is read."""
+        small = b'\xff\xd8\xff\xe0' + b'\x00' * 5000
+        large = make_response(b'', headers={'Content-Length': '50000'})
+        mock_get.side_effect = lambda url, **kwargs: large if '_SL5000_' in url else make_response(small)
+        
+        save_path = Path(self.test_dir) / "cover.jpg"
+        with patch.object(audtag, '_MAX_COVER_BYTES', 10000):
+            result = audtag.download_and_save_cover("http://example.com/image._SL500_.jpg", save_path)
+        
+        self.assertTrue(result)
+        self.assertEqual(save_path.read_bytes(), small)
+        large.iter_content.assert_not_called()
+        large.close.assert_called_once()
+    
+    @patch('requests.get')
+    def test_download_placeholder_skipped_by_content_length(self, mock_get):
+        """Test an announced placeholder is skipped before its body is read."""
+        cover = b'\xff\xd8\xff\xe0' + b'\x00' * 5000
+        placeholder = make_response(b'', headers={'Content-Length': '43'})
+        mock_get.side_effect = lambda url, **kwargs: placeholder if '_SL5000_' in url else make_response(cover)
+        
+        save_path = Path(self.test_dir) / "cover.jpg"
+        result = audtag.download_and_save_cover("http://example.com/image._SL500_.jpg", save_path)
+        
+        self.assertTrue(result)
+        self.assertEqual(save_path.read_bytes(), cover)
+        placeholder.iter_content.assert_not_called()
+        placeholder.close.assert_called_once()
+    
+    def test_download_uses_given_session(self):
+        """Test downloads go through a shared session when one is passed."""
+        session = Mock()
+        session.get.return_value = make_response(b'\xff\xd8\xff\xe0' + b'\x00' * 2000)
+        
+        save_path = Path(self.test_dir) / "cover.jpg"
+        with patch('requests.get') as mock_get:
+            result = audtag.download_and_save_cover("http://example.com/image.jpg", save_path, session)
+        
+        self.assertTrue(result)
+        session.get.assert_called_once()
+        mock_get.assert_not_called()
+    
     @patch('requests.get')
     def test_download_network_error(self, mock_get):
         """Test handling network errors gracefully."""
@@ -287,20 +817,54 @@ class TestUtilityFunctions(unittest.TestCase):
         self.assertGreater(workers, 0)
         self.assertLessEqual(workers, 16)
     
+    @patch('os.process_cpu_count', None, create=True)
     @patch('os.cpu_count')
     def test_get_optimal_workers_different_cpus(self, mock_cpu):
         """Test optimal workers with different CPU counts."""
+        # The result is cached, so clear it around each simulated count
+        audtag.get_optimal_workers.cache_clear()
+        self.addCleanup(audtag.get_optimal_workers.cache_clear)
+        
         # Test with 4 CPUs
         mock_cpu.return_value = 4
         self.assertEqual(audtag.get_optimal_workers(), 8)
         
         # Test with 16 CPUs (should cap at 16)
+        audtag.get_optimal_workers.cache_clear()
         mock_cpu.return_value = 16
         self.assertEqual(audtag.get_optimal_workers(), 16)
         
         # Test with None (fallback)
+        audtag.get_optimal_workers.cache_clear()
         mock_cpu.return_value = None
         self.assertEqual(audtag.get_optimal_workers(), 4)
+    
+    def test_get_optimal_workers_is_cached(self):
+        """Test the worker count is computed once."""
+        audtag.get_optimal_workers.cache_clear()
+        self.addCleanup(audtag.get_optimal_workers.cache_clear)
+        
+        with patch('os.process_cpu_count', None, create=True), \
+                patch('os.cpu_count', return_value=2) as mock_cpu:
+            audtag.get_optimal_workers()
+            audtag.get_optimal_workers()
+        
+        mock_cpu.assert_called_once()
+    
+    def test_render_example(self):
+        """Test task pattern examples fill known variables and keep unknown ones."""
+        self.assertEqual(audtag._render_example('{track:02d} - {title}.{ext}'),
+                         '01 - Chapter 1 - Stormblessed.m4b')
+        self.assertEqual(audtag._render_example('{artist}/{genre}/{date:%Y}'),
+                         'Brandon Sanderson/{genre}/{date:%Y}')
+        self.assertEqual(audtag._render_example('{album'), '{album')
+
+    def test_prefetch_tag_regions_skips_unreadable_files(self):
+        """Test the prefetch hint tolerates missing files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            existing = Path(temp_dir) / 'a.mp3'
+            existing.write_bytes(b'\x00' * 16)
+            audtag._prefetch_tag_regions([Path(temp_dir) / 'missing.mp3', existing])
 
 
 if __name__ == '__main__':
@@ -3,7 +3,7 @@
 # requires-python = ">=3.10"
 # dependencies = [
 #     "requests",
-#     "beautifulsoup4",
+#     "lxml",
 #     "mutagen",
 #     "rich",
 #     "click",
@@ -22,6 +22,7 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock, Mock
 from click.testing import CliRunner
 import sys
+import os
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
@@ -65,6 +66,34 @@ class TestCLICommands(unittest.TestCase):
         result = self.runner.invoke(audtag.cli, ['info', str(test_file)])
         self.assertEqual(result.exit_code, 0)
     
+    def test_task_commands_built_on_demand(self):
+        """Test task commands come from the config only when a task is invoked."""
+        tasks = {'rename': {'name': 'rename', 'naming_pattern': '{track:02d} - {title}.{ext}'}}
+        with patch.object(audtag, '_task_configs', return_value=tasks) as configs:
+            result = self.runner.invoke(audtag.cli, ['info', '--help'])
+            self.assertEqual(result.exit_code, 0)
+            configs.assert_not_called()
+            
+            result = self.runner.invoke(audtag.cli, ['rename', '--help'])
+        
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn('Would rename to: 01 - Chapter 1 - Stormblessed.m4b', result.output)
+    
+    def test_info_reads_hardlinks_once(self):
+        """Test info parses a hardlinked file once and reports it for every path."""
+        original = Path(self.test_dir) / "01.mp3"
+        original.write_text("")
+        link = Path(self.test_dir) / "02.mp3"
+        os.link(original, link)
+        
+        with patch.object(audtag, '_extract_metadata', return_value=None) as extract:
+            result = self.runner.invoke(audtag.cli, ['info', self.test_dir])
+        
+        self.assertEqual(result.exit_code, 0)
+        extract.assert_called_once_with(original)
+        self.assertIn("01.mp3", result.output)
+        self.assertIn("02.mp3", result.output)
+    
     @patch('mutagen.File')
     @patch.object(audtag.AudibleScraper, 'search')
     @patch('inquirer.prompt')